@@ -1,4 +1,8 @@
 import sys
+import errno
+import atexit
+import json
+import threading
 import subprocess
 import xml.etree.ElementTree as ET
 import os
@@ -6,12 +10,29 @@ import yaml
 from tabulate import tabulate
 import argparse
 import shutil # For file copying
+import tempfile
 import zipfile # For creating dummy zips
 import csv # For CSV output
 from pathlib import Path
 import re
 import urllib.request
 import ssl
+import pickle
+import gzip
+import hashlib
+import time
+import fnmatch
+from bisect import bisect_left
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from zlib import error as zlib_error
+from xml.sax.saxutils import quoteattr
+
+try:
+    from lxml import etree as lxml_etree  # Optional: much faster XML parsing when installed
+except ImportError:
+    lxml_etree = None
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR.parent / "data"
@@ -19,10 +40,130 @@ DATA_DIR = BASE_DIR.parent / "data"
 # === Global Debug Flag ===
 DEBUG_MODE_ENABLED = False 
 
-def debug_print(message):
-    """Prints debug messages only if DEBUG_MODE_ENABLED is True."""
+def debug_print(message, *args):
+    """
+    Prints debug messages only if DEBUG_MODE_ENABLED is True. Pass values as %-style `args` rather than
+    formatting them into `message` in hot paths, so nothing is formatted while debug output is off.
+    """
     if DEBUG_MODE_ENABLED:
-        print(f"[DEBUG] {message}")
+        log_message("debug", "[DEBUG] " + message, *args)
+
+# === Console Output & Logging ===
+# Messages keep their "[LEVEL]" prefixes on the console. 'item' messages are the per-title lines of long loops
+# (one per ROM copied or system searched): they are buffered and written in batches, hidden by --quiet and
+# replaced by a single updating counter with --progress. With --log-file every message is also appended to
+# that file as one JSON object per line, whatever is shown on the console. 'summary' messages (end-of-run
+# tables) rank with warnings, so --quiet still shows them.
+LOG_LEVELS = {"debug": 10, "item": 15, "info": 20, "summary": 30, "warning": 30, "error": 40}
+LOG_SETTINGS = {"console_level": LOG_LEVELS["item"], "progress": False, "log_file": None}
+LOG_BUFFER_LINES = 500
+_LOG_BUFFER = []
+_LOG_LOCK = threading.RLock()  # Copy and prefetch worker threads may log too
+_PROGRESS = {"label": None, "total": 0, "done": 0, "last_draw": 0.0, "width": 0}
+
+def configure_logging(quiet=False, progress=False, log_file=None):
+    """Applies the global --quiet, --progress and --log-file options."""
+    if quiet:
+        LOG_SETTINGS["console_level"] = LOG_LEVELS["warning"]
+    elif progress:
+        LOG_SETTINGS["console_level"] = LOG_LEVELS["info"]
+    else:
+        LOG_SETTINGS["console_level"] = LOG_LEVELS["item"]
+    LOG_SETTINGS["progress"] = progress
+    if log_file:
+        try:
+            LOG_SETTINGS["log_file"] = open(log_file, "a", encoding="utf-8")
+        except OSError as e:
+            log_message("warning", f"[WARNING] Cannot open log file '{log_file}': {e}. Continuing without it.")
+            return
+        atexit.register(close_log_file)
+
+def close_log_file():
+    log_flush()
+    if LOG_SETTINGS["log_file"] is not None:
+        LOG_SETTINGS["log_file"].close()
+        LOG_SETTINGS["log_file"] = None
+
+def log_enabled(level):
+    """Returns True if a message of `level` is shown or logged, so callers can skip building costly messages."""
+    if level == "debug":
+        return DEBUG_MODE_ENABLED
+    return LOG_LEVELS[level] >= LOG_SETTINGS["console_level"] or LOG_SETTINGS["log_file"] is not None
+
+def log_message(level, message, *args):
+    """
+    Writes `message` at `level` ('debug', 'item', 'info', 'summary', 'warning' or 'error'). %-style `args` are only
+    formatted in when the message is shown or logged. Any message other than an 'item' flushes the buffered
+    item lines first, so console output stays in order.
+    """
+    if not log_enabled(level):
+        return
+    if args:
+        message = message % args
+    with _LOG_LOCK:
+        log_file = LOG_SETTINGS["log_file"]
+        if log_file is not None:
+            log_file.write(json.dumps({"time": round(time.time(), 3), "level": level, "message": message.strip("\n")},
+                                      ensure_ascii=False) + "\n")
+        if level != "debug" and LOG_LEVELS[level] < LOG_SETTINGS["console_level"]:
+            return
+        if level == "item":
+            _LOG_BUFFER.append(message)
+            if len(_LOG_BUFFER) >= LOG_BUFFER_LINES:
+                log_flush()
+        else:
+            log_flush()
+            print(message)
+
+def log_flush():
+    """Writes out the buffered item lines (and clears the progress counter line before them)."""
+    with _LOG_LOCK:
+        _clear_progress_line()
+        if _LOG_BUFFER:
+            # Written to whatever sys.stdout is now, so the GUI's output capture still sees every line.
+            sys.stdout.write("\n".join(_LOG_BUFFER) + "\n")
+            del _LOG_BUFFER[:]
+        if LOG_SETTINGS["log_file"] is not None:
+            LOG_SETTINGS["log_file"].flush()
+
+def _clear_progress_line():
+    if _PROGRESS["width"]:
+        sys.stderr.write("\r" + " " * _PROGRESS["width"] + "\r")
+        _PROGRESS["width"] = 0
+
+def _draw_progress(final=False):
+    text = f"[PROGRESS] {_PROGRESS['label']}: {_PROGRESS['done']}/{_PROGRESS['total']}"
+    if final:
+        _clear_progress_line()
+        sys.stderr.write(text + "\n")
+    elif sys.stderr.isatty():
+        sys.stdout.flush()
+        sys.stderr.write("\r" + text)
+        sys.stderr.flush()
+        _PROGRESS["width"] = len(text)
+    _PROGRESS["last_draw"] = time.monotonic()
+
+def progress_start(label, total):
+    """Starts the --progress counter for `total` items. Does nothing unless --progress was given."""
+    if LOG_SETTINGS["progress"]:
+        _PROGRESS.update(label=label, total=total, done=0, last_draw=0.0)
+
+def progress_advance(count=1):
+    if _PROGRESS["label"] is None:
+        return
+    _PROGRESS["done"] += count
+    # Redrawn at most ten times a second, so a fast loop does not wait on the terminal.
+    if time.monotonic() - _PROGRESS["last_draw"] >= 0.1:
+        _draw_progress()
+
+def progress_finish():
+    """Flushes buffered output and prints the final --progress count."""
+    log_flush()
+    if _PROGRESS["label"] is not None:
+        _draw_progress(final=True)
+        _PROGRESS["label"] = None
+
+atexit.register(log_flush)
 
 # === Configuration Management ===
 CONFIG_FILE = BASE_DIR.parent / "config.yaml"
@@ -34,41 +175,218 @@ APP_CONFIG = {
     "mess_ini_path": "",
     "system_softlist_yaml_file": "system_softlist.yml",
     "mess_version": "",
-    "mess_xml_file": ""
+    "mess_xml_file": "",
+    "mame_hash_dir": ""
 }
 
+# === YAML I/O ===
+# All YAML is read and written through these helpers. They use libyaml's C loader/dumper when PyYAML was built
+# with it (several times faster on the big system-softlist file) and the pure-Python classes otherwise; both
+# produce the same data and byte-identical output.
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+def _yaml_load(stream):
+    """Parses YAML from a string or file object."""
+    return yaml.load(stream, Loader=YamlLoader)
+
+def _yaml_dump(data, stream=None, dumper=YamlDumper):
+    """Dumps data in the block style used for every YAML file the tool writes. Returns the text if no stream is given."""
+    return yaml.dump(data, stream, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
 def _load_yaml_file(file_path):
     if not os.path.exists(file_path):
         return {}
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = _yaml_load(f)
             return data if isinstance(data, dict) else {}
     except yaml.YAMLError as e:
-        print(f"[ERROR] Error loading YAML data from '{file_path}': {e}")
+        log_message("error", f"[ERROR] Error loading YAML data from '{file_path}': {e}")
+        return {}
+    except Exception as e:
+        log_message("error", f"[ERROR] Unexpected error loading YAML file '{file_path}': {e}")
         return {}
+
+# === Platform YAML Splicing ===
+# The system-softlist YAML is a block-style mapping of platform keys written by _yaml_dump. Single-platform updates
+# replace only that platform's lines instead of parsing and dumping the whole file. Files that are not plain
+# block mappings (flow style, anchors/aliases, several documents, comments inside a platform) fall back to a full
+# load and dump.
+_YAML_ANCHOR_OR_ALIAS_RE = re.compile(r"(?:^|[:-] )[&*]\S", re.MULTILINE)
+
+class _NoAliasYamlDumper(YamlDumper):
+    """Writes objects shared between entries (e.g. manifest defaults) out in full instead of as &id/*id pairs."""
+    def ignore_aliases(self, data):
+        return True
+
+def _dump_yaml_platform(platform_key, platform_entry):
+    """
+    Returns the YAML text of one top-level platform entry as _yaml_dump writes it inside the full file, except
+    that it never contains anchors: each platform is dumped on its own, so anchor names would repeat across blocks.
+    """
+    return _yaml_dump({platform_key: platform_entry}, dumper=_NoAliasYamlDumper)
+
+def _yaml_key_prefix(key):
+    """Returns how `key` starts its top-level line (e.g. 'nes:'), or None if it cannot be matched by prefix."""
+    prefix = _yaml_dump({key: 0})
+    if prefix.startswith("?") or not prefix.endswith(" 0\n"):
+        return None
+    return prefix[:-3]
+
+def _split_yaml_top_level_blocks(text):
+    """
+    Splits block-mapping YAML text into [first_line, lines] blocks, one per top-level key; blank and comment
+    lines at column 0 form blocks with first_line None. Returns None if the text cannot be spliced safely.
+    """
+    if _YAML_ANCHOR_OR_ALIAS_RE.search(text):
+        return None
+    blocks = []
+    for line in text.splitlines(keepends=True):
+        first_char = line[:1]
+        if not line.strip():
+            if blocks:
+                blocks[-1][1].append(line)
+            else:
+                blocks.append([None, [line]])
+        elif first_char in (" ", "\t") or line.startswith("- ") or line.rstrip() == "-":
+            # Continuation of the current platform (indented values or an indentless sequence)
+            if not blocks or blocks[-1][0] is None:
+                return None
+            blocks[-1][1].append(line)
+        elif first_char == "#":
+            blocks.append([None, [line]])
+        elif first_char in "{[?&*!|>%" or line.startswith(("---", "...")) or ":" not in line:
+            return None
+        else:
+            blocks.append([line, [line]])
+    return blocks
+
+def _find_yaml_block(blocks, key_prefix):
+    for index, (first_line, _) in enumerate(blocks):
+        if first_line is not None and first_line.startswith(key_prefix) and first_line[len(key_prefix):len(key_prefix) + 1] in ("", " ", "\n", "\r"):
+            return index
+    return None
+
+def _read_yaml_text(file_path):
+    if not os.path.exists(file_path):
+        return ""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def _write_text_atomic(file_path, text):
+    """Writes a text file atomically so an interrupted save never leaves a truncated file behind."""
+    temp_path = f"{file_path}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def read_yaml_platform(file_path, platform_key):
+    """Returns one platform entry from the system-softlist YAML (parsing only that platform), or None if it is missing."""
+    try:
+        text = _read_yaml_text(file_path)
+        blocks = _split_yaml_top_level_blocks(text)
+        key_prefix = _yaml_key_prefix(platform_key)
+        if blocks is None or key_prefix is None:
+            return _load_yaml_file(file_path).get(platform_key)
+        index = _find_yaml_block(blocks, key_prefix)
+        if index is None:
+            return None
+        data = _yaml_load("".join(blocks[index][1]))
+        return data.get(platform_key) if isinstance(data, dict) else None
     except Exception as e:
-        print(f"[ERROR] Unexpected error loading YAML file '{file_path}': {e}")
+        log_message("error", f"[ERROR] Error loading platform '{platform_key}' from '{file_path}': {e}")
+        return None
+
+def save_yaml_platforms(file_path, platforms=None, delete_keys=None):
+    """
+    Writes platform entries into the system-softlist YAML, replacing existing keys in place and appending new
+    ones, and removes `delete_keys`. Only the changed platforms are dumped; the rest of the file is kept as is.
+    The file is replaced atomically. Returns {platform_key: yaml_text} for the written platforms.
+    Raises OSError/yaml.YAMLError on failure.
+    """
+    platforms = platforms or {}
+    delete_keys = [key for key in (delete_keys or []) if key not in platforms]
+    platform_texts = {key: _dump_yaml_platform(key, entry) for key, entry in platforms.items()}
+
+    text = _read_yaml_text(file_path)
+    blocks = _split_yaml_top_level_blocks(text)
+    key_prefixes = {key: _yaml_key_prefix(key) for key in list(platforms) + delete_keys}
+    if blocks is None or None in key_prefixes.values():
+        debug_print("'%s' cannot be updated in place; rewriting the whole file.", file_path)
+        existing_data = _load_yaml_file(file_path)
+        for key in delete_keys:
+            existing_data.pop(key, None)
+        existing_data.update(platforms)
+        _write_text_atomic(file_path, _yaml_dump(existing_data))
+        return platform_texts
+
+    for key in delete_keys:
+        index = _find_yaml_block(blocks, key_prefixes[key])
+        if index is not None:
+            del blocks[index]
+    for key, platform_text in platform_texts.items():
+        index = _find_yaml_block(blocks, key_prefixes[key])
+        if index is not None:
+            blocks[index] = [platform_text, [platform_text]]
+        else:
+            if blocks and not blocks[-1][1][-1].endswith("\n"):
+                blocks[-1][1][-1] += "\n"
+            blocks.append([platform_text, [platform_text]])
+
+    new_text = "".join("".join(lines) for _, lines in blocks)
+    _write_text_atomic(file_path, new_text if new_text else "{}\n")
+    return platform_texts
+
+# Parsed copies of the system-softlist YAML for read-only commands, stored next to the YAML file.
+PLATFORM_YAML_CACHE_SUFFIX = ".platforms.pickle"
+PLATFORM_YAML_CACHE_VERSION = 1
+
+def load_platforms_yaml(file_path):
+    """
+    Returns the parsed system-softlist YAML for read-only use (copy-roms, table, platform-info, the GUI lists).
+    A pickled copy next to the YAML is reused as long as the YAML's size, mtime and sampled hash are unchanged;
+    otherwise the YAML is parsed again and the copy is rebuilt.
+    """
+    if not os.path.exists(file_path):
         return {}
+    cache_path = f"{file_path}{PLATFORM_YAML_CACHE_SUFFIX}"
+    fingerprint = _file_fingerprint(file_path)
+    cached = _read_pickle_cache(cache_path)
+    if (isinstance(cached, dict) and cached.get("version") == PLATFORM_YAML_CACHE_VERSION
+            and cached.get("fingerprint") == fingerprint):
+        debug_print("Using platform YAML cache '%s'.", cache_path)
+        return cached["platforms"]
+
+    platforms = _load_yaml_file(file_path)
+    if platforms:
+        _write_pickle_cache(cache_path, {"version": PLATFORM_YAML_CACHE_VERSION, "fingerprint": fingerprint, "platforms": platforms})
+    return platforms
 
 def save_configuration():
     try:
         with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            yaml.dump(APP_CONFIG, f, default_flow_style=False, sort_keys=False)
-        debug_print(f"Configuration saved to '{CONFIG_FILE}'.")
+            _yaml_dump(APP_CONFIG, f)
+        debug_print("Configuration saved to '%s'.", CONFIG_FILE)
         return True
     except Exception as e:
-        print(f"[ERROR] Failed to save configuration to '{CONFIG_FILE}': {e}")
+        log_message("error", f"[ERROR] Failed to save configuration to '{CONFIG_FILE}': {e}")
         return False
 
 def load_configuration():
     if not CONFIG_FILE.exists():
-        print(f"[ERROR] Config file not found: {CONFIG_FILE}")
+        log_message("error", f"[ERROR] Config file not found: {CONFIG_FILE}")
         return False
 
     config_data = _load_yaml_file(CONFIG_FILE)
     if not config_data:
-        print(f"[WARNING] '{CONFIG_FILE}' is empty or invalid. Please run the setup wizard or use the 'config' command.")
+        log_message("warning", f"[WARNING] '{CONFIG_FILE}' is empty or invalid. Please run the setup wizard or use the 'config' command.")
         return False
 
     config_dir = CONFIG_FILE.parent
@@ -86,7 +404,7 @@ def load_configuration():
             else:
                 APP_CONFIG[key] = value
 
-    print(f"[INFO] Configuration loaded from '{CONFIG_FILE}'.")
+    log_message("info", f"[INFO] Configuration loaded from '{CONFIG_FILE}'.")
     return True
 
       
@@ -101,11 +419,11 @@ def get_mame_version_from_exe(mame_exe_path):
             capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=10
         )
         if result.returncode != 0 or not result.stdout:
-            debug_print(f"MAME -version command failed or returned empty output. Return code: {result.returncode}")
+            debug_print("MAME -version command failed or returned empty output. Return code: %s", result.returncode)
             return None
 
         version_output = result.stdout.strip()
-        debug_print(f"MAME -version output: '{version_output}'")
+        debug_print("MAME -version output: '%s'", version_output)
 
         # Example output: "0.278 (mame0278)"
         # We want to extract "0.278"
@@ -116,7 +434,7 @@ def get_mame_version_from_exe(mame_exe_path):
         
         return None
     except Exception as e:
-        print(f"[ERROR] An unexpected error occurred while getting MAME version: {e}")
+        log_message("error", f"[ERROR] An unexpected error occurred while getting MAME version: {e}")
         return None
 
     
@@ -138,14 +456,14 @@ def run_initial_setup_wizard():
             break
         print("[!] Invalid path. Please ensure the path points to 'mame.exe' and the file exists.")
 
-    print("\n[INFO] Attempting to auto-detect MAME version by running the executable...")
+    log_message("info", "\n[INFO] Attempting to auto-detect MAME version by running the executable...")
     detected_version = get_mame_version_from_exe(temp_config["mame_executable"])
     
     if detected_version:
         print(f"\n[2/5] Auto-detected MAME version: {detected_version}")
         temp_config["mess_version"] = detected_version
     else:
-        print("[INFO] Could not auto-detect version from the executable.")
+        log_message("info", "[INFO] Could not auto-detect version from the executable.")
         while True:
             prompt = "\n[2/5] Please enter your MAME version number (e.g., 0.278, 0.277):\n> "
             version = input(prompt).strip()
@@ -186,7 +504,7 @@ def run_initial_setup_wizard():
         for key, value in temp_config.items():
             APP_CONFIG[key] = value
         if save_configuration():
-            print(f"\n[SUCCESS] Configuration saved to '{CONFIG_FILE}'. You can now run the tool.")
+            log_message("info", f"\n[SUCCESS] Configuration saved to '{CONFIG_FILE}'. You can now run the tool.")
         else:
             print("\n[FATAL] Could not save configuration. Exiting.")
             sys.exit(1)
@@ -212,14 +530,14 @@ MESS_SOFTLIST_XML_FILE = BASE_DIR.parent / "mess-softlist.xml"
 MESS_NOSOFTLIST_XML_FILE = BASE_DIR.parent / "mess-nosoftlist.xml"
 TMP_SOFTWARE_XML_FILE = BASE_DIR.parent / "tmp_software.xml"
 
-def run_mame_command(args, output_file, use_cache=False): 
-    if use_cache and os.path.exists(output_file):
-        print(f"[INFO] Using cached XML file: '{output_file}'. Skipping MAME execution.")
-        return True
-
+def run_mame_capture(args):
+    """
+    Runs MAME and returns its XML output as a string, or None if the command failed or produced no XML.
+    The output is kept in memory, so several commands can run at the same time without sharing a temp file.
+    """
     try:
         cmd = [APP_CONFIG['mame_executable']] + args
-        debug_print(f"Running: {' '.join(cmd)}")
+        debug_print("Running: %s", ' '.join(cmd))
 
         result = subprocess.run(
             cmd,
@@ -232,10 +550,10 @@ def run_mame_command(args, output_file, use_cache=False):
         )
 
         if not result.stdout.strip():
-            print(f"[!] MAME output for command '{' '.join(args)}' is empty or invalid.")
+            log_message("error", f"[!] MAME output for command '{' '.join(args)}' is empty or invalid.")
             if result.returncode != 0:
-                print(f"[!] MAME exited with error code {result.returncode}. Output:\n{result.stdout}")
-            return False
+                log_message("error", f"[!] MAME exited with error code {result.returncode}. Output:\n{result.stdout}")
+            return None
 
         is_xml_output = False
         if "-listxml" in args and (("<mame" in result.stdout) or ("<machine" in result.stdout)):
@@ -244,212 +562,963 @@ def run_mame_command(args, output_file, use_cache=False):
             is_xml_output = True
         
         if not is_xml_output:
-            print(f"[!] No valid XML content found in MAME output for '{' '.join(args)}'. Raw output snippet:\n{result.stdout[:500]}...")
+            log_message("error", f"[!] No valid XML content found in MAME output for '{' '.join(args)}'. Raw output snippet:\n{result.stdout[:500]}...")
             if "unknown system" in result.stdout.lower() or "not supported" in result.stdout.lower():
-                print(f"[!] Error: System '{args[-1]}' not found or does not support software lists.")
-            return False
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(result.stdout)
+                log_message("error", f"[!] Error: System '{args[-1]}' not found or does not support software lists.")
+            return None
 
-        return True
+        return result.stdout
 
     except FileNotFoundError:
-        print(f"[!] Error: MAME executable not found at '{APP_CONFIG['mame_executable']}'")
-        return False
+        log_message("error", f"[!] Error: MAME executable not found at '{APP_CONFIG['mame_executable']}'")
+        return None
     except Exception as e:
-        print(f"[!] Exception running MAME command '{' '.join(args)}': {e}")
+        log_message("error", f"[!] Exception running MAME command '{' '.join(args)}': {e}")
+        return None
+
+
+def run_mame_command(args, output_file, use_cache=False): 
+    if use_cache and os.path.exists(output_file):
+        log_message("info", f"[INFO] Using cached XML file: '{output_file}'. Skipping MAME execution.")
+        return True
+
+    output = run_mame_capture(args)
+    if output is None:
         return False
 
+    try:
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(output)
+    except OSError as e:
+        log_message("error", f"[!] Failed to write MAME output to '{output_file}': {e}")
+        return False
+    return True
 
-def get_parsed_mame_xml_root(xml_filepath):
-    if not os.path.exists(xml_filepath):
-        print(f"[INFO] Generating '{xml_filepath}' using MAME. This may take a moment...")
-        if not run_mame_command(["-listxml"], xml_filepath, use_cache=False): 
-            print(f"[ERROR] Failed to generate '{xml_filepath}'.")
-            return None
-    else: 
-        print(f"[INFO] Using existing XML file: '{xml_filepath}'.")
 
+def start_mame_process(args):
+    """
+    Starts MAME with its stdout exposed as a binary pipe so large outputs (e.g. -listxml) can be consumed
+    incrementally. stderr goes to a temporary file to avoid pipe deadlocks; it is available as `process.stderr_file`.
+    Returns the Popen object, or None if MAME could not be started.
+    """
+    cmd = [APP_CONFIG['mame_executable']] + args
+    debug_print("Streaming: %s", ' '.join(cmd))
+    stderr_file = tempfile.TemporaryFile()
     try:
-        tree = ET.parse(xml_filepath)
-        return tree.getroot()
-    except ET.ParseError as pe:
-        print(f"[ERROR] XML parse error for '{xml_filepath}': {pe}. File might be corrupted. Consider deleting it and rerunning.")
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            cwd=os.path.dirname(APP_CONFIG['mame_executable'])
+        )
+    except FileNotFoundError:
+        stderr_file.close()
+        log_message("error", f"[!] Error: MAME executable not found at '{APP_CONFIG['mame_executable']}'")
         return None
     except Exception as e:
-        print(f"[ERROR] Unexpected error parsing XML file '{xml_filepath}': {e}")
+        stderr_file.close()
+        log_message("error", f"[!] Exception starting MAME command '{' '.join(args)}': {e}")
         return None
+    process.stderr_file = stderr_file
+    return process
 
 
-def get_all_mame_systems_from_xml_file(xml_filepath):
-    machines = set()
-    root = get_parsed_mame_xml_root(xml_filepath)
-    if root is None:
-        return machines
+# === XML Parser Backend ===
+# lxml is used when it is installed; otherwise everything falls back to xml.etree.ElementTree.
+# Both backends expose the same Element API (find/findall/findtext/get/attrib) to the rest of the tool.
+XML_BACKENDS = ("stdlib", "lxml")
+XML_PARSE_ERRORS = (ET.ParseError,) if lxml_etree is None else (ET.ParseError, lxml_etree.XMLSyntaxError)
+_xml_backend = "lxml" if lxml_etree is not None else "stdlib"
+
+def get_xml_backend():
+    return _xml_backend
+
+
+def set_xml_backend(backend):
+    """Selects the XML backend ('lxml' or 'stdlib'). Returns False if the backend is not available."""
+    global _xml_backend
+    if backend not in XML_BACKENDS or (backend == "lxml" and lxml_etree is None):
+        return False
+    _xml_backend = backend
+    return True
+
+
+def _lxml_parser():
+    # huge_tree lifts libxml2's safety limits, which a full -listxml document exceeds.
+    return lxml_etree.XMLParser(huge_tree=True)
+
+
+def parse_xml_file(xml_filepath):
+    """Parses an XML file and returns its root element."""
+    if _xml_backend == "lxml":
+        return lxml_etree.parse(str(xml_filepath), _lxml_parser()).getroot()
+    return ET.parse(xml_filepath).getroot()
+
+
+def parse_xml_string(xml_text):
+    """Parses an XML document held in a string and returns its root element."""
+    if _xml_backend == "lxml":
+        return lxml_etree.fromstring(xml_text.encode("utf-8"), _lxml_parser())
+    return ET.fromstring(xml_text)
+
+
+def xml_element_to_string(elem):
+    """Serializes an element (without its tail) to a unicode string."""
+    if _xml_backend == "lxml":
+        return lxml_etree.tostring(elem, encoding="unicode", with_tail=False)
+    elem.tail = None
+    return ET.tostring(elem, encoding="unicode")
 
+
+def iterparse_top_level_elements(source, tag, on_root=None):
+    """
+    Streams the direct children of the document root that have the given tag, yielding each one once it is
+    complete. Every child parsed so far is released when the next one is requested, so memory stays flat.
+    `on_root` is called with the root's attributes before the first element is yielded.
+    `source` can be a file path or a binary file object.
+    """
+    if _xml_backend == "lxml":
+        yield from _lxml_iterparse_top_level_elements(source, tag, on_root)
+        return
+
+    root = None
+    depth = 0
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if root is None:
+                root = elem
+                if on_root is not None:
+                    on_root(dict(elem.attrib))
+            continue
+
+        depth -= 1
+        if depth == 1:
+            if elem.tag == tag:
+                yield elem
+            # Drop the children processed so far; the root keeps its attributes.
+            del root[:]
+
+
+def _lxml_iterparse_top_level_elements(source, tag, on_root=None):
+    # Only 'end' events for the wanted tag reach Python; libxml2 builds everything else in C.
+    if isinstance(source, os.PathLike):
+        source = str(source)
+    events = lxml_etree.iterparse(source, events=("end",), tag=tag, huge_tree=True)
+    root_reported = False
+    for _, elem in events:
+        parent = elem.getparent()
+        if parent is None or parent.getparent() is not None:
+            continue
+        if not root_reported:
+            root_reported = True
+            if on_root is not None:
+                on_root(dict(parent.attrib))
+        yield elem
+        # libxml2 may still reference the element just parsed, so it is only emptied; earlier siblings are removed.
+        elem.clear(keep_tail=True)
+        while elem.getprevious() is not None:
+            del parent[0]
+
+    if not root_reported and on_root is not None and events.root is not None:
+        on_root(dict(events.root.attrib))
+
+
+# === Machine Catalog Cache ===
+MACHINE_CATALOG_CACHE_VERSION = 4
+MACHINE_CATALOG_CACHE_SUFFIX = ".catalog.pickle"
+
+def _file_fingerprint(file_path, sample_size=65536):
+    """
+    Returns a cheap fingerprint (size, mtime, sampled SHA1) used to detect when a file has changed.
+    Only the head and tail of the file are hashed, so checking a large XML stays fast.
+    """
+    stat = os.stat(file_path)
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        digest.update(f.read(sample_size))
+        if stat.st_size > sample_size:
+            f.seek(max(stat.st_size - sample_size, sample_size))
+            digest.update(f.read(sample_size))
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": digest.hexdigest()}
+
+def _read_pickle_cache(cache_path):
+    if not os.path.exists(cache_path):
+        return None
     try:
-        for machine_element in root.findall("machine"):
-            machine_name = machine_element.get("name")
-            if machine_name:
-                machines.add(machine_name)
-        print(f"[INFO] Loaded {len(machines)} machines from '{xml_filepath}'.")
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
     except Exception as e:
-        print(f"[ERROR] Error extracting machines from '{xml_filepath}': {e}")
-    return machines
-
+        debug_print("Ignoring unreadable cache file '%s': %s", cache_path, e)
+        return None
 
-def get_all_mame_systems_by_prefix_from_root(prefix, xml_root):
-    matching_systems = []
-    debug_print(f"Filtering machines from provided XML by prefix '{prefix}'.")
+def _write_pickle_cache(cache_path, data):
+    """Writes a cache file atomically so an interrupted run never leaves a truncated cache behind."""
+    temp_path = f"{cache_path}.tmp"
     try:
-        for machine_element in xml_root.findall("machine"):
-            machine_name = machine_element.get("name")
-            if machine_name and machine_name.startswith(prefix):
-                matching_systems.append(machine_name)
-        debug_print(f"Found {len(matching_systems)} systems matching prefix '{prefix}'.")
+        with open(temp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+        return True
     except Exception as e:
-        print(f"[ERROR] Error during fuzzy search from XML root: {e}")
-    return matching_systems
+        log_message("warning", f"[WARNING] Could not write cache file '{cache_path}': {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
 
+class MachineRecord:
+    """
+    The fields the curator reads from a <machine> element. `softlists` maps each supported software list
+    to its upper-cased compatibility filter (or None). Repeated values are interned, so a catalog of tens of
+    thousands of machines shares one copy of each status, manufacturer, year, source file and softlist name.
+    """
+    __slots__ = ("name", "description", "manufacturer", "year", "status", "emulation", "sourcefile", "cloneof", "softlists")
 
-def get_machine_details_and_filters_from_root(system_name, source_xml_root): 
-    filters = {}
-    machine_metadata = {"description": "N/A", "manufacturer": "N/A", "year": "N/A", "status": "N/A", "emulation": "N/A", "sourcefile": "N/A", "cloneof": "N/A"}
+    def __init__(self, name, description, manufacturer, year, status, emulation, sourcefile, cloneof, softlists):
+        self.name = name
+        self.description = description
+        self.manufacturer = manufacturer
+        self.year = year
+        self.status = status
+        self.emulation = emulation
+        self.sourcefile = sourcefile
+        self.cloneof = cloneof
+        self.softlists = softlists
+
+    def as_row(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
 
-    debug_print(f"Extracting details for '{system_name}' from provided XML root.")
-    
-    try:
-        machine_element = source_xml_root.find(f"machine[@name='{system_name}']")
-        if machine_element is None:
-            debug_print(f"Machine '{system_name}' not found in the provided XML root.")
-            return filters, machine_metadata
 
-        machine_metadata["cloneof"] = machine_element.get("cloneof", "N/A")
-        machine_metadata["description"] = machine_element.findtext("description", "N/A").strip()
-        machine_metadata["manufacturer"] = machine_element.findtext("manufacturer", "N/A").strip()
-        machine_metadata["year"] = machine_element.findtext("year", "N/A").strip()
-        machine_metadata["sourcefile"] = machine_element.get("sourcefile", "N/A")
+_MACHINE_RECORD_CHILD_TAGS = ("description", "manufacturer", "year", "driver", "softwarelist")
 
+def _machine_record_from_element(machine_element):
+    machine_name = machine_element.get("name")
+    if not machine_name:
+        return None
+
+    if hasattr(machine_element, "iterchildren"):
+        # lxml: one pass over the children, with the tags filtered in C so <rom>, <chip>, etc. never reach Python.
+        texts = {}
+        driver_element = None
+        softlist_elements = []
+        for child in machine_element.iterchildren(*_MACHINE_RECORD_CHILD_TAGS):
+            tag = child.tag
+            if tag == "softwarelist":
+                softlist_elements.append(child)
+            elif tag == "driver":
+                if driver_element is None:
+                    driver_element = child
+            elif tag not in texts:
+                texts[tag] = (child.text or "").strip()
+    else:
+        # ElementTree's find()/findtext() run in C, which beats iterating the children in Python.
+        texts = {}
+        for tag in ("description", "manufacturer", "year"):
+            text = machine_element.findtext(tag)
+            if text is not None:
+                texts[tag] = text.strip()
         driver_element = machine_element.find("driver")
-        if driver_element is not None:
-            machine_metadata["status"] = driver_element.get("status", "N/A")
-            machine_metadata["emulation"] = driver_element.get("emulation", "N/A")
-
-        found_swlist_tags = False
-        for swlist_tag in machine_element.findall("softwarelist"):
-            found_swlist_tags = True
-            softlist_name = swlist_tag.get("name")
+        softlist_elements = machine_element.findall("softwarelist")
+
+    softlists = {}
+    for swlist_tag in softlist_elements:
+        softlist_name = swlist_tag.get("name")
+        if softlist_name:
             softlist_filter = swlist_tag.get("filter")
-            if softlist_name:
-                filters[softlist_name] = softlist_filter.upper() if softlist_filter else None
-                debug_print(f"-> Found softlist tag for '{softlist_name}' with filter: '{filters[softlist_name]}'")
-            else:
-                debug_print(f"-> Found a softwarelist tag without a 'name' attribute in machine '{system_name}'. Skipping.")
-        
-        if not found_swlist_tags:
-            debug_print(f"No <softwarelist> tags found within machine '{system_name}' definition.")
+            softlists[sys.intern(softlist_name)] = sys.intern(softlist_filter.upper()) if softlist_filter else None
+
+    return MachineRecord(
+        sys.intern(machine_name),
+        texts.get("description", "N/A"),
+        sys.intern(texts.get("manufacturer", "N/A")),
+        sys.intern(texts.get("year", "N/A")),
+        sys.intern(driver_element.get("status", "N/A") if driver_element is not None else "N/A"),
+        sys.intern(driver_element.get("emulation", "N/A") if driver_element is not None else "N/A"),
+        sys.intern(machine_element.get("sourcefile", "N/A")),
+        sys.intern(machine_element.get("cloneof", "N/A")),
+        softlists,
+    )
+
+
+def _assemble_machine_catalog(attributes, machine_records):
+    """
+    Builds the catalog from MachineRecords in document order: the machines keyed by name, a sorted array
+    of the names for prefix queries, and a reverse index mapping each software list to the machines that
+    support it: {softlist: {machine: filter or None}}.
+    """
+    machines = {}
+    softlist_machines = {}
+    for machine in machine_records:
+        machines[machine.name] = machine
+        for softlist_name, softlist_filter in machine.softlists.items():
+            softlist_machines.setdefault(softlist_name, {})[machine.name] = softlist_filter
+    return {"attributes": attributes, "machines": machines, "sorted_names": sorted(machines),
+            "softlist_machines": softlist_machines}
+
+
+def build_machine_catalog_from_file(xml_filepath):
+    """
+    Extracts the machine catalog from a MAME XML file with a streaming parse. Each <machine> element is
+    discarded as soon as its record is built, so the full DOM is never held in memory.
+    """
+    root_attributes = {}
+    machine_records = []
+    for machine_element in iterparse_top_level_elements(xml_filepath, "machine", on_root=root_attributes.update):
+        machine = _machine_record_from_element(machine_element)
+        if machine is not None:
+            machine_records.append(machine)
+    return _assemble_machine_catalog(root_attributes, machine_records)
+
 
+def load_machine_catalog(xml_filepath):
+    """
+    Returns the machine catalog for a MAME/MESS XML file.
+    A pickled copy is kept next to the XML and reused as long as the XML's size, mtime and sampled hash
+    are unchanged; otherwise the XML is parsed again and the cache is rebuilt.
+    """
+    cache_path = f"{xml_filepath}{MACHINE_CATALOG_CACHE_SUFFIX}"
+
+    if os.path.exists(xml_filepath):
+        cached = _read_pickle_cache(cache_path)
+        if (isinstance(cached, dict) and cached.get("version") == MACHINE_CATALOG_CACHE_VERSION
+                and cached.get("fingerprint") == _file_fingerprint(xml_filepath)):
+            # Records are pickled as plain tuples so the cache does not depend on the module's import name.
+            catalog = _assemble_machine_catalog(cached["attributes"], (MachineRecord(*row) for row in cached["machine_rows"]))
+            log_message("info", f"[INFO] Using machine catalog cache '{cache_path}' ({len(catalog['machines'])} machines).")
+            return catalog
+        debug_print("Machine catalog cache '%s' is missing or stale. Rebuilding.", cache_path)
+        log_message("info", f"[INFO] Using existing XML file: '{xml_filepath}'.")
+    else:
+        log_message("info", f"[INFO] Generating '{xml_filepath}' using MAME. This may take a moment...")
+        if not run_mame_command(["-listxml"], xml_filepath, use_cache=False):
+            log_message("error", f"[ERROR] Failed to generate '{xml_filepath}'.")
+            return None
+
+    try:
+        catalog = build_machine_catalog_from_file(xml_filepath)
+    except XML_PARSE_ERRORS as pe:
+        log_message("error", f"[ERROR] XML parse error for '{xml_filepath}': {pe}. File might be corrupted. Consider deleting it and rerunning.")
+        return None
     except Exception as e:
-        print(f"[ERROR] Unexpected error extracting details for '{system_name}' from XML root: {e}")
+        log_message("error", f"[ERROR] Unexpected error parsing XML file '{xml_filepath}': {e}")
+        return None
+
+    cache_data = {
+        "version": MACHINE_CATALOG_CACHE_VERSION,
+        "fingerprint": _file_fingerprint(xml_filepath),
+        "attributes": catalog["attributes"],
+        "machine_rows": [machine.as_row() for machine in catalog["machines"].values()],
+    }
+    if _write_pickle_cache(cache_path, cache_data):
+        log_message("info", f"[INFO] Machine catalog for {len(catalog['machines'])} machines cached to '{cache_path}'.")
+    return catalog
+
+
+def split_machine_name_patterns(patterns):
+    """Accepts a pattern string ('jak_* ekara*', comma or space separated) or a list of patterns."""
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    return [pattern for item in patterns or () for pattern in item.replace(',', ' ').split()]
+
+
+def get_all_mame_systems_by_prefix_from_catalog(patterns, machine_catalog):
+    """
+    Returns the sorted machine names matching any of the given name patterns.
+    A plain pattern ('jak_') is a name prefix; a pattern with '*', '?' or '[' is a shell-style glob matched
+    against the whole name ('jak_*', 'ekara*'). Each pattern is resolved as a bisect range over the catalog's
+    sorted name array, using the literal text before the first wildcard, so no full scan is needed.
+    """
+    sorted_names = machine_catalog["sorted_names"]
+    matching_systems = set()
+    for pattern in split_machine_name_patterns(patterns):
+        wildcard_positions = [pos for pos in (pattern.find("*"), pattern.find("?"), pattern.find("[")) if pos >= 0]
+        literal_prefix = pattern[:min(wildcard_positions)] if wildcard_positions else pattern
+
+        start = bisect_left(sorted_names, literal_prefix)
+        end = bisect_left(sorted_names, literal_prefix + "\U0010ffff", start)
+        names_in_range = sorted_names[start:end]
+        if wildcard_positions:
+            names_in_range = [name for name in names_in_range if fnmatch.fnmatchcase(name, pattern)]
+        debug_print("Found %d systems matching '%s'.", len(names_in_range), pattern)
+        matching_systems.update(names_in_range)
+    return sorted(matching_systems)
+
+
+def get_machine_details_and_filters_from_catalog(system_name, machine_catalog):
+    """Returns the softlist filters and metadata for a machine, looked up directly in the machine catalog."""
+    machine_metadata = {"description": "N/A", "manufacturer": "N/A", "year": "N/A", "status": "N/A", "emulation": "N/A", "sourcefile": "N/A", "cloneof": "N/A"}
+
+    machine = machine_catalog["machines"].get(system_name)
+    if machine is None:
+        debug_print("Machine '%s' not found in the machine catalog.", system_name)
+        return {}, machine_metadata
+
+    for key in machine_metadata:
+        machine_metadata[key] = getattr(machine, key)
+    filters = dict(machine.softlists)
+    if filters:
+        debug_print("-> Softlist filters for '%s': %s", system_name, filters)
+    else:
+        debug_print("No <softwarelist> tags found within machine '%s' definition.", system_name)
     return filters, machine_metadata
 
 
-def parse_software_list_from_file(search="", expected_softlist_name=None, system_name="", machine_softlist_filters=None, include_softlist=None, exclude_softlist=None):
+def compile_machine_filter(description_terms=None, sourcefile=None, driver_status=None, emulation_status=None):
+    """
+    Compiles the machine attribute filters into one predicate over machine catalog entries.
+    Cheap equality checks run first. Returns None when no filter is set.
+    """
+    checks = []
+    if driver_status:
+        checks.append(lambda machine: machine.status == driver_status)
+    if emulation_status:
+        checks.append(lambda machine: machine.emulation == emulation_status)
+    if sourcefile:
+        sourcefile_lower = sourcefile.lower()
+        checks.append(lambda machine: sourcefile_lower in machine.sourcefile.lower())
+    if description_terms:
+        terms_lower = [term.lower() for term in description_terms]
+        def matches_description(machine):
+            description_lower = machine.description.lower()
+            for term in terms_lower:
+                if term not in description_lower:
+                    return False
+            return True
+        checks.append(matches_description)
+
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+
+    def machine_filter(machine):
+        for check in checks:
+            if not check(machine):
+                return False
+        return True
+    return machine_filter
+
+
+def select_machines(machine_catalog, systems=None, name_patterns=None, description_terms=None, sourcefile=None, softlists=None,
+                    driver_status=None, emulation_status=None, include_systems=None, exclude_systems=None,
+                    log=lambda message: log_message("info", message)):
+    """
+    Selects the systems to process from the machine catalog in a single pass and returns them sorted by name.
+
+    The candidate pool is the named systems (`systems`, `include_systems` and machines matching the prefixes or
+    globs in `name_patterns`), or every machine when none are given. `softlists` narrows the pool to the union of those
+    lists' machines from the catalog's softlist index. The pool is then narrowed by the compiled machine filters,
+    `include_systems` are added back and `exclude_systems` removed. Names missing from the catalog are only
+    kept when no machine filter is set.
+    """
+    machines = machine_catalog["machines"]
+    named_systems = set(systems or ()) | set(include_systems or ())
+    machine_filter = compile_machine_filter(description_terms, sourcefile, driver_status, emulation_status)
+
+    softlist_members = None
+    if softlists:
+        softlist_machines = machine_catalog["softlist_machines"]
+        softlist_members = set().union(*(softlist_machines.get(name, ()) for name in softlists))
+        log(f"[INFO] {len(softlist_members)} machine(s) support software list(s): {', '.join(softlists)}")
+
+    name_patterns = split_machine_name_patterns(name_patterns)
+    if name_patterns:
+        pattern_matches = get_all_mame_systems_by_prefix_from_catalog(name_patterns, machine_catalog)
+        log(f"[INFO] {len(pattern_matches)} system(s) match name pattern(s): {' '.join(name_patterns)}")
+        candidates = set(pattern_matches).union(name for name in named_systems if name in machines)
+    elif named_systems:
+        candidates = (name for name in named_systems if name in machines)
+        log(f"[INFO] Selecting from {len(named_systems)} explicitly named system(s).")
+    elif softlist_members is not None:
+        candidates = iter(softlist_members)
+    else:
+        candidates = iter(machines)
+        log(f"[INFO] No specific systems provided. Selecting from all {len(machines)} machines.")
+
+    if softlist_members is not None:
+        candidates = (name for name in candidates if name in softlist_members)
+
+    selected = {name for name in candidates if machine_filter is None or machine_filter(machines[name])}
+    if machine_filter is None and softlist_members is None:
+        selected.update(named_systems)
+    selected.update(include_systems or ())
+    selected.difference_update(exclude_systems or ())
+
+    log(f"[INFO] {len(selected)} system(s) selected after applying all machine filters.")
+    return sorted(selected)
+
+
+def get_mame_hash_dir():
+    """
+    Returns the directory holding MAME's softlist XMLs (hash/*.xml), or None if it is not available.
+    Uses 'mame_hash_dir' from the config, falling back to the 'hash' folder next to the MAME executable.
+    """
+    hash_dir = APP_CONFIG.get("mame_hash_dir")
+    if not hash_dir and APP_CONFIG.get("mame_executable"):
+        hash_dir = os.path.join(os.path.dirname(APP_CONFIG["mame_executable"]), "hash")
+    return hash_dir if hash_dir and os.path.isdir(hash_dir) else None
+
+
+# Parsed software list records shared by every system in this run, keyed by softlist name.
+# Each record is (software_id, description, publisher, compatibility), where compatibility is None when the
+# software has no <sharedfeat name="compatibility"> tag, or a tuple of its upper-cased values otherwise.
+# The cache only holds lists from one source (see use_softlist_records_source); lists read from the hash
+# directory also remember the (size, mtime) of their XML file in _SOFTLIST_RECORDS_FILE_KEYS.
+_SOFTLIST_RECORDS_CACHE = {}
+_SOFTLIST_RECORDS_FILE_KEYS = {}
+_SOFTLIST_RECORDS_SOURCE = {"key": None}
+
+def _extract_software_list_records(swlist_elem):
+    records = []
+    for sw in swlist_elem.findall("software"):
+        compatibility_feat = sw.find('sharedfeat[@name="compatibility"]')
+        compatibility = None
+        if compatibility_feat is not None:
+            compatibility = tuple(v.strip() for v in compatibility_feat.get("value", "").upper().split(',') if v.strip())
+        records.append((
+            sw.get("name", ""),
+            sw.findtext("description", default="").strip(),
+            sw.findtext("publisher", default="N/A").strip(),
+            compatibility,
+        ))
+    return records
+
+
+def use_softlist_records_source(source_key):
+    """
+    Scopes the in-memory software list caches to one source, e.g. ('hash', <hash dir>) or ('mame', <build
+    fingerprint>). Switching to another source, as the GUI does after its MAME settings change, drops every
+    cached list, so stale lists are never reused and memory does not grow with each source used.
+    """
+    if _SOFTLIST_RECORDS_SOURCE["key"] != source_key:
+        _SOFTLIST_RECORDS_CACHE.clear()
+        _SOFTLIST_RECORDS_FILE_KEYS.clear()
+        _SOFTLIST_TRIGRAM_CACHE.clear()
+        _SOFTLIST_RECORDS_SOURCE["key"] = source_key
+
+
+def _get_software_list_records(swlist_elem):
+    """Returns the cached records for a parsed <softwarelist> element, extracting them on first sight of that list."""
+    softlist_name = swlist_elem.get("name")
+    records = _SOFTLIST_RECORDS_CACHE.get(softlist_name)
+    if records is None:
+        records = _extract_software_list_records(swlist_elem)
+        _SOFTLIST_RECORDS_CACHE[softlist_name] = records
+        debug_print("Cached %d software records for softlist '%s'.", len(records), softlist_name)
+    return records
+
+
+# === Software Title Index ===
+# Trigram postings over each record's lower-cased "software_id\0description", used to answer
+# --filter-software-description without scanning every record. Keyed by softlist name; each entry is
+# (records, postings) so a posting list is only ever used with the records it was built from.
+SOFTLIST_INDEX_VERSION = 1
+SOFTLIST_INDEX_DIRNAME = "softlist_index"
+_SOFTLIST_TRIGRAM_CACHE = {}
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def build_software_trigram_index(records):
+    """Returns {trigram: array of record positions} for a software list's records."""
+    postings = {}
+    for position, (swid, desc, _publisher, _compatibility) in enumerate(records):
+        for trigram in _trigrams(f"{swid.lower()}\0{desc.lower()}"):
+            posting = postings.get(trigram)
+            if posting is None:
+                posting = postings[trigram] = array("I")
+            posting.append(position)
+    return postings
+
+
+def _get_software_trigram_index(softlist_name, records):
+    cached = _SOFTLIST_TRIGRAM_CACHE.get(softlist_name)
+    if cached is not None and cached[0] is records:
+        return cached[1]
+    postings = build_software_trigram_index(records)
+    _SOFTLIST_TRIGRAM_CACHE[softlist_name] = (records, postings)
+    return postings
+
+
+def _candidate_software_positions(softlist_name, records, search_lower):
+    """
+    Returns the ascending record positions that may contain `search_lower`, or None when the search term is
+    too short to use the index (every record is then a candidate). Candidates still need the substring check.
+    """
+    if len(search_lower) < 3:
+        return None
+    postings = _get_software_trigram_index(softlist_name, records)
+    posting_lists = []
+    for trigram in _trigrams(search_lower):
+        posting = postings.get(trigram)
+        if posting is None:
+            return []
+        posting_lists.append(posting)
+    posting_lists.sort(key=len)
+    candidates = set(posting_lists[0])
+    for posting in posting_lists[1:]:
+        candidates.intersection_update(posting)
+        if not candidates:
+            break
+    return sorted(candidates)
+
+
+def get_softlist_index_dir():
+    return DATA_DIR / APP_CONFIG.get("mess_version", "") / SOFTLIST_INDEX_DIRNAME
+
+
+def _load_softlist_index_file(softlist_xml_path, softlist_name):
+    """Loads the persisted records and title index for a hash/<softlist>.xml file if it is still current."""
+    cached = _read_pickle_cache(get_softlist_index_dir() / f"{softlist_name}.pickle")
+    if (isinstance(cached, dict) and cached.get("version") == SOFTLIST_INDEX_VERSION
+            and cached.get("fingerprint") == _file_fingerprint(softlist_xml_path)):
+        return cached["records"], cached["postings"]
+    return None
+
+
+def _save_softlist_index_file(softlist_xml_path, softlist_name, records, postings):
+    index_dir = get_softlist_index_dir()
+    try:
+        os.makedirs(index_dir, exist_ok=True)
+    except OSError as e:
+        log_message("warning", f"[WARNING] Could not create softlist index directory '{index_dir}': {e}")
+        return False
+    return _write_pickle_cache(index_dir / f"{softlist_name}.pickle", {
+        "version": SOFTLIST_INDEX_VERSION,
+        "fingerprint": _file_fingerprint(softlist_xml_path),
+        "records": records,
+        "postings": postings,
+    })
+
+
+def load_software_list_records_from_hash_dir(hash_dir, softlist_name):
+    """
+    Returns the records of hash/<softlist_name>.xml. The records and their title index are persisted under
+    data/<version>/softlist_index/ and reused until the XML file changes, so the XML is only parsed once.
+    """
+    softlist_xml_path = os.path.join(hash_dir, f"{softlist_name}.xml")
+    try:
+        stat = os.stat(softlist_xml_path)
+    except OSError:
+        return None
+    file_key = (stat.st_size, stat.st_mtime_ns)
+    if softlist_name in _SOFTLIST_RECORDS_CACHE and _SOFTLIST_RECORDS_FILE_KEYS.get(softlist_name) == file_key:
+        return _SOFTLIST_RECORDS_CACHE[softlist_name]
+    # Cleared so a changed XML file is parsed again rather than served from the records of its old version.
+    _SOFTLIST_RECORDS_CACHE.pop(softlist_name, None)
+    _SOFTLIST_RECORDS_FILE_KEYS[softlist_name] = file_key
+
+    persisted = _load_softlist_index_file(softlist_xml_path, softlist_name)
+    if persisted is not None:
+        records, postings = persisted
+        _SOFTLIST_RECORDS_CACHE[softlist_name] = records
+        _SOFTLIST_TRIGRAM_CACHE[softlist_name] = (records, postings)
+        debug_print("Loaded %d software records for softlist '%s' from the softlist index.", len(records), softlist_name)
+        return records
+
+    try:
+        records = _get_software_list_records(parse_xml_file(softlist_xml_path))
+    except XML_PARSE_ERRORS as pe:
+        log_message("error", f"[!] XML parse error for '{softlist_xml_path}': {pe}")
+        return None
+    _save_softlist_index_file(softlist_xml_path, softlist_name, records, _get_software_trigram_index(softlist_name, records))
+    return records
+
+
+def build_softlist_index(hash_dir):
+    """(Re)builds the persisted records and title index for every hash/*.xml file that is missing or stale."""
+    softlist_names = sorted(entry.name[:-4] for entry in os.scandir(hash_dir) if entry.is_file() and entry.name.endswith(".xml"))
+    use_softlist_records_source(("hash", os.path.abspath(hash_dir)))
+    log_message("info", f"[INFO] Indexing {len(softlist_names)} software lists from '{hash_dir}' into '{get_softlist_index_dir()}'...")
+    total_records = 0
+    for softlist_name in softlist_names:
+        records = load_software_list_records_from_hash_dir(hash_dir, softlist_name)
+        if records is not None:
+            total_records += len(records)
+    log_message("info", f"[SUCCESS] Software title index covers {total_records} titles in {len(softlist_names)} software lists.")
+
+
+def _select_software_from_lists(software_lists, search="", system_name="", machine_softlist_filters=None, include_softlist=None, exclude_softlist=None):
+    """
+    Applies the include/exclude, sharedfeat compatibility and search filters to a machine's software lists.
+    `software_lists` is an iterable of (softlist_name, records) pairs.
+    """
     if machine_softlist_filters is None:
         machine_softlist_filters = {}
     if exclude_softlist is None:
         exclude_softlist = []
 
-    try:
-        tree = ET.parse(TMP_SOFTWARE_XML_FILE)
-        root = tree.getroot()
-    except Exception as e:
-        print(f"[!] XML parse error for '{TMP_SOFTWARE_XML_FILE}': {e}")
-        return []
-
     results = []
-    software_lists_elements = []
-    
-    if root.tag == "mame":
-        software_lists_elements = root.findall("softwarelist")
-    elif root.tag == "softwarelist":
-        software_lists_elements = [root]
-    elif root.tag == "softwarelists":
-        software_lists_elements = root.findall("softwarelist")
-    else:
-        print(f"[!] Unexpected XML root tag: {root.tag}. Expected 'mame', 'softwarelist', or 'softwarelists'.")
-        return []
+    search_lower = search.lower()
 
-    debug_print(f"Parsing software list XML for '{system_name}'.")
-    debug_print(f"Machine-defined filters: {machine_softlist_filters}")
+    debug_print("Selecting software for '%s'.", system_name)
+    debug_print("Machine-defined filters: %s", machine_softlist_filters)
 
     processed_softlists_count = 0
-    for swlist_elem in software_lists_elements:
-        current_softlist_name_from_xml = swlist_elem.get("name")
-        if not current_softlist_name_from_xml:
-            debug_print(f"Skipping softwarelist element without 'name' attribute.")
-            continue
-
+    for current_softlist_name, records in software_lists:
         # Filter for inclusion first. If the include list is not empty, the softlist MUST be in it.
-        if include_softlist and current_softlist_name_from_xml not in include_softlist:
-            debug_print(f"Skipping softlist '{current_softlist_name_from_xml}' as it is not in the --include-softlist.")
+        if include_softlist and current_softlist_name not in include_softlist:
+            debug_print("Skipping softlist '%s' as it is not in the --include-softlist.", current_softlist_name)
             continue
 
         # Then filter for exclusion
-        if current_softlist_name_from_xml in exclude_softlist:
-            debug_print(f"Skipping softlist '{current_softlist_name_from_xml}' due to --exclude-softlist.")
+        if current_softlist_name in exclude_softlist:
+            debug_print("Skipping softlist '%s' due to --exclude-softlist.", current_softlist_name)
             continue
 
         processed_softlists_count += 1
-        debug_print(f"- Processing softlist '{current_softlist_name_from_xml}' from -listsoftware XML.")
+        debug_print("- Processing softlist '%s'.", current_softlist_name)
 
-        required_compatibility_filter = machine_softlist_filters.get(current_softlist_name_from_xml)
+        required_compatibility_filter = machine_softlist_filters.get(current_softlist_name)
         
         if required_compatibility_filter:
-            debug_print(f"  Applying sharedfeat compatibility filter for '{current_softlist_name_from_xml}': '{required_compatibility_filter}'.")
+            debug_print("  Applying sharedfeat compatibility filter for '%s': '%s'.", current_softlist_name, required_compatibility_filter)
         else:
-            debug_print(f"  No specific sharedfeat compatibility filter found for '{current_softlist_name_from_xml}' from machine definition. Software from this list will NOT be sharedfeat-filtered.")
-
-        for sw in swlist_elem.findall("software"):
-            swid = sw.get("name", "")
-            desc = sw.findtext("description", default="").strip()
-            publisher = sw.findtext("publisher", default="N/A").strip()
-
-            is_compatible = True
-            if required_compatibility_filter:
-                compatibility_feat = sw.find('sharedfeat[@name="compatibility"]')
-                if compatibility_feat is not None: # Only perform check if the feature tag exists
-                    sharedfeat_values_str = compatibility_feat.get("value", "").upper()
-                    sharedfeat_values = [v.strip() for v in sharedfeat_values_str.split(',') if v.strip()]
-                    if required_compatibility_filter not in sharedfeat_values:
-                        is_compatible = False
-
-            if not is_compatible:
+            debug_print("  No specific sharedfeat compatibility filter found for '%s' from machine definition. Software from this list will NOT be sharedfeat-filtered.", current_softlist_name)
+
+        candidate_positions = _candidate_software_positions(current_softlist_name, records, search_lower)
+        candidate_records = records if candidate_positions is None else (records[position] for position in candidate_positions)
+
+        for swid, desc, publisher, compatibility in candidate_records:
+            # Only perform the check if the software has a compatibility feature tag
+            if required_compatibility_filter and compatibility is not None and required_compatibility_filter not in compatibility:
                 continue
 
-            if search.lower() in swid.lower() or search.lower() in desc.lower():
-                results.append((current_softlist_name_from_xml, system_name, swid, desc, publisher))
+            if search_lower in swid.lower() or search_lower in desc.lower():
+                results.append((current_softlist_name, system_name, swid, desc, publisher))
     
     if processed_softlists_count == 0:
-        debug_print(f"No softwarelist elements found in {TMP_SOFTWARE_XML_FILE}.")
+        debug_print("No software lists processed for '%s'.", system_name)
 
     return results
 
+
+def _applicable_softlists(machine_softlist_filters, include_softlist=None, exclude_softlist=None):
+    return [name for name in machine_softlist_filters
+            if not (include_softlist and name not in include_softlist) and not (exclude_softlist and name in exclude_softlist)]
+
+
+def select_software_from_cache(search="", system_name="", machine_softlist_filters=None, include_softlist=None, exclude_softlist=None):
+    """
+    Selects a machine's software from the records cached earlier in this run.
+    Returns None if any of the machine's applicable software lists has not been cached yet.
+    """
+    if not machine_softlist_filters:
+        return None
+    softlist_names = _applicable_softlists(machine_softlist_filters, include_softlist, exclude_softlist)
+    if any(name not in _SOFTLIST_RECORDS_CACHE for name in softlist_names):
+        return None
+    debug_print("All software lists for '%s' are already cached. Skipping -listsoftware.", system_name)
+    software_lists = [(name, _SOFTLIST_RECORDS_CACHE[name]) for name in softlist_names]
+    return _select_software_from_lists(software_lists, search, system_name, machine_softlist_filters, include_softlist, exclude_softlist)
+
+
+# === listsoftware Result Cache ===
+LISTSOFTWARE_CACHE_DIRNAME = "listsoftware_cache"
+LISTSOFTWARE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_MAME_BUILD_FINGERPRINTS = {}
+
+def get_mame_build_fingerprint():
+    """
+    Identifies the configured MAME build by executable path, size, mtime and `-version` output.
+    Returns a hex digest, or None if the executable does not exist. Computed once per build and run.
+    """
+    mame_exe_path = APP_CONFIG['mame_executable']
+    try:
+        stat = os.stat(mame_exe_path)
+    except OSError:
+        return None
+
+    exe_key = (os.path.abspath(mame_exe_path), stat.st_size, stat.st_mtime_ns)
+    if exe_key not in _MAME_BUILD_FINGERPRINTS:
+        try:
+            version_output = subprocess.run(
+                [mame_exe_path, "-version"],
+                capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=10
+            ).stdout.strip()
+        except Exception as e:
+            debug_print("Could not run MAME -version for the cache fingerprint: %s", e)
+            version_output = ""
+        _MAME_BUILD_FINGERPRINTS[exe_key] = hashlib.sha1(repr(exe_key + (version_output,)).encode("utf-8")).hexdigest()
+    return _MAME_BUILD_FINGERPRINTS[exe_key]
+
+
+def get_listsoftware_cache_dir():
+    return DATA_DIR / APP_CONFIG.get("mess_version", "") / LISTSOFTWARE_CACHE_DIRNAME
+
+
+def _listsoftware_cache_path(system_name, build_fingerprint):
+    key = hashlib.sha1(f"{build_fingerprint}:{system_name}".encode("utf-8")).hexdigest()[:16]
+    return get_listsoftware_cache_dir() / f"{system_name}-{key}.xml.gz"
+
+
+def get_listsoftware_output(system_name, build_fingerprint=None, refresh_cache=False):
+    """
+    Returns the output of `mame -listsoftware <system_name>`, served from the on-disk cache when the same
+    MAME build produced it before. Successful results are written back to the cache; failures are not cached.
+    """
+    if build_fingerprint is None:
+        return run_mame_capture(["-listsoftware", system_name])
+
+    cache_path = _listsoftware_cache_path(system_name, build_fingerprint)
+    if not refresh_cache and cache_path.exists():
+        try:
+            with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+                xml_text = f.read()
+            os.utime(cache_path)  # Mark as recently used for LRU eviction.
+            debug_print("Using cached -listsoftware output for '%s' from '%s'.", system_name, cache_path)
+            return xml_text
+        except (OSError, EOFError) as e:
+            log_message("warning", f"[WARNING] Ignoring unreadable cache file '{cache_path}': {e}")
+
+    xml_text = run_mame_capture(["-listsoftware", system_name])
+    if xml_text is None:
+        return None
+
+    temp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(cache_path.parent, exist_ok=True)
+        with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            f.write(xml_text)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        log_message("warning", f"[WARNING] Could not write cache file '{cache_path}': {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return xml_text
+
+
+def prune_listsoftware_cache(max_bytes=LISTSOFTWARE_CACHE_MAX_BYTES):
+    """Deletes the least recently used cache files until the cache directory is no larger than `max_bytes`."""
+    cache_dir = get_listsoftware_cache_dir()
+    if not cache_dir.is_dir():
+        return
+
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(".xml.gz"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in entries)
+    removed_count = 0
+    for _, size, path in sorted(entries):
+        if total_size <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError as e:
+            log_message("warning", f"[WARNING] Could not remove cache file '{path}': {e}")
+            continue
+        total_size -= size
+        removed_count += 1
+
+    if removed_count:
+        log_message("info", f"[INFO] Evicted {removed_count} old -listsoftware cache file(s) from '{cache_dir}'.")
+
+
+def prefetch_listsoftware_output(systems_with_filters, jobs, include_softlist=None, exclude_softlist=None, build_fingerprint=None, refresh_cache=False):
+    """
+    Runs `mame -listsoftware` for several systems at once on a pool of `jobs` worker threads.
+    `systems_with_filters` is an ordered list of (system_name, machine_softlist_filters) pairs. Systems whose
+    software lists are already cached, or will be cached by an earlier system in the list, are not run.
+    Results come from the on-disk cache when `build_fingerprint` is given (see get_listsoftware_output).
+    Returns (system_names, outputs): the systems that will be run, and an iterator of (system_name, xml_text or
+    None) in that order. At most 2 * `jobs` systems are running or waiting to be consumed at any time, so each
+    output can be parsed and released while MAME is still running for later systems.
+    """
+    systems_to_run = []
+    covered_softlists = set(_SOFTLIST_RECORDS_CACHE)
+    for system_name, machine_softlist_filters in systems_with_filters:
+        softlist_names = _applicable_softlists(machine_softlist_filters, include_softlist, exclude_softlist)
+        if machine_softlist_filters and all(name in covered_softlists for name in softlist_names):
+            continue
+        systems_to_run.append(system_name)
+        covered_softlists.update(machine_softlist_filters)
+
+    if not systems_to_run:
+        return set(), iter(())
+
+    log_message("info", f"[INFO] Running 'mame -listsoftware' for {len(systems_to_run)} systems with {jobs} parallel jobs...")
+    return set(systems_to_run), _iter_listsoftware_outputs(systems_to_run, jobs, build_fingerprint, refresh_cache)
+
+
+def _iter_listsoftware_outputs(system_names, jobs, build_fingerprint, refresh_cache):
+    """Yields (system_name, xml_text or None) in order, keeping a bounded window of `mame -listsoftware` runs in flight."""
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for system_name in system_names:
+            pending.append((system_name, executor.submit(get_listsoftware_output, system_name, build_fingerprint, refresh_cache)))
+            if len(pending) >= jobs * 2:
+                finished_name, future = pending.popleft()
+                yield finished_name, future.result()
+        while pending:
+            finished_name, future = pending.popleft()
+            yield finished_name, future.result()
+
+
+def parse_software_list_from_xml_text(xml_text, search="", system_name="", machine_softlist_filters=None, include_softlist=None, exclude_softlist=None):
+    """Parses the output of `mame -listsoftware <system>` and selects the machine's matching software."""
+    try:
+        root = parse_xml_string(xml_text)
+    except XML_PARSE_ERRORS as e:
+        log_message("error", f"[!] XML parse error in 'mame -listsoftware {system_name}' output: {e}")
+        return []
+
+    software_lists_elements = []
+    
+    if root.tag == "mame":
+        software_lists_elements = root.findall("softwarelist")
+    elif root.tag == "softwarelist":
+        software_lists_elements = [root]
+    elif root.tag == "softwarelists":
+        software_lists_elements = root.findall("softwarelist")
+    else:
+        log_message("error", f"[!] Unexpected XML root tag: {root.tag}. Expected 'mame', 'softwarelist', or 'softwarelists'.")
+        return []
+
+    software_lists = [(swlist_elem.get("name"), _get_software_list_records(swlist_elem))
+                      for swlist_elem in software_lists_elements if swlist_elem.get("name")]
+    return _select_software_from_lists(software_lists, search, system_name, machine_softlist_filters, include_softlist, exclude_softlist)
+
+
+def parse_software_lists_from_hash_dir(hash_dir, search="", system_name="", machine_softlist_filters=None, include_softlist=None, exclude_softlist=None):
+    """
+    Reads a machine's software lists straight from MAME's hash/<softlist>.xml files instead of running
+    `mame -listsoftware`. The machine's <softwarelist> entries (from mess.xml) decide which lists apply.
+    """
+    if machine_softlist_filters is None:
+        machine_softlist_filters = {}
+
+    software_lists = []
+    for softlist_name in _applicable_softlists(machine_softlist_filters, include_softlist, exclude_softlist):
+        records = load_software_list_records_from_hash_dir(hash_dir, softlist_name)
+        if records is None:
+            log_message("warning", f"[WARNING] Software list '{softlist_name}' for '{system_name}' not found or unreadable in '{hash_dir}'. Skipping.")
+            continue
+        software_lists.append((softlist_name, records))
+
+    return _select_software_from_lists(software_lists, search, system_name, machine_softlist_filters, include_softlist, exclude_softlist)
+
 def output_to_csv_file(headers, data, output_file_path):
     try:
         with open(output_file_path, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(headers)
             writer.writerows(data)
-        print(f"\n[SUCCESS] Data successfully written to '{output_file_path}'.")
+        log_message("info", f"\n[SUCCESS] Data successfully written to '{output_file_path}'.")
     except IOError as e:
-        print(f"[ERROR] Failed to write to CSV file '{output_file_path}': {e}")
+        log_message("error", f"[ERROR] Failed to write to CSV file '{output_file_path}': {e}")
 
 ### --- MODIFICATION START --- ###
 def output_to_yaml_file(input_systems, all_software_entries, platform_key, platform_name_full, platform_categories, media_type,
                          enable_custom_cmd_per_title, emu_name, default_emu, default_emu_cmd_params,
-                         output_file_path=None, softlist_configs_to_add=None, software_configs_to_add=None):
+                         output_file_path=None, softlist_configs_to_add=None, software_configs_to_add=None, yaml_data=None):
+    """
+    Builds the platform entry and writes it into the system-softlist YAML. When `yaml_data` (a dict of
+    staged platforms) is given, the entry is only stored in it and the caller is responsible for writing the file.
+    """
     if softlist_configs_to_add is None:
         softlist_configs_to_add = {}
 
@@ -523,7 +1592,7 @@ def output_to_yaml_file(input_systems, all_software_entries, platform_key, platf
             system_list_for_yaml.append({sys_name: system_details})
         else:
             system_list_for_yaml.append(sys_name)
-            print(f"[INFO] No detailed info (software_lists or software_id) for system '{sys_name}'. Will be listed as a simple string in YAML.")
+            log_message("item", "[INFO] No detailed info (software_lists or software_id) for system '%s'. Will be listed as a simple string in YAML.", sys_name)
 ### --- MODIFICATION END --- ###
 
     new_platform_entry = {
@@ -547,33 +1616,33 @@ def output_to_yaml_file(input_systems, all_software_entries, platform_key, platf
 
     new_platform_entry["system"] = system_list_for_yaml
 
+    if yaml_data is not None:
+        yaml_data[platform_key] = new_platform_entry
+        log_message("info", "[INFO] Platform '%s' generated with %d system(s).", platform_key, len(system_list_for_yaml))
+        return
+
     target_file = output_file_path or APP_CONFIG['system_softlist_yaml_file']
-    existing_data = _load_yaml_file(target_file)
-    existing_data[platform_key] = new_platform_entry
-    
+    log_flush()
     try:
-        with open(target_file, "w", encoding="utf-8") as f:
-            yaml.dump(existing_data, f, default_flow_style=False, sort_keys=False)
+        platform_texts = save_yaml_platforms(target_file, {platform_key: new_platform_entry})
         print(f"\nSuccessfully generated/updated '{target_file}' with platform '{platform_key}'.")
         print("\n--- Current YAML content for this platform ---")
-        print(yaml.dump({platform_key: new_platform_entry}, default_flow_style=False, sort_keys=False))
+        print(platform_texts[platform_key])
         print("---------------------------------------------")
     except Exception as e:
-        print(f"[ERROR] Failed to write YAML to '{target_file}': {e}")
+        log_message("error", f"[ERROR] Failed to write YAML to '{target_file}': {e}")
 
 
 def update_platform_metadata_only(platform_key, platform_name_full, platform_categories, media_type,
                                   enable_custom_cmd_per_title, emu_name, default_emu, default_emu_cmd_params,
                                   output_file_path, **kwargs):
     """Updates only the metadata of an existing platform entry in the YAML, leaving the system list untouched."""
-    print(f"[INFO] Starting metadata-only update for platform '{platform_key}' in '{output_file_path}'.")
+    log_message("info", f"[INFO] Starting metadata-only update for platform '{platform_key}' in '{output_file_path}'.")
     
-    existing_data = _load_yaml_file(output_file_path)
-    if platform_key not in existing_data:
-        print(f"[ERROR] Platform key '{platform_key}' not found in '{output_file_path}'. Cannot update metadata.")
+    platform_entry = read_yaml_platform(output_file_path, platform_key)
+    if not isinstance(platform_entry, dict):
+        log_message("error", f"[ERROR] Platform key '{platform_key}' not found in '{output_file_path}'. Cannot update metadata.")
         return
-        
-    platform_entry = existing_data[platform_key]
     
     # Update platform info
     platform_entry['platform'] = {'name': platform_name_full}
@@ -598,116 +1667,384 @@ def update_platform_metadata_only(platform_key, platform_name_full, platform_cat
         
     # Save the modified data back to the file
     try:
-        with open(output_file_path, "w", encoding="utf-8") as f:
-            yaml.dump(existing_data, f, default_flow_style=False, sort_keys=False)
-        print(f"[SUCCESS] Metadata for platform '{platform_key}' updated in '{output_file_path}'.")
+        save_yaml_platforms(output_file_path, {platform_key: platform_entry})
+        log_message("info", f"[SUCCESS] Metadata for platform '{platform_key}' updated in '{output_file_path}'.")
     except Exception as e:
-        print(f"[ERROR] Failed to save updated YAML: {e}")
+        log_message("error", f"[ERROR] Failed to save updated YAML: {e}")
 
 # === ROM Copying Functions ===
 
-def _copy_single_rom(softid, softlist_name_for_copy, system_name, platform_key, create_dummy=False, dry_run=False):
+# Sync manifest kept in the output ROM directory by 'copy-roms --sync': one record per output file,
+# (kind, source size, source mtime_ns, source sha1 or None), keyed by its path relative to the output directory.
+ROM_SYNC_MANIFEST_FILE = ".mess_curator_sync.pickle"
+ROM_SYNC_MANIFEST_VERSION = 1
+
+def _list_dir_files(dir_path):
+    """
+    Returns {file_name: (size, mtime_ns)} for the files in a directory (one listing call), or None if it does not exist.
+    Names are passed through os.path.normcase, so look them up the same way.
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            files = {}
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    files[os.path.normcase(entry.name)] = (stat.st_size, stat.st_mtime_ns)
+            return files
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+# Listings of the source ROM folders from the last scan, reused by --dry-run and 'missing-roms' while a
+# folder's modification time is unchanged: {folder path: (folder mtime_ns, {file_name: (size, mtime_ns)})}.
+ROM_INVENTORY_CACHE_FILE = DATA_DIR / "rom_source_inventory.pickle"
+ROM_INVENTORY_CACHE_VERSION = 1
+
+def scan_rom_source_inventory(softlist_names, use_cache=False, jobs=1):
+    """
+    Lists each softlist folder of the source ROM directory once and returns {softlist: {zip_name: (size, mtime_ns)}}
+    (names normcased), so ROM presence is checked in memory instead of with one stat per title.
+    With `use_cache`, folders whose modification time is unchanged since the last scan come from the inventory
+    cache. Folders are listed by up to `jobs` threads, which helps on network shares.
+    """
+    softlist_rom_dir = APP_CONFIG['softlist_rom_sources_dir']
+    cached = _read_pickle_cache(ROM_INVENTORY_CACHE_FILE)
+    cached_dirs = cached["dirs"] if isinstance(cached, dict) and cached.get("version") == ROM_INVENTORY_CACHE_VERSION else {}
+
+    def scan(softlist_name):
+        dir_path = os.path.abspath(os.path.join(softlist_rom_dir, softlist_name))
+        try:
+            dir_mtime_ns = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            return softlist_name, dir_path, None, {}, False
+        if use_cache and dir_path in cached_dirs and cached_dirs[dir_path][0] == dir_mtime_ns:
+            return softlist_name, dir_path, dir_mtime_ns, cached_dirs[dir_path][1], True
+        return softlist_name, dir_path, dir_mtime_ns, _list_dir_files(dir_path) or {}, False
+
+    softlist_names = sorted(softlist_names)
+    if jobs > 1 and len(softlist_names) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(scan, softlist_names))
+    else:
+        results = [scan(softlist_name) for softlist_name in softlist_names]
+
+    inventory = {}
+    from_cache = 0
+    for softlist_name, dir_path, dir_mtime_ns, files, was_cached in results:
+        inventory[softlist_name] = files
+        from_cache += was_cached
+        if dir_mtime_ns is None:
+            cached_dirs.pop(dir_path, None)
+        else:
+            cached_dirs[dir_path] = (dir_mtime_ns, files)
+    if from_cache < len(results):
+        _write_pickle_cache(ROM_INVENTORY_CACHE_FILE, {"version": ROM_INVENTORY_CACHE_VERSION, "dirs": cached_dirs})
+    log_message("info", f"[INFO] Source ROM inventory: {sum(len(files) for files in inventory.values())} zip(s) in {len(inventory)} softlist folder(s)"
+                f"{f' ({from_cache} folder(s) unchanged since the last scan)' if from_cache else ''}.")
+    return inventory
+
+def _platform_software_ids(platform_key, platform_data):
+    """Returns [software_id, softlist, system, platform_key] for every software ID of a platform in the YAML."""
+    rows = []
+    for system_entry in platform_data.get("system", []):
+        if not isinstance(system_entry, dict):
+            continue
+        for system_name, details in system_entry.items():
+            for softlist_detail in (details or {}).get("software_lists", []) or []:
+                softlist_name = softlist_detail.get("softlist_name")
+                for software_entry in softlist_detail.get("software_id", []) or []:
+                    swid = software_entry if isinstance(software_entry, str) else software_entry.get('id') if isinstance(software_entry, dict) else None
+                    if softlist_name and swid:
+                        rows.append([swid, softlist_name, system_name, platform_key])
+    return rows
+
+def _file_sha1(file_path):
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# How 'copy-roms' creates output files from source ROMs. 'auto' tries reflink, then hardlink, then copy, per file.
+ROM_LINK_MODES = ("copy", "hardlink", "symlink", "reflink", "auto")
+_AUTO_LINK_ORDER = ("reflink", "hardlink", "copy")
+_LINK_METHOD_VERBS = {"copy": "Copied", "hardlink": "Hardlinked", "symlink": "Symlinked", "reflink": "Reflinked", "auto": "Linked/Copied"}
+# (source dir, destination dir) -> link methods that failed there, so they are not retried for every file.
+# Cleared at the start of every copy run, as filesystems and mounts can change between runs of the GUI.
+_FAILED_LINK_METHODS = {}
+
+def _reflink_file(src_path, dst_path):
+    """Creates dst_path as a copy-on-write clone of src_path. Raises OSError where the filesystem cannot do it."""
+    if sys.platform.startswith("linux"):
+        import fcntl
+        FICLONE = 0x40049409
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    elif sys.platform == "darwin":
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if libc.clonefile(os.fsencode(src_path), os.fsencode(dst_path), 0) != 0:
+            error_code = ctypes.get_errno()
+            raise OSError(error_code, os.strerror(error_code), src_path)
+    else:
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported on this platform", src_path)
+    shutil.copystat(src_path, dst_path)
+
+def _output_temp_path(dst_path):
+    """
+    Returns the temporary name an output file is written under before it is moved into place. The name is
+    unique per process and thread, so parallel copy tasks writing the same output never share a temp file.
+    """
+    return f"{dst_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+def _place_rom_file(src_path, dst_path, method):
+    """
+    Creates dst_path from src_path with one method ('copy', 'hardlink', 'symlink' or 'reflink').
+    Copies and links are made under a temporary name and moved into place, so an existing output file is replaced
+    rather than written through (it may itself be a link to a source ROM or the placeholder template).
+    Raises OSError if the method fails.
+    """
+    temp_path = _output_temp_path(dst_path)
+    try:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+        if method == "copy":
+            shutil.copy2(src_path, temp_path)
+        elif method == "hardlink":
+            os.link(src_path, temp_path)
+        elif method == "symlink":
+            os.symlink(os.path.abspath(src_path), temp_path)
+        else:
+            _reflink_file(src_path, temp_path)
+        os.replace(temp_path, dst_path)
+    finally:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+
+def _link_or_copy_rom(src_path, dst_path, link_mode):
     """
-    Copies a single software ROM or creates a dummy zip if not found.
+    Creates the output file with `link_mode`, falling back to the next cheaper method (and finally a plain copy)
+    when a method fails for this file. Returns the method that was used.
+    """
+    methods = _AUTO_LINK_ORDER if link_mode == "auto" else (link_mode, "copy") if link_mode != "copy" else ("copy",)
+    failed_methods = _FAILED_LINK_METHODS.setdefault((os.path.dirname(src_path), os.path.dirname(dst_path)), set())
+    for method in methods:
+        if method != "copy" and method in failed_methods:
+            continue
+        try:
+            _place_rom_file(src_path, dst_path, method)
+            return method
+        except OSError as e:
+            if method == "copy":
+                raise
+            debug_print("%s failed for '%s' (%s); falling back.", method, dst_path, e)
+            failed_methods.add(method)
+    raise OSError(f"No method could create '{dst_path}'")
+
+def _sync_destination_is_current(sync, rel_path, dst_dir, file_name, record):
+    """Returns True if the output file exists and was made from the same source as `record` describes."""
+    dest_file = sync["dest_files"].get(dst_dir, {}).get(os.path.normcase(file_name))
+    if dest_file is None:
+        return False
+    previous = sync["previous"].get(rel_path)
+    if previous is None:
+        # Not synced before: keep placeholders, and copies that copy2 made from this exact source (same size and mtime).
+        return record[0] != "copy" or dest_file == (record[1], record[2])
+    if sync["checksum"]:
+        return (previous[0], previous[1], previous[3]) == (record[0], record[1], record[3])
+    return previous == record
+
+def _copy_single_rom(softid, softlist_name_for_copy, system_name, platform_key, create_dummy=False, dry_run=False, sync=None,
+                     link_mode="copy", placeholder_template=None, source_inventory=None):
+    """
+    Copies (or links, see `link_mode`) a single software ROM or creates a dummy zip if not found.
+    The destination directory must already exist. Returns (status, message, record, method): status is 'copied',
+    'placeholder' or 'up-to-date', record is the sync manifest entry for the output file and method is how a
+    copied file was created. The message is printed by the caller so copies running in parallel still report in order.
+    With `sync`, an output file made from an unchanged source is left alone. Placeholders are hardlinked to
+    `placeholder_template` when given. Source presence, size and mtime come from `source_inventory`
+    (see scan_rom_source_inventory) when given, otherwise from a stat of the source file.
     """
-    copied = 0
-    missing = 0
-    
     softlist_rom_dir = APP_CONFIG['softlist_rom_sources_dir']
     out_romset_dir = APP_CONFIG['out_romset_dir']
     
     rom_src_path = os.path.join(softlist_rom_dir, softlist_name_for_copy, f"{softid}.zip")
     rom_dst_dir = os.path.join(out_romset_dir, platform_key, system_name, softlist_name_for_copy)
     rom_dst_path = os.path.join(rom_dst_dir, f"{softid}.zip")
+    rel_path = f"{platform_key}/{system_name}/{softlist_name_for_copy}/{softid}.zip"
 
-    if not dry_run:
-        os.makedirs(rom_dst_dir, exist_ok=True)
+    src_stat = None
+    if not create_dummy:
+        if source_inventory is not None:
+            src_stat = source_inventory.get(softlist_name_for_copy, {}).get(os.path.normcase(f"{softid}.zip"))
+        else:
+            try:
+                stat = os.stat(rom_src_path)
+                src_stat = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                src_stat = None
 
     # If forced dummy creation is ON, OR if the source file doesn't exist, create a dummy.
-    if create_dummy or not os.path.exists(rom_src_path):
+    if src_stat is None:
+        record = ("placeholder", 0, 0, None)
+        if sync is not None and _sync_destination_is_current(sync, rel_path, rom_dst_dir, f"{softid}.zip", record):
+            return "up-to-date", f"[=] Up to date: {rom_dst_path}", record, None
         if create_dummy:
             # New message for when dummy creation is forced by the user flag.
-            print(f"[○] Placeholder (Dummy) Zip requested: Creating placeholder for {softid}.zip at {rom_dst_path}")
+            message = f"[○] Placeholder (Dummy) Zip requested: Creating placeholder for {softid}.zip at {rom_dst_path}"
         else:
             # This is the original "missing file" message.
-            print(f"[✗] Missing ROM: {softid}.zip from '{softlist_name_for_copy}'. Creating placeholder zip at {rom_dst_path}")
+            message = f"[✗] Missing ROM: {softid}.zip from '{softlist_name_for_copy}'. Creating placeholder zip at {rom_dst_path}"
         
-        _create_dummy_zip_for_rom(rom_dst_path, softid, dry_run=dry_run)
-        missing = 1 # We use the 'missing' counter to track all created dummies.
-    else:
-        # This block only runs if create_dummy is False AND the file exists.
-        try:
-            print(f"[✓] Copied ROM: {softid}.zip → {rom_dst_path}")
-            if not dry_run:
-                shutil.copy2(rom_src_path, rom_dst_path)
-            copied = 1
-        except Exception as e:
-            print(f"[ERROR] Failed to copy {softid}.zip from {rom_src_path} to {rom_dst_path}: {e}")
-            _create_dummy_zip_for_rom(rom_dst_path, softid)
-            missing = 1
-    
-    return copied, missing
+        _create_dummy_zip_for_rom(rom_dst_path, softid, dry_run=dry_run, template_path=placeholder_template)
+        return "placeholder", message, record, None
+
+    # This block only runs if create_dummy is False AND the file exists.
+    try:
+        sha1 = _file_sha1(rom_src_path) if sync is not None and sync["checksum"] else None
+        record = ("copy", src_stat[0], src_stat[1], sha1)
+        if sync is not None and _sync_destination_is_current(sync, rel_path, rom_dst_dir, f"{softid}.zip", record):
+            return "up-to-date", f"[=] Up to date: {rom_dst_path}", record, None
+        method = link_mode if dry_run else _link_or_copy_rom(rom_src_path, rom_dst_path, link_mode)
+        return "copied", f"[✓] {_LINK_METHOD_VERBS[method]} ROM: {softid}.zip → {rom_dst_path}", record, method
+    except Exception as e:
+        _create_dummy_zip_for_rom(rom_dst_path, softid, dry_run=dry_run, template_path=placeholder_template)
+        return "placeholder", f"[ERROR] Failed to copy {softid}.zip from {rom_src_path} to {rom_dst_path}: {e}", ("placeholder", 0, 0, None), None
+
+# An empty zip archive is only its 22-byte end-of-central-directory record, so every placeholder is written from
+# these bytes instead of building an archive with zipfile each time.
+EMPTY_ZIP_BYTES = b"PK\x05\x06" + bytes(18)
+PLACEHOLDER_TEMPLATE_FILE = ".placeholder_template.zip"
+
+def _write_placeholder_zip(zip_path, template_path=None):
+    """
+    Writes an empty placeholder zip, or hardlinks it to `template_path` when given (falling back to writing it).
+    An existing file is replaced rather than overwritten, as it may be a link to a source ROM.
+    """
+    if template_path:
+        failed_methods = _FAILED_LINK_METHODS.setdefault((os.path.dirname(template_path), os.path.dirname(zip_path)), set())
+        if "hardlink" not in failed_methods:
+            try:
+                try:
+                    os.link(template_path, zip_path)
+                except FileExistsError:
+                    _place_rom_file(template_path, zip_path, "hardlink")
+                return
+            except OSError as e:
+                debug_print("Could not hardlink placeholder '%s' (%s); writing it instead.", zip_path, e)
+                failed_methods.add("hardlink")
+    try:
+        fd = os.open(zip_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    except FileExistsError:
+        temp_path = _output_temp_path(zip_path)
+        with open(temp_path, "wb") as f:
+            f.write(EMPTY_ZIP_BYTES)
+        os.replace(temp_path, zip_path)
+        return
+    with os.fdopen(fd, "wb") as f:
+        f.write(EMPTY_ZIP_BYTES)
 
-def _create_dummy_zip_for_rom(zip_path, softid, dry_run=False):
+def _create_dummy_zip_for_rom(zip_path, softid, dry_run=False, template_path=None):
     """Creates an empty zip file for a specific software ID."""
     if not dry_run:
         try:
-            with zipfile.ZipFile(zip_path, 'w') as zipf:
-                pass
+            _write_placeholder_zip(zip_path, template_path)
         except Exception as e:
-            print(f"[ERROR] Failed to create dummy zip {softid}.zip at {zip_path}: {e}")
+            log_message("error", f"[ERROR] Failed to create dummy zip {softid}.zip at {zip_path}: {e}")
 
-def _create_dummy_zip_for_system(system_name, platform_key, dry_run=False):
-    """Creates an empty zip file for a standalone system (no software_id specified)."""
+def _create_dummy_zip_for_system(system_name, platform_key, dry_run=False, template_path=None):
+    """Creates an empty zip file for a standalone system (no software_id specified). The folder must already exist."""
     out_romset_dir = APP_CONFIG['out_romset_dir']
-    dst_dir = os.path.join(out_romset_dir, platform_key, system_name)
-    os.makedirs(dst_dir, exist_ok=True)
-    zip_path = os.path.join(dst_dir, f"{system_name}.zip")
+    zip_path = os.path.join(out_romset_dir, platform_key, system_name, f"{system_name}.zip")
 
-    print(f"[○] Created empty zip for standalone system: {zip_path}")
+    log_message("item", "[○] Created empty zip for standalone system: %s", zip_path)
 
     if not dry_run:
         try:
-            os.makedirs(dst_dir, exist_ok=True)
-            with zipfile.ZipFile(zip_path, 'w') as zipf:
-                pass
+            _write_placeholder_zip(zip_path, template_path)
             return 1
         except Exception as e:
-            print(f"[ERROR] Failed to create empty zip for system {system_name} at {zip_path}: {e}")
+            log_message("error", f"[ERROR] Failed to create empty zip for system {system_name} at {zip_path}: {e}")
             return 0
             
     return 1 # In a dry run, we simulate success
 
+def _prune_stale_rom_outputs(out_romset_dir, stale_rel_paths, dry_run=False):
+    """Deletes output files recorded by an earlier sync that are no longer referenced, then any folders left empty."""
+    removed = 0
+    emptied_dirs = set()
+    for rel_path in sorted(stale_rel_paths):
+        file_path = os.path.join(out_romset_dir, *rel_path.split("/"))
+        if not os.path.exists(file_path):
+            continue
+        log_message("item", "[-] Removing stale file: %s", file_path)
+        if not dry_run:
+            try:
+                os.remove(file_path)
+            except OSError as e:
+                log_message("error", f"[ERROR] Failed to remove '{file_path}': {e}")
+                continue
+            emptied_dirs.add(os.path.dirname(file_path))
+        removed += 1
+    # Deepest folders first, stopping at the output directory itself
+    out_root = os.path.normpath(out_romset_dir)
+    for dir_path in sorted(emptied_dirs, key=len, reverse=True):
+        while os.path.normpath(dir_path) != out_root and dir_path.startswith(out_root):
+            try:
+                os.rmdir(dir_path)
+            except OSError:
+                break
+            dir_path = os.path.dirname(dir_path)
+    return removed
+
 def perform_rom_copy_operation(args):
     """
     Parses the system_softlist.yml file and copies/creates ROM zips based on its content.
+    Each platform's destination folders are created once up front, then its ROMs are copied by up to
+    `args.jobs` threads; results are reported in YAML order.
+    With `args.sync`, a manifest in the output directory records the source of every output file, and files
+    whose source has not changed (size and mtime, or SHA1 with `args.checksum`) are skipped. `args.prune`
+    also deletes output files from earlier syncs that the YAML no longer references.
     """
+    dry_run = getattr(args, 'dry_run', False)
+    create_placeholder_zip = getattr(args, 'create_placeholder_zip', False)
+    platform_key_filter = getattr(args, 'platform_key', None)
+    jobs = max(1, getattr(args, 'jobs', 1) or 1)
+    prune = getattr(args, 'prune', False)
+    sync_mode = getattr(args, 'sync', False) or prune
+    checksum = getattr(args, 'checksum', False)
+    link_mode = getattr(args, 'link_mode', None) or "copy"
+    placeholder_hardlink = getattr(args, 'placeholder_hardlink', False)
+    refresh_inventory = getattr(args, 'refresh_inventory', False)
+    _FAILED_LINK_METHODS.clear()
+
     print(f"\n===== Starting ROM Copy Operation =====")
-    if args.dry_run:
+    if dry_run:
         print("********** DRY RUN MODE ENABLED **********")
         print("*** No files or directories will be created or modified. ***")
 
     print(f"Source MAME Softlist ROMs: {APP_CONFIG['softlist_rom_sources_dir']}")
     print(f"Destination Curated ROMset: {APP_CONFIG['out_romset_dir']}")
 
-    input_file = args.input_file or APP_CONFIG['system_softlist_yaml_file']
-    system_softlist_data = _load_yaml_file(input_file)
+    input_file = getattr(args, 'input_file', None) or APP_CONFIG['system_softlist_yaml_file']
+    system_softlist_data = load_platforms_yaml(input_file)
     
     if not system_softlist_data:
-        print(f"[ERROR] No data found in '{input_file}'. Nothing to copy.")
+        log_message("error", f"[ERROR] No data found in '{input_file}'. Nothing to copy.")
         return
     
     platforms_to_process = {}
-    if args.platform_key:
-        if args.platform_key in system_softlist_data:
-            print(f"[INFO] Filtering copy operation for platform key: '{args.platform_key}'")
-            platforms_to_process[args.platform_key] = system_softlist_data[args.platform_key]
+    if platform_key_filter:
+        if platform_key_filter in system_softlist_data:
+            log_message("info", f"[INFO] Filtering copy operation for platform key: '{platform_key_filter}'")
+            platforms_to_process[platform_key_filter] = system_softlist_data[platform_key_filter]
         else:
-            print(f"[ERROR] Platform key '{args.platform_key}' not found in '{input_file}'. Nothing to copy.")
+            log_message("error", f"[ERROR] Platform key '{platform_key_filter}' not found in '{input_file}'. Nothing to copy.")
             print(f"Available platforms are: {', '.join(system_softlist_data.keys())}")
             return
     else:
-        print("[INFO] No platform key specified. Processing all platforms.")
+        log_message("info", "[INFO] No platform key specified. Processing all platforms.")
         platforms_to_process = system_softlist_data    
 
     total_systems_processed = 0
@@ -715,29 +2052,106 @@ def perform_rom_copy_operation(args):
     total_software_missing = 0
     total_empty_system_zips = 0
     missing_roms_summary = [] # New list to track missing ROMs
+    total_up_to_date = 0
+    copy_methods_used = {}
+    created_dirs = set()
+
+    out_romset_dir = APP_CONFIG['out_romset_dir']
+    sync = None
+    sync_manifest = {}
+    if sync_mode:
+        manifest_path = os.path.join(out_romset_dir, ROM_SYNC_MANIFEST_FILE)
+        cached = _read_pickle_cache(manifest_path)
+        previous_files = cached["files"] if isinstance(cached, dict) and cached.get("version") == ROM_SYNC_MANIFEST_VERSION else {}
+        log_message("info", f"[INFO] Sync mode: {len(previous_files)} file(s) recorded by the last sync. Unchanged files are skipped.")
+        sync = {"previous": previous_files, "dest_files": {}, "checksum": checksum}
+        if platform_key_filter:
+            # Records of the other platforms are kept as they are.
+            sync_manifest = {rel_path: record for rel_path, record in previous_files.items()
+                             if rel_path.split("/", 1)[0] != platform_key_filter}
+
+    # Source presence is resolved from one listing per softlist folder rather than a stat per title.
+    software_rows = [row for platform_key, platform_data in platforms_to_process.items()
+                     for row in _platform_software_ids(platform_key, platform_data)]
+    source_inventory = None
+    if not create_placeholder_zip:
+        softlist_names = {row[1] for row in software_rows}
+        source_inventory = scan_rom_source_inventory(softlist_names, use_cache=dry_run and not refresh_inventory, jobs=jobs)
+
+    placeholder_template = None
+    if placeholder_hardlink and not dry_run:
+        # All placeholders become hardlinks to this one file, so a dummy set costs one directory entry per title.
+        placeholder_template = os.path.join(out_romset_dir, PLACEHOLDER_TEMPLATE_FILE)
+        try:
+            os.makedirs(out_romset_dir, exist_ok=True)
+            # Written under a temporary name and moved into place: the old template's inode is shared by the
+            # placeholders of earlier runs and must not be rewritten.
+            temp_path = f"{placeholder_template}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(EMPTY_ZIP_BYTES)
+            os.replace(temp_path, placeholder_template)
+        except OSError as e:
+            log_message("warning", f"[WARNING] Could not create placeholder template '{placeholder_template}': {e}. Placeholders will be written as separate files.")
+            placeholder_template = None
+
+    if jobs > 1:
+        log_message("info", f"[INFO] Copying with {jobs} parallel jobs.")
+    executor = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    progress_start("Copying ROMs", len(software_rows))
+
+    def ensure_dirs(dir_paths):
+        # Each destination folder is created once per run, not once per ROM. In sync mode existing folders are
+        # listed once instead, so up-to-date checks need no per-file stat on the destination.
+        for dir_path in sorted(set(dir_paths) - created_dirs):
+            existing_files = _list_dir_files(dir_path) if sync is not None else None
+            if existing_files is None and not dry_run:
+                os.makedirs(dir_path, exist_ok=True)
+            if sync is not None:
+                sync["dest_files"][dir_path] = existing_files or {}
+            created_dirs.add(dir_path)
+
+    def run_copy_task(task):
+        swid, softlist_name_for_copy, system_name, platform_key = task
+        return _copy_single_rom(swid, softlist_name_for_copy, system_name, platform_key, create_placeholder_zip, dry_run=dry_run, sync=sync,
+                                link_mode=link_mode, placeholder_template=placeholder_template, source_inventory=source_inventory)
+
+    def make_system_zip(system_name, platform_key):
+        dst_dir = os.path.join(out_romset_dir, platform_key, system_name)
+        ensure_dirs([dst_dir])
+        if sync is not None:
+            sync_manifest[f"{platform_key}/{system_name}/{system_name}.zip"] = ("system", 0, 0, None)
+            if os.path.normcase(f"{system_name}.zip") in sync["dest_files"][dst_dir]:
+                log_message("item", "[=] Up to date: %s", os.path.join(dst_dir, f"{system_name}.zip"))
+                return 0, 1
+        return _create_dummy_zip_for_system(system_name, platform_key, dry_run=dry_run, template_path=placeholder_template), 0
 
     for platform_key, platform_data in platforms_to_process.items():
         platform_name = platform_data.get("platform", {}).get("name", platform_key)
         media_type = platform_data.get("media_type", "unknown")
         systems_in_platform = platform_data.get("system", [])
 
-        print(f"\n[>>>] Processing Platform: '{platform_name}' (Key: '{platform_key}', Media: '{media_type}')")
+        log_message("info", "\n[>>>] Processing Platform: '%s' (Key: '%s', Media: '%s')", platform_name, platform_key, media_type)
+        copy_tasks = []
 
         for system_entry in systems_in_platform:
             total_systems_processed += 1
             if isinstance(system_entry, str):
                 system_name = system_entry
-                print(f"  [>] Processing standalone system: '{system_name}'")
-                total_empty_system_zips += _create_dummy_zip_for_system(system_name, platform_key, dry_run=args.dry_run)
+                log_message("item", "  [>] Processing standalone system: '%s'", system_name)
+                created, up_to_date = make_system_zip(system_name, platform_key)
+                total_empty_system_zips += created
+                total_up_to_date += up_to_date
             elif isinstance(system_entry, dict):
                 for system_name, details in system_entry.items():
-                    print(f"  [>] Processing system with details: '{system_name}'")
+                    log_message("item", "  [>] Processing system with details: '%s'", system_name)
                     
                     software_lists_for_system = details.get("software_lists", [])
                     
                     if not software_lists_for_system:
-                        print(f"  [INFO]   No 'software_lists' found in YAML for system '{system_name}'. Creating dummy zip for system.")
-                        total_empty_system_zips += _create_dummy_zip_for_system(system_name, platform_key)
+                        log_message("item", "  [INFO]   No 'software_lists' found in YAML for system '%s'. Creating dummy zip for system.", system_name)
+                        created, up_to_date = make_system_zip(system_name, platform_key)
+                        total_empty_system_zips += created
+                        total_up_to_date += up_to_date
                         continue
 
                     for softlist_detail in software_lists_for_system:
@@ -745,14 +2159,15 @@ def perform_rom_copy_operation(args):
                         software_ids_for_softlist = softlist_detail.get("software_id", [])
 
                         if not softlist_name_for_copy:
-                            print(f"[ERROR]   Softlist entry for '{system_name}' missing 'softlist_name'. Cannot copy ROMs for this entry.")
+                            log_message("error", "[ERROR]   Softlist entry for '%s' missing 'softlist_name'. Cannot copy ROMs for this entry.", system_name)
                             continue
 
                         if not software_ids_for_softlist:
-                            print(f"  [INFO]   No 'software_id's listed for softlist '{softlist_name_for_copy}' under system '{system_name}'. No ROMs to copy for this specific softlist.")
+                            log_message("item", "  [INFO]   No 'software_id's listed for softlist '%s' under system '%s'. No ROMs to copy for this specific softlist.",
+                                        softlist_name_for_copy, system_name)
                             continue
 
-                        print(f"  [INFO]   Copying ROMs from softlist '{softlist_name_for_copy}' for system '{system_name}'.")
+                        log_message("item", "  [INFO]   Copying ROMs from softlist '%s' for system '%s'.", softlist_name_for_copy, system_name)
                         
                         ### --- MODIFICATION START --- ###
                         # This loop now handles both simple strings and dictionaries in the `software_id` list.
@@ -764,38 +2179,278 @@ def perform_rom_copy_operation(args):
                                 swid = software_entry['id']
                             
                             if swid:
-                                copied, missing = _copy_single_rom(swid, softlist_name_for_copy, system_name, platform_key, args.create_placeholder_zip, dry_run=args.dry_run)
-                                total_software_copied += copied
-                                total_software_missing += missing
-                                if missing > 0:
-                                    missing_roms_summary.append([swid, softlist_name_for_copy, system_name, platform_key])
+                                copy_tasks.append((swid, softlist_name_for_copy, system_name, platform_key))
                             else:
-                                print(f"[WARNING]   Skipping invalid software entry in YAML for '{softlist_name_for_copy}': {software_entry}")
+                                log_message("warning", "[WARNING]   Skipping invalid software entry in YAML for '%s': %s", softlist_name_for_copy, software_entry)
                         ### --- MODIFICATION END --- ###
             else:
-                print(f"[WARNING] Invalid system entry type in YAML: {system_entry}. Skipping.")
+                log_message("warning", "[WARNING] Invalid system entry type in YAML: %s. Skipping.", system_entry)
+
+        # Copy this platform's ROMs, creating each destination folder once beforehand
+        ensure_dirs(os.path.join(out_romset_dir, platform_key, system_name, softlist_name_for_copy)
+                    for _, softlist_name_for_copy, system_name, _ in copy_tasks)
+        copy_results = executor.map(run_copy_task, copy_tasks) if executor else map(run_copy_task, copy_tasks)
+        for task, (status, message, record, method) in zip(copy_tasks, copy_results):
+            log_message("error" if message.startswith("[ERROR]") else "item", message)
+            progress_advance()
+            if status == "copied":
+                total_software_copied += 1
+                copy_methods_used[method] = copy_methods_used.get(method, 0) + 1
+            elif status == "placeholder":
+                total_software_missing += 1
+                missing_roms_summary.append(list(task))
+            else:
+                total_up_to_date += 1
+            if sync is not None:
+                swid, softlist_name_for_copy, system_name, _ = task
+                sync_manifest[f"{platform_key}/{system_name}/{softlist_name_for_copy}/{swid}.zip"] = record
+
+    if executor:
+        executor.shutdown()
+    progress_finish()
+
+    total_pruned = 0
+    if sync is not None:
+        if prune:
+            total_pruned = _prune_stale_rom_outputs(out_romset_dir, set(sync["previous"]) - set(sync_manifest), dry_run)
+        if not dry_run:
+            _write_pickle_cache(manifest_path, {"version": ROM_SYNC_MANIFEST_VERSION, "files": sync_manifest})
+        log_flush()
 
     print(f"\n===== ROM Copy Operation Summary =====")
     print(f"  Total Platforms Processed: {len(platforms_to_process)}")
     print(f"  Total Systems Processed: {total_systems_processed}")
     print(f"  Total Software ROMs Copied: {total_software_copied}")
+    if copy_methods_used:
+        print(f"    By Method: {', '.join(f'{method}: {count}' for method, count in sorted(copy_methods_used.items()))}")
     print(f"  Total Software ROMs Missing (Placeholder (Dummy) Zip Created): {total_software_missing}")
     print(f"  Total Empty System Zips Created: {total_empty_system_zips}")
+    if sync is not None:
+        print(f"  Total Files Up To Date (Skipped): {total_up_to_date}")
+        if prune:
+            print(f"  Total Stale Files Removed: {total_pruned}")
     print(f"======================================")
     
     if missing_roms_summary:
-        print("\n===== Missing ROMs Summary =====")
         headers = ["Software ID", "From Softlist", "For System", "In Platform"]
-        print(tabulate(sorted(missing_roms_summary), headers=headers, tablefmt="github"))
-        print(f"==============================")
+        log_message("summary", "\n===== Missing ROMs Summary =====\n%s\n==============================",
+                    tabulate(sorted(missing_roms_summary), headers=headers, tablefmt="github"))
+
+def report_missing_roms(args):
+    """
+    Lists the software IDs in system_softlist.yml whose zip is not in the source ROM directory, using the
+    source inventory (reused from the last scan for folders that have not changed) instead of copying anything.
+    """
+    input_file = args.input_file or APP_CONFIG['system_softlist_yaml_file']
+    system_softlist_data = load_platforms_yaml(input_file)
+    if not system_softlist_data:
+        log_message("error", f"[ERROR] No data found in '{input_file}'. Nothing to check.")
+        return
+    if args.platform_key:
+        if args.platform_key not in system_softlist_data:
+            log_message("error", f"[ERROR] Platform key '{args.platform_key}' not found in '{input_file}'.")
+            return
+        system_softlist_data = {args.platform_key: system_softlist_data[args.platform_key]}
+
+    print(f"Source MAME Softlist ROMs: {APP_CONFIG['softlist_rom_sources_dir']}")
+    software_rows = [row for platform_key, platform_data in system_softlist_data.items()
+                     for row in _platform_software_ids(platform_key, platform_data)]
+    inventory = scan_rom_source_inventory({row[1] for row in software_rows}, use_cache=not args.refresh_inventory, jobs=max(1, args.jobs))
+    missing_rows = sorted(row for row in software_rows if os.path.normcase(f"{row[0]}.zip") not in inventory.get(row[1], {}))
+
+    headers = ["Software ID", "From Softlist", "For System", "In Platform"]
+    if missing_rows:
+        if args.output_format == "csv":
+            output_to_csv_file(headers, missing_rows, args.output_file)
+        else:
+            print(tabulate(missing_rows, headers=headers, tablefmt="github"))
+    unique_missing = {(row[0], row[1]) for row in missing_rows}
+    print(f"\nTotal software entries: {len(software_rows)}")
+    print(f"Missing entries: {len(missing_rows)} ({len(unique_missing)} unique zip(s))")
+
+# === ROM Verification ===
+# Source zips are checked against the <rom> entries of their software list: every ROM with a CRC must be in the
+# zip (or, for a clone, in its parent's zip) with that CRC and size. CRCs come from the zip's central directory,
+# so no data is read unless SHA1 checking is asked for. Results are cached per zip by size and mtime.
+ROM_VERIFY_CACHE_FILE = DATA_DIR / "rom_verify_cache.pickle"
+ROM_VERIFY_CACHE_VERSION = 1
+
+def _load_softlist_rom_hashes(hash_dir, softlist_name):
+    """
+    Returns {software_id: (cloneof, roms)} for a softlist XML in MAME's hash directory, where roms is a tuple of
+    (name, size, crc, sha1) for every dumped ROM with a CRC. Returns None if the XML is missing or unreadable.
+    """
+    xml_path = os.path.join(hash_dir, f"{softlist_name}.xml")
+    if not os.path.exists(xml_path):
+        return None
+    try:
+        root = parse_xml_file(xml_path)
+    except XML_PARSE_ERRORS as e:
+        log_message("error", f"[ERROR] Could not parse softlist XML '{xml_path}': {e}")
+        return None
+    software_hashes = {}
+    for sw in root.iter("software"):
+        roms = []
+        for rom in sw.iter("rom"):
+            name, crc = rom.get("name"), rom.get("crc")
+            if not name or not crc or rom.get("status") == "nodump":
+                continue
+            size = rom.get("size")
+            roms.append((name, int(size, 0) if size else None, int(crc, 16), (rom.get("sha1") or "").lower() or None))
+        software_hashes[sw.get("name", "")] = (sw.get("cloneof"), tuple(roms))
+    return software_hashes
+
+def _zip_members_by_crc(zip_file):
+    return {info.CRC: info for info in zip_file.infolist() if not info.is_dir()}
+
+def _verify_rom_zip(task):
+    """
+    Checks one zip against its expected ROMs. Runs in a worker process.
+    `task` is (zip_path, parent_zip_path or None, roms, check_sha1). Returns (status, problems), where status is
+    'ok', 'bad' or 'unreadable'.
+    """
+    zip_path, parent_zip_path, roms, check_sha1 = task
+    try:
+        with zipfile.ZipFile(zip_path) as zip_file:
+            parent_file = zipfile.ZipFile(parent_zip_path) if parent_zip_path else None
+            try:
+                members = _zip_members_by_crc(zip_file)
+                parent_members = _zip_members_by_crc(parent_file) if parent_file else {}
+                problems = []
+                for name, size, crc, sha1 in roms:
+                    source, info = zip_file, members.get(crc)
+                    if info is None and crc in parent_members:
+                        source, info = parent_file, parent_members[crc]
+                    if info is None:
+                        problems.append(f"{name}: missing or bad CRC (expected {crc:08x})")
+                    elif size is not None and info.file_size != size:
+                        problems.append(f"{name}: wrong size {info.file_size} (expected {size})")
+                    elif check_sha1 and sha1:
+                        digest = hashlib.sha1()
+                        with source.open(info) as member:
+                            for chunk in iter(lambda: member.read(1024 * 1024), b""):
+                                digest.update(chunk)
+                        if digest.hexdigest() != sha1:
+                            problems.append(f"{name}: SHA1 mismatch")
+            finally:
+                if parent_file:
+                    parent_file.close()
+    except (zipfile.BadZipFile, OSError, zlib_error) as e:
+        return "unreadable", [str(e)]
+    return ("bad" if problems else "ok"), problems
+
+def verify_roms(args):
+    """
+    Verifies the source zips of the software in system_softlist.yml against the CRCs (and optionally SHA1s) in
+    MAME's software lists, using a process pool. Zips whose size and mtime are unchanged since they were last
+    verified are not opened again.
+    """
+    input_file = args.input_file or APP_CONFIG['system_softlist_yaml_file']
+    system_softlist_data = load_platforms_yaml(input_file)
+    if not system_softlist_data:
+        log_message("error", f"[ERROR] No data found in '{input_file}'. Nothing to verify.")
+        return
+    if args.platform_key:
+        if args.platform_key not in system_softlist_data:
+            log_message("error", f"[ERROR] Platform key '{args.platform_key}' not found in '{input_file}'.")
+            return
+        system_softlist_data = {args.platform_key: system_softlist_data[args.platform_key]}
+    hash_dir = get_mame_hash_dir()
+    if not hash_dir:
+        log_message("error", "[ERROR] MAME hash directory not found. Set it with 'config --set-mame-hash-dir <path>'.")
+        return
+
+    jobs = max(1, args.jobs or os.cpu_count() or 1)
+    softlist_rom_dir = APP_CONFIG['softlist_rom_sources_dir']
+    software_pairs = sorted({(row[1], row[0]) for platform_key, platform_data in system_softlist_data.items()
+                             for row in _platform_software_ids(platform_key, platform_data)})
+    softlist_names = {softlist_name for softlist_name, _ in software_pairs}
+    inventory = scan_rom_source_inventory(softlist_names, jobs=jobs)
+    rom_hashes = {softlist_name: _load_softlist_rom_hashes(hash_dir, softlist_name) for softlist_name in sorted(softlist_names)}
+
+    cached = _read_pickle_cache(ROM_VERIFY_CACHE_FILE)
+    verify_cache = cached["results"] if isinstance(cached, dict) and cached.get("version") == ROM_VERIFY_CACHE_VERSION else {}
+
+    results = {}
+    pending = []
+    for softlist_name, swid in software_pairs:
+        software = (rom_hashes[softlist_name] or {}).get(swid)
+        if software is None:
+            results[(softlist_name, swid)] = ("unknown", [f"not found in softlist '{softlist_name}'"])
+            continue
+        files = inventory.get(softlist_name, {})
+        file_info = files.get(os.path.normcase(f"{swid}.zip"))
+        if file_info is None:
+            results[(softlist_name, swid)] = ("missing", [])
+            continue
+        cloneof, roms = software
+        parent_info = files.get(os.path.normcase(f"{cloneof}.zip")) if cloneof else None
+        zip_path = os.path.join(softlist_rom_dir, softlist_name, f"{swid}.zip")
+        parent_zip_path = os.path.join(softlist_rom_dir, softlist_name, f"{cloneof}.zip") if parent_info else None
+        cache_key = (file_info, parent_info, hashlib.sha1(repr(roms).encode("utf-8")).hexdigest())
+        cached_result = verify_cache.get(zip_path)
+        # A SHA1-verified result also answers a CRC-only check, but not the other way round.
+        if cached_result and cached_result[0] == cache_key and (cached_result[1] or not args.sha1):
+            results[(softlist_name, swid)] = cached_result[2]
+            continue
+        pending.append(((softlist_name, swid), zip_path, cache_key, (zip_path, parent_zip_path, roms, args.sha1)))
+
+    log_message("info", f"[INFO] Verifying {len(pending)} zip(s) ({len(software_pairs) - len(pending)} answered from the verify cache or missing)"
+                f" with {'SHA1' if args.sha1 else 'CRC'} checks{f' using {jobs} processes' if jobs > 1 and len(pending) > 1 else ''}.")
+    tasks = [task for _, _, _, task in pending]
+    progress_start("Verifying zips", len(tasks))
+    outcomes = []
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for outcome in executor.map(_verify_rom_zip, tasks, chunksize=max(1, min(64, len(tasks) // (jobs * 4)))):
+                outcomes.append(outcome)
+                progress_advance()
+    else:
+        for task in tasks:
+            outcomes.append(_verify_rom_zip(task))
+            progress_advance()
+    progress_finish()
+    for (result_key, zip_path, cache_key, _), outcome in zip(pending, outcomes):
+        results[result_key] = outcome
+        if outcome[0] != "unreadable":
+            verify_cache[zip_path] = (cache_key, args.sha1, outcome)
+    if pending:
+        _write_pickle_cache(ROM_VERIFY_CACHE_FILE, {"version": ROM_VERIFY_CACHE_VERSION, "results": verify_cache})
+
+    problem_rows = [[swid, softlist_name, status, "; ".join(problems)]
+                    for (softlist_name, swid), (status, problems) in sorted(results.items(), key=lambda item: (item[0][1], item[0][0]))
+                    if status != "ok" and (status != "missing" or args.show_missing)]
+    headers = ["Software ID", "Softlist", "Status", "Details"]
+    if problem_rows:
+        if args.output_format == "csv":
+            output_to_csv_file(headers, problem_rows, args.output_file)
+        else:
+            print(tabulate(problem_rows, headers=headers, tablefmt="github"))
+
+    status_counts = {}
+    for status, _ in results.values():
+        status_counts[status] = status_counts.get(status, 0) + 1
+    print(f"\n===== ROM Verification Summary =====")
+    print(f"  Total Software Checked: {len(results)}")
+    print(f"  Good: {status_counts.get('ok', 0)}")
+    print(f"  Bad (wrong or missing ROMs): {status_counts.get('bad', 0)}")
+    print(f"  Unreadable Zips: {status_counts.get('unreadable', 0)}")
+    print(f"  Zip Not Found: {status_counts.get('missing', 0)}")
+    print(f"  Not In Software List: {status_counts.get('unknown', 0)}")
+    print(f"====================================")
 
 def perform_mame_search_and_output(systems_to_process, search_term, output_format, platform_key, platform_name_full, platform_categories, media_type, 
                                    enable_custom_cmd_per_title, emu_name, default_emu, default_emu_cmd_params, 
                                    output_file_path, driver_status_filter=None, emulation_status_filter=None, 
-                                   show_systems_only=False, show_extra_info=False, source_xml_root=None, sort_by=None, search_mode=None,
-                                   include_softlist=None, exclude_softlist=None, softlist_configs_to_add=None, software_configs_to_add=None):
+                                   show_systems_only=False, show_extra_info=False, sort_by=None, search_mode=None,
+                                   include_softlist=None, exclude_softlist=None, softlist_configs_to_add=None, software_configs_to_add=None,
+                                   machine_catalog=None, softlist_source="auto", jobs=1, refresh_cache=False, yaml_data=None):
     """
     Performs the MAME listsoftware search and outputs results as table or YAML.
+    Machine details come from `machine_catalog` (see load_machine_catalog).
+    Software lists are read from MAME's hash directory when `softlist_source` is 'hash' (or 'auto' and the
+    directory exists); otherwise `mame -listsoftware` is run for each system, up to `jobs` at a time, and its
+    output is cached on disk per MAME build (`refresh_cache` ignores and rewrites the cached results).
     """
     if include_softlist is None:
         include_softlist = []    
@@ -806,20 +2461,58 @@ def perform_mame_search_and_output(systems_to_process, search_term, output_forma
     processed_system_info = {} 
 
     if not systems_to_process:
-        print("[ERROR] No systems were determined for processing. Please check your arguments.")
+        log_message("error", "[ERROR] No systems were determined for processing. Please check your arguments.")
         sys.exit(1)
+    if machine_catalog is None:
+        log_message("error", "[ERROR] No machine catalog was loaded. Cannot look up the systems to process.")
+        return
+
+    hash_dir = get_mame_hash_dir() if softlist_source in ("auto", "hash") else None
+    if hash_dir:
+        log_message("info", f"[INFO] Reading software lists directly from MAME hash directory '{hash_dir}'.")
+    elif softlist_source == "hash":
+        log_message("error", "[ERROR] MAME hash directory not found. Set it with 'config --set-mame-hash-dir <path>' or use '--softlist-source mame'.")
+        return
+
+    machine_details = {}
+    for current_system in systems_to_process:
+        machine_details[current_system] = get_machine_details_and_filters_from_catalog(current_system, machine_catalog)
+
+    build_fingerprint = None
+    if not hash_dir:
+        build_fingerprint = get_mame_build_fingerprint()
+        if refresh_cache:
+            log_message("info", "[INFO] Refreshing cached 'mame -listsoftware' results.")
+    if hash_dir:
+        use_softlist_records_source(("hash", os.path.abspath(hash_dir)))
+    else:
+        use_softlist_records_source(("mame", APP_CONFIG['mame_executable'], build_fingerprint))
+
+    prefetched_systems, prefetched_outputs = set(), iter(())
+    if not hash_dir and jobs > 1:
+        prefetched_systems, prefetched_outputs = prefetch_listsoftware_output(
+            [(system_name, machine_softlist_filters)
+             for system_name, (machine_softlist_filters, machine_metadata) in machine_details.items()
+             if not (driver_status_filter and machine_metadata["status"] != driver_status_filter)
+             and not (emulation_status_filter and machine_metadata["emulation"] != emulation_status_filter)],
+            jobs, include_softlist, exclude_softlist, build_fingerprint, refresh_cache
+        )
 
     total_systems = len(systems_to_process)
+    progress_start("Searching systems", total_systems)
     for i, current_system in enumerate(systems_to_process, 1):
-        print(f"\n--- Processing system: ({i}/{total_systems}) {current_system} ---")
+        progress_advance()
+        log_message("item", "\n--- Processing system: (%d/%d) %s ---", i, total_systems, current_system)
         
-        machine_softlist_filters, machine_metadata = get_machine_details_and_filters_from_root(current_system, source_xml_root)
+        machine_softlist_filters, machine_metadata = machine_details[current_system]
         
         if driver_status_filter and machine_metadata["status"] != driver_status_filter:
-            print(f"[INFO] Skipping system '{current_system}': Driver status '{machine_metadata['status']}' does not match required '{driver_status_filter}'.")
+            log_message("item", "[INFO] Skipping system '%s': Driver status '%s' does not match required '%s'.",
+                        current_system, machine_metadata['status'], driver_status_filter)
             continue
         if emulation_status_filter and machine_metadata["emulation"] != emulation_status_filter:
-            print(f"[INFO] Skipping system '{current_system}': Emulation status '{machine_metadata['emulation']}' does not match required '{emulation_status_filter}'.")
+            log_message("item", "[INFO] Skipping system '%s': Emulation status '%s' does not match required '%s'.",
+                        current_system, machine_metadata['emulation'], emulation_status_filter)
             continue
         
         processed_system_info[current_system] = {
@@ -827,11 +2520,47 @@ def perform_mame_search_and_output(systems_to_process, search_term, output_forma
             'software_entries': []
         }
 
-        listsoftware_succeeded = run_mame_command(["-listsoftware", current_system], TMP_SOFTWARE_XML_FILE)
+        if hash_dir:
+            entries_from_parse_func = parse_software_lists_from_hash_dir(
+                hash_dir,
+                search=search_term,
+                system_name=current_system,
+                machine_softlist_filters=machine_softlist_filters,
+                include_softlist=include_softlist,
+                exclude_softlist=exclude_softlist
+            )
+            if entries_from_parse_func:
+                processed_system_info[current_system]['software_entries'].extend(entries_from_parse_func)
+            else:
+                log_message("item", "[INFO] No software entries found/matched for system '%s' after parsing and filtering.", current_system)
+            continue
+
+        cached_entries = select_software_from_cache(
+            search=search_term,
+            system_name=current_system,
+            machine_softlist_filters=machine_softlist_filters,
+            include_softlist=include_softlist,
+            exclude_softlist=exclude_softlist
+        )
+        if cached_entries is not None:
+            if cached_entries:
+                processed_system_info[current_system]['software_entries'].extend(cached_entries)
+            else:
+                log_message("item", "[INFO] No software entries found/matched for system '%s' after parsing and filtering.", current_system)
+            continue
+
+        if current_system in prefetched_systems:
+            # Outputs of earlier systems that were answered from the cache instead are skipped.
+            for prefetched_system, listsoftware_output in prefetched_outputs:
+                if prefetched_system == current_system:
+                    break
+        else:
+            listsoftware_output = get_listsoftware_output(current_system, build_fingerprint, refresh_cache)
 
         entries_from_parse_func = []
-        if listsoftware_succeeded:
-            entries_from_parse_func = parse_software_list_from_file(
+        if listsoftware_output is not None:
+            entries_from_parse_func = parse_software_list_from_xml_text(
+                listsoftware_output,
                 search=search_term,
                 system_name=current_system,
                 machine_softlist_filters=machine_softlist_filters,
@@ -841,13 +2570,16 @@ def perform_mame_search_and_output(systems_to_process, search_term, output_forma
             if entries_from_parse_func:
                 processed_system_info[current_system]['software_entries'].extend(entries_from_parse_func)
             else:
-                print(f"[INFO] No software entries found/matched for system '{current_system}' after parsing and filtering.")
+                log_message("item", "[INFO] No software entries found/matched for system '%s' after parsing and filtering.", current_system)
         else:
-            print(f"[INFO] MAME did not provide software list for '{current_system}' or command failed. It will be represented in the table and YAML.")
+            log_message("item", "[INFO] MAME did not provide software list for '%s' or command failed. It will be represented in the table and YAML.", current_system)
 
-        if os.path.exists(TMP_SOFTWARE_XML_FILE):
-            os.remove(TMP_SOFTWARE_XML_FILE)
+    progress_finish()
+    if hasattr(prefetched_outputs, "close"):
+        prefetched_outputs.close()
 
+    if build_fingerprint is not None:
+        prune_listsoftware_cache()
 
     print("\n--- Finished processing all systems ---")
 
@@ -929,14 +2661,14 @@ def perform_mame_search_and_output(systems_to_process, search_term, output_forma
                     if header_to_find in headers:
                         sort_index = headers.index(header_to_find)
                         table_display_data.sort(key=lambda row: str(row[sort_index]).lower())
-                        print(f"\n[INFO] Table sorted by '{sort_key}'.")
+                        log_message("info", f"\n[INFO] Table sorted by '{sort_key}'.")
                     else:
-                        print(f"\n[WARNING] Cannot sort by '{sort_key}'. Column not visible in current view.")
+                        log_message("warning", f"\n[WARNING] Cannot sort by '{sort_key}'. Column not visible in current view.")
                 else:
-                    print(f"\n[WARNING] Invalid sort key '{sort_by}'.")
+                    log_message("warning", f"\n[WARNING] Invalid sort key '{sort_by}'.")
 
             if not table_display_data:
-                print("[i] No matching software items found for table display after all filters.")
+                log_message("info", "[i] No matching software items found for table display after all filters.")
                 return
             
             if output_format == "table":
@@ -959,11 +2691,12 @@ def perform_mame_search_and_output(systems_to_process, search_term, output_forma
                 default_emu_cmd_params=default_emu_cmd_params,
                 output_file_path=output_file_path,
                 softlist_configs_to_add=softlist_configs_to_add,
-                software_configs_to_add=software_configs_to_add
+                software_configs_to_add=software_configs_to_add,
+                yaml_data=yaml_data
             )
     else:
-        print(f"[i] No systems found for output after initial filtering or no matching software items found across any specified systems "
-              f"with search term '{search_term}'." if search_term else "[i] No systems or matching software items found.")
+        log_message("info", f"[i] No systems found for output after initial filtering or no matching software items found across any specified systems "
+                    f"with search term '{search_term}'." if search_term else "[i] No systems or matching software items found.")
 
 def parse_mess_ini_machines(ini_path):
     """
@@ -971,7 +2704,7 @@ def parse_mess_ini_machines(ini_path):
     """
     machines = set()
     if not os.path.exists(ini_path):
-        print(f"[ERROR] MESS.ini file not found at '{ini_path}'. Cannot filter by MESS.ini.")
+        log_message("error", f"[ERROR] MESS.ini file not found at '{ini_path}'. Cannot filter by MESS.ini.")
         return machines
 
     try:
@@ -987,95 +2720,98 @@ def parse_mess_ini_machines(ini_path):
                 
                 if in_root_folder_section and line and not line.startswith(';'):
                     machines.add(line.split(';')[0].strip())
-        print(f"[INFO] Loaded {len(machines)} machines from '{ini_path}'.")
+        log_message("info", f"[INFO] Loaded {len(machines)} machines from '{ini_path}'.")
     except Exception as e:
-        print(f"[ERROR] Error parsing MESS.ini file '{ini_path}': {e}")
+        log_message("error", f"[ERROR] Error parsing MESS.ini file '{ini_path}': {e}")
     return machines
 
-def split_mame_xml_by_ini(mess_ini_path, full_mame_xml_path, output_mess_xml_file):
+MAME_ROOT_ATTRIBUTES = ['build', 'debug', 'emulator', 'mameconfig']
+
+def split_mame_xml_streaming(full_mame_xml_source, mess_machines, output_mess_xml_file, softlist_output_file, nosoftlist_output_file):
     """
-    Filters the full mame -listxml output by machines listed in MESS.ini.
+    Splits a full `mame -listxml` document in a single streaming pass.
+    Machines listed in MESS.ini are written to mess.xml and, at the same time, to either mess-softlist.xml or
+    mess-nosoftlist.xml depending on whether they declare a <softwarelist>. Each machine element is discarded
+    as soon as it is written, so memory use stays flat regardless of the input size.
+    `full_mame_xml_source` can be a file path or a binary file object.
     """
-    print("=== Processing Phase 1/2: Filtering mame.xml by MESS.ini entries ===")
-    
-    mess_machines_from_ini = parse_mess_ini_machines(mess_ini_path)
-    if not mess_machines_from_ini:
-        return False
+    print("=== Splitting mame.xml by MESS.ini entries and softwarelist capability ===")
 
-    print(f"[INFO] Fetching full MAME machine list ('{full_mame_xml_path}')... This may take a moment.")
-    full_mame_root = get_parsed_mame_xml_root(full_mame_xml_path)
-    if full_mame_root is None:
-        return False
+    output_files = {"mess": output_mess_xml_file, "softlist": softlist_output_file, "nosoftlist": nosoftlist_output_file}
+    written_counts = dict.fromkeys(output_files, 0)
+    writers = {}
+    total_machines = 0
+
+    def open_writers(root_attributes):
+        mame_attributes = "".join(f" {attr}={quoteattr(root_attributes[attr])}" for attr in MAME_ROOT_ATTRIBUTES if attr in root_attributes)
+        for key, output_file in output_files.items():
+            writer = open(f"{output_file}.tmp", "w", encoding="utf-8", buffering=1024 * 1024)
+            writer.write(f"<?xml version='1.0' encoding='utf-8'?>\n<mame{mame_attributes}>\n")
+            writers[key] = writer
 
-    filtered_machines_count = 0
     try:
-        filtered_root = ET.Element("mame")
-        for attr in ['build', 'debug', 'emulator', 'mameconfig']:
-            if full_mame_root.get(attr) is not None:
-                filtered_root.set(attr, full_mame_root.get(attr))
-
-        for machine_element in full_mame_root.findall("machine"):
-            machine_name = machine_element.get("name")
-            if machine_name in mess_machines_from_ini:
-                filtered_root.append(machine_element)
-                filtered_machines_count += 1
-        
-        filtered_tree = ET.ElementTree(filtered_root)
-        filtered_tree.write(output_mess_xml_file, encoding="utf-8", xml_declaration=True)
-        
-        print(f"[INFO] Phase 1 complete: Filtered {filtered_machines_count} machines into '{output_mess_xml_file}'.")
+        for elem in iterparse_top_level_elements(full_mame_xml_source, "machine", on_root=open_writers):
+            total_machines += 1
+            if elem.get("name") in mess_machines:
+                machine_xml = f"\t{xml_element_to_string(elem)}\n"
+                capability_key = "softlist" if elem.find("softwarelist") is not None else "nosoftlist"
+                for key in ("mess", capability_key):
+                    writers[key].write(machine_xml)
+                    written_counts[key] += 1
+
+        if not writers:
+            log_message("error", "[ERROR] The source XML does not contain a root element.")
+            return False
+
+        for key, writer in writers.items():
+            writer.write("</mame>\n")
+            writer.close()
+            os.replace(f"{output_files[key]}.tmp", output_files[key])
+        writers.clear()
+
+        log_message("info", f"[INFO] Scanned {total_machines} machines from the full MAME XML.")
+        log_message("info", f"[INFO] Written {written_counts['mess']} MESS.ini machines to '{output_mess_xml_file}'.")
+        log_message("info", f"[INFO] Written {written_counts['softlist']} softlist-capable machines to '{softlist_output_file}'.")
+        log_message("info", f"[INFO] Written {written_counts['nosoftlist']} non-softlist-capable machines to '{nosoftlist_output_file}'.")
         return True
 
+    except XML_PARSE_ERRORS as pe:
+        log_message("error", f"[ERROR] XML parse error while splitting: {pe}. The source XML might be corrupted or truncated.")
     except Exception as e:
-        print(f"[ERROR] Unexpected error during Phase 1: {e}")
+        log_message("error", f"[ERROR] Unexpected error while splitting: {e}")
+    finally:
+        for key, writer in writers.items():
+            writer.close()
+            if os.path.exists(f"{output_files[key]}.tmp"):
+                os.remove(f"{output_files[key]}.tmp")
     return False
 
-def split_mess_xml_by_softwarelist(input_mess_xml_file, softlist_output_file, nosoftlist_output_file):
+def split_mame_xml_from_mame_exe(mess_machines, output_mess_xml_file, softlist_output_file, nosoftlist_output_file):
     """
-    Splits an XML file into two new XML files based on softwarelist capability.
+    Pipes `mame -listxml` straight into split_mame_xml_streaming(), so the full XML never exists
+    as a Python string or as a temporary file on disk.
     """
-    print("=== Processing Phase 2/2: Splitting mess.xml by softwarelist capability ===")
-    
-    mess_root = get_parsed_mame_xml_root(input_mess_xml_file)
-    if mess_root is None:
+    process = start_mame_process(["-listxml"])
+    if process is None:
         return False
 
-    softlist_count = 0
-    nosoftlist_count = 0
-
-    softlist_root = ET.Element("mame")
-    nosoftlist_root = ET.Element("mame")
-
-    try:
-        for attr in ['build', 'debug', 'emulator', 'mameconfig']:
-            if mess_root.get(attr) is not None:
-                softlist_root.set(attr, mess_root.get(attr))
-                nosoftlist_root.set(attr, mess_root.get(attr))
-
-        for machine_element in mess_root.findall("machine"):
-            if machine_element.find("softwarelist") is not None:
-                softlist_root.append(machine_element)
-                softlist_count += 1
-            else:
-                nosoftlist_root.append(machine_element)
-                nosoftlist_count += 1
-        
-        ET.ElementTree(softlist_root).write(softlist_output_file, encoding="utf-8", xml_declaration=True)
-        print(f"[INFO] Phase 2 complete: Written {softlist_count} softlist-capable machines to '{softlist_output_file}'.")
-
-        ET.ElementTree(nosoftlist_root).write(nosoftlist_output_file, encoding="utf-8", xml_declaration=True)
-        print(f"[INFO] Phase 2 complete: Written {nosoftlist_count} non-softlist-capable machines to '{nosoftlist_output_file}'.")
-        
-        return True
+    with process, process.stderr_file:
+        split_succeeded = split_mame_xml_streaming(process.stdout, mess_machines,
+                                                   output_mess_xml_file, softlist_output_file, nosoftlist_output_file)
+        if not split_succeeded:
+            process.kill()
+        return_code = process.wait()
 
-    except Exception as e:
-        print(f"[ERROR] Unexpected error during Phase 2: {e}")
-    return False
+        if return_code != 0:
+            process.stderr_file.seek(0)
+            stderr_output = process.stderr_file.read().decode("utf-8", errors="replace").strip()
+            log_message("error", f"[!] MAME exited with error code {return_code}." + (f" Output:\n{stderr_output[:500]}" if stderr_output else ""))
+    return split_succeeded
 
 def run_split_command(args):
     """Orchestrates the splitting of mame.xml based on mess.ini."""
     if not APP_CONFIG.get("mess_version"):
-        print("[ERROR] MAME version is not set. Please run 'config --set-mess-version <num>' first.")
+        log_message("error", "[ERROR] MAME version is not set. Please run 'config --set-mess-version <num>' first.")
         return
 
     version = APP_CONFIG["mess_version"]
@@ -1089,80 +2825,59 @@ def run_split_command(args):
     
     mess_ini_path = args.mess_ini or APP_CONFIG.get('mess_ini_path')
     if not mess_ini_path or not os.path.exists(mess_ini_path):
-        print(f"[ERROR] mess.ini path is not configured or not found. Cannot run split.")
+        log_message("error", f"[ERROR] mess.ini path is not configured or not found. Cannot run split.")
+        return
+
+    mess_machines_from_ini = parse_mess_ini_machines(mess_ini_path)
+    if not mess_machines_from_ini:
+        log_message("error", "[ERROR] No machines found in MESS.ini. Aborting splitting process.")
         return
 
-    # --- NEW LOGIC FOR DETERMINING SOURCE XML ---
-    full_mame_xml_source_path = None
-    cleanup_temp_xml = False
-    
     if args.input_xml:
         if not os.path.exists(args.input_xml):
-            print(f"[ERROR] The specified --input-xml file does not exist: {args.input_xml}")
+            log_message("error", f"[ERROR] The specified --input-xml file does not exist: {args.input_xml}")
             return
-        full_mame_xml_source_path = args.input_xml
-        print(f"[INFO] Using provided XML file as source: {full_mame_xml_source_path}")
-    
+        log_message("info", f"[INFO] Using provided XML file as source: {args.input_xml}")
+        split_succeeded = split_mame_xml_streaming(args.input_xml, mess_machines_from_ini,
+                                                   mess_xml_output_file, mess_softlist_xml_file, mess_nosoftlist_xml_file)
     elif args.from_mame_exe:
-        print("[INFO] Generating a fresh 'mame.xml' from the configured MAME executable...")
-        # Define a temporary path for the generated file
-        temp_xml_path = DATA_DIR / "mame-temp.xml"
-        if run_mame_command(["-listxml"], temp_xml_path, use_cache=False):
-            full_mame_xml_source_path = temp_xml_path
-            cleanup_temp_xml = True # Mark this file for deletion after the process
-        else:
-            print("[ERROR] Failed to generate mame.xml from the MAME executable. Aborting split.")
-            return
-
-    if not full_mame_xml_source_path:
-        print("[ERROR] Could not determine the source for the full MAME XML. Aborting.")
-        return
-    # --- END NEW LOGIC ---
-
-    if not split_mame_xml_by_ini(mess_ini_path, full_mame_xml_source_path, mess_xml_output_file):
-        print("[ERROR] Phase 1 failed. Aborting splitting process.")
-        if cleanup_temp_xml and os.path.exists(full_mame_xml_source_path):
-            os.remove(full_mame_xml_source_path)
+        log_message("info", "[INFO] Streaming 'mame -listxml' from the configured MAME executable directly into the split...")
+        split_succeeded = split_mame_xml_from_mame_exe(mess_machines_from_ini,
+                                                       mess_xml_output_file, mess_softlist_xml_file, mess_nosoftlist_xml_file)
+    else:
+        log_message("error", "[ERROR] Could not determine the source for the full MAME XML. Aborting.")
         return
 
-    if not split_mess_xml_by_softwarelist(mess_xml_output_file, mess_softlist_xml_file, mess_nosoftlist_xml_file):
-        print("[ERROR] Phase 2 failed. Aborting splitting process.")
-        if cleanup_temp_xml and os.path.exists(full_mame_xml_source_path):
-            os.remove(full_mame_xml_source_path)
+    if not split_succeeded:
+        log_message("error", "[ERROR] Splitting failed. Existing output files were left untouched.")
         return
     
     print("\n=== Splitting process complete! ===")
     print(f"All output files have been saved in: '{version_dir}'")
-    # ... (rest of the print statements) ...
-    
-    # Clean up the large temporary mame.xml if it was generated
-    if cleanup_temp_xml and os.path.exists(full_mame_xml_source_path):
-        os.remove(full_mame_xml_source_path)
-        print(f"\n[INFO] Cleaned up temporary file: '{full_mame_xml_source_path}'")
 
-def display_yaml_table(args, source_xml_root):
+def display_yaml_table(args, machine_catalog):
     """
     Parses the system_softlist.yml file and displays its content in a detailed table format.
     """
     input_file = args.input_file or APP_CONFIG['system_softlist_yaml_file']
     print(f"\n===== Displaying Platforms from '{input_file}' in Table Format =====")
     
-    system_softlist_data = _load_yaml_file(input_file)
+    system_softlist_data = load_platforms_yaml(input_file)
     if not system_softlist_data:
-        print(f"[ERROR] No data found in '{input_file}'. Nothing to display.")
+        log_message("error", f"[ERROR] No data found in '{input_file}'. Nothing to display.")
         return
 
     platforms_to_process  = {}
     if args.platform_key:
         if args.platform_key in system_softlist_data:
-            print(f"[INFO] Filtering copy operation for platform key: '{args.platform_key}'")
+            log_message("info", f"[INFO] Filtering copy operation for platform key: '{args.platform_key}'")
             platforms_to_process [args.platform_key] = system_softlist_data[args.platform_key]
         else:
-            print(f"[ERROR] Platform key '{args.platform_key}' not found in '{input_file}'. Nothing to copy.")
+            log_message("error", f"[ERROR] Platform key '{args.platform_key}' not found in '{input_file}'. Nothing to copy.")
             print(f"Available platforms are: {', '.join(system_softlist_data.keys())}")
             return
     else:
-        print("[INFO] No platform key specified. Processing all platforms.")
+        log_message("info", "[INFO] No platform key specified. Processing all platforms.")
         platforms_to_process = system_softlist_data
 
     table_display_data = []
@@ -1182,7 +2897,7 @@ def display_yaml_table(args, source_xml_root):
         
         systems_in_platform = platform_data.get("system", [])
         if not systems_in_platform:
-            print("  [INFO] No systems defined for this platform.")
+            log_message("info", "  [INFO] No systems defined for this platform.")
             continue
 
         for system_entry in systems_in_platform:
@@ -1190,9 +2905,7 @@ def display_yaml_table(args, source_xml_root):
             if isinstance(system_entry, dict):
                 system_name = next(iter(system_entry))
 
-            machine_metadata = {"description": "N/A", "manufacturer": "N/A", "status": "N/A", "emulation": "N/A", "sourcefile": "N/A", "cloneof": "N/A"}
-            if source_xml_root:
-                _, machine_metadata = get_machine_details_and_filters_from_root(system_name, source_xml_root)
+            _, machine_metadata = get_machine_details_and_filters_from_catalog(system_name, machine_catalog)
 
             cloneof = machine_metadata.get('cloneof', 'N/A')
             driver_status = machine_metadata['status']
@@ -1267,14 +2980,14 @@ def display_yaml_table(args, source_xml_root):
             if header_to_find in headers:
                 sort_index = headers.index(header_to_find)
                 table_display_data.sort(key=lambda row: str(row[sort_index]).lower())
-                print(f"\n[INFO] Table sorted by '{sort_key}'.")
+                log_message("info", f"\n[INFO] Table sorted by '{sort_key}'.")
             else:
-                print(f"\n[WARNING] Cannot sort by '{sort_key}'. Column not visible in current view.")
+                log_message("warning", f"\n[WARNING] Cannot sort by '{sort_key}'. Column not visible in current view.")
         else:
-            print(f"\n[WARNING] Invalid sort key '{sort_by}'.")
+            log_message("warning", f"\n[WARNING] Invalid sort key '{sort_by}'.")
     
     if not table_display_data:
-        print("[i] No data found for table display based on provided criteria.")
+        log_message("info", "[i] No data found for table display based on provided criteria.")
         return
         
     if args.output_format == "table":
@@ -1283,6 +2996,44 @@ def display_yaml_table(args, source_xml_root):
     elif args.output_format == "csv":
         output_to_csv_file(headers, table_display_data, args.output_file)
 
+def display_softlist_info(args, machine_catalog):
+    """
+    Shows which systems can load the given software lists, using the catalog's softlist -> machines index.
+    Without softlist names, lists every software list with the number of systems supporting it.
+    """
+    softlist_machines = machine_catalog["softlist_machines"]
+    machines = machine_catalog["machines"]
+
+    if not args.softlists:
+        headers = ["Softlist", "# Systems"]
+        rows = [[softlist_name, len(machine_filters)] for softlist_name, machine_filters in sorted(softlist_machines.items())]
+        if not rows:
+            log_message("info", "[i] No software lists found in the machine catalog.")
+            return
+        print(tabulate(rows, headers=headers, tablefmt="github"))
+        print(f"\nTotal software lists: {len(rows)}")
+        return
+
+    headers = ["Softlist", "System", "Clone Of", "Description", "Compatibility Filter", "Driver Status", "Emulation Status"]
+    rows = []
+    for softlist_name in args.softlists:
+        machine_filters = softlist_machines.get(softlist_name)
+        if not machine_filters:
+            log_message("warning", f"[WARNING] No systems in the machine catalog support software list '{softlist_name}'.")
+            continue
+        for machine_name in sorted(machine_filters):
+            machine = machines[machine_name]
+            rows.append([softlist_name, machine_name, machine.cloneof, machine.description,
+                         machine_filters[machine_name] or "N/A", machine.status, machine.emulation])
+
+    if not rows:
+        return
+    if args.output_format == "table":
+        print(tabulate(rows, headers=headers, tablefmt="github"))
+        print(f"\nTotal systems: {len({row[1] for row in rows})}")
+    elif args.output_format == "csv":
+        output_to_csv_file(headers, rows, args.output_file)
+
 def display_platform_info(args):
     """
     Parses the system_softlist.yml file and displays summary information for platforms.
@@ -1290,9 +3041,9 @@ def display_platform_info(args):
     input_file = args.input_file or APP_CONFIG['system_softlist_yaml_file']
     print(f"\n===== Displaying Platform Information from '{input_file}' =====")
     
-    system_softlist_data = _load_yaml_file(input_file)
+    system_softlist_data = load_platforms_yaml(input_file)
     if not system_softlist_data:
-        print(f"[ERROR] No data found in '{input_file}'. Nothing to display.")
+        log_message("error", f"[ERROR] No data found in '{input_file}'. Nothing to display.")
         return
 
     platforms_to_display = {}
@@ -1300,7 +3051,7 @@ def display_platform_info(args):
         if args.platform_key in system_softlist_data:
             platforms_to_display[args.platform_key] = system_softlist_data[args.platform_key]
         else:
-            print(f"[ERROR] Platform '{args.platform_key}' not found in '{input_file}'.")
+            log_message("error", f"[ERROR] Platform '{args.platform_key}' not found in '{input_file}'.")
             return
     else:
         platforms_to_display = system_softlist_data
@@ -1351,15 +3102,61 @@ def display_platform_info(args):
         if 1 <= col_num <= num_cols:
             sort_index = col_num - 1
             platform_info_rows.sort(key=lambda row: row[sort_index])
-            print(f"\n[INFO] Table sorted by column {col_num}: '{headers[sort_index]}'.")
+            log_message("info", f"\n[INFO] Table sorted by column {col_num}: '{headers[sort_index]}'.")
         else:
-            print(f"[WARNING] Invalid column number {col_num}. Must be between 1 and {num_cols}. Sorting skipped.")
+            log_message("warning", f"[WARNING] Invalid column number {col_num}. Must be between 1 and {num_cols}. Sorting skipped.")
 
     if platform_info_rows:
         print(tabulate(platform_info_rows, headers=headers, tablefmt="github"))
         print(f"\nTotal platforms displayed: {len(platform_info_rows)}")
     else:
-        print("[i] No platform information found for display based on criteria.")
+        log_message("info", "[i] No platform information found for display based on criteria.")
+
+def run_xml_benchmark(args):
+    """
+    Times the XML parsing done by the tool with every available backend: the machine catalog build for
+    MAME/MESS XMLs, and record extraction for softlist XMLs. Reports the best of `--repeat` runs.
+    """
+    xml_files = args.files or [APP_CONFIG.get('mess_xml_file') or MESS_XML_FILE]
+    backends = [backend for backend in XML_BACKENDS if backend == "stdlib" or lxml_etree is not None]
+    if lxml_etree is None:
+        log_message("warning", "[WARNING] lxml is not installed, so only the stdlib backend can be measured. Install it with 'pip install lxml'.")
+
+    original_backend = get_xml_backend()
+    headers = ["File", "Kind", "Backend", "Best Time (s)", "Items", "Speedup vs stdlib"]
+    rows = []
+    try:
+        for xml_file in xml_files:
+            if not os.path.isfile(xml_file):
+                log_message("warning", f"[WARNING] '{xml_file}' not found. Skipping.")
+                continue
+            root_tag = next(ET.iterparse(xml_file, events=("start",)))[1].tag
+            is_softlist = root_tag in ("softwarelist", "softwarelists")
+            log_message("info", f"[INFO] Benchmarking '{xml_file}' ({os.path.getsize(xml_file) / (1024 * 1024):.1f} MB)...")
+
+            timings = {}
+            for backend in backends:
+                set_xml_backend(backend)
+                best_time = None
+                for _ in range(max(1, args.repeat)):
+                    start_time = time.perf_counter()
+                    if is_softlist:
+                        root = parse_xml_file(xml_file)
+                        swlist_elements = [root] if root.tag == "softwarelist" else root.findall("softwarelist")
+                        item_count = sum(len(_extract_software_list_records(swlist_elem)) for swlist_elem in swlist_elements)
+                        del root, swlist_elements
+                    else:
+                        item_count = len(build_machine_catalog_from_file(xml_file)["machines"])
+                    elapsed = time.perf_counter() - start_time
+                    best_time = elapsed if best_time is None else min(best_time, elapsed)
+                timings[backend] = best_time
+                speedup = f"{timings['stdlib'] / best_time:.2f}x" if "stdlib" in timings else "N/A"
+                rows.append([os.path.basename(xml_file), "softlist" if is_softlist else "machines", backend, f"{best_time:.3f}", item_count, speedup])
+    finally:
+        set_xml_backend(original_backend)
+
+    if rows:
+        print(tabulate(rows, headers=headers, tablefmt="github"))
 
 def run_config_command(args):
     """Handles the 'config' subcommand to show or update configuration."""
@@ -1370,14 +3167,14 @@ def run_config_command(args):
             APP_CONFIG["mame_executable"] = args.set_mame_exe_path
             config_updated = True
         else:
-            print(f"[ERROR] Path not valid for mame_executable: {args.set_mame_exe_path}")
+            log_message("error", f"[ERROR] Path not valid for mame_executable: {args.set_mame_exe_path}")
     
     if args.set_softlist_rom_dir:
         if os.path.isdir(args.set_softlist_rom_dir):
             APP_CONFIG["softlist_rom_sources_dir"] = args.set_softlist_rom_dir
             config_updated = True
         else:
-            print(f"[ERROR] Path not valid for softlist_rom_sources_dir: {args.set_softlist_rom_dir}")
+            log_message("error", f"[ERROR] Path not valid for softlist_rom_sources_dir: {args.set_softlist_rom_dir}")
 
     if args.set_output_rom_dir:
         APP_CONFIG["out_romset_dir"] = args.set_output_rom_dir
@@ -1388,7 +3185,7 @@ def run_config_command(args):
             APP_CONFIG["mess_ini_path"] = args.set_mess_ini_path
             config_updated = True
         else:
-            print(f"[ERROR] Path not valid for mess_ini_path: {args.set_mess_ini_path}")
+            log_message("error", f"[ERROR] Path not valid for mess_ini_path: {args.set_mess_ini_path}")
 
     if args.set_system_softlist_yaml_file:
         APP_CONFIG["system_softlist_yaml_file"] = args.set_system_softlist_yaml_file
@@ -1398,11 +3195,18 @@ def run_config_command(args):
         APP_CONFIG["mess_version"] = args.set_mess_version
         config_updated = True
 
+    if args.set_mame_hash_dir:
+        if os.path.isdir(args.set_mame_hash_dir):
+            APP_CONFIG["mame_hash_dir"] = args.set_mame_hash_dir
+            config_updated = True
+        else:
+            log_message("error", f"[ERROR] Path not valid for mame_hash_dir: {args.set_mame_hash_dir}")
+
     if config_updated:
         if save_configuration():
-            print(f"[SUCCESS] Configuration updated in '{CONFIG_FILE}'.")
+            log_message("info", f"[SUCCESS] Configuration updated in '{CONFIG_FILE}'.")
         else:
-            print("[ERROR] Failed to save updated configuration.")
+            log_message("error", "[ERROR] Failed to save updated configuration.")
 
     if args.show or not config_updated:
         print("\n" + "=" * 20 + " Current Configuration " + "=" * 21)
@@ -1423,7 +3227,7 @@ def ensure_mess_xml_exists():
     """
     full_version = APP_CONFIG.get("mess_version")
     if not full_version:
-        print("[WARNING] MAME version is not set in the configuration.")
+        log_message("warning", "[WARNING] MAME version is not set in the configuration.")
         while True:
             prompt = "          Please enter your MAME version number (e.g., 0.278, 0.277) to continue: "
             version_input = input(prompt).strip()
@@ -1444,7 +3248,7 @@ def ensure_mess_xml_exists():
         version_num_only = "".join(re.findall(r'\d', full_version))
 
     if not version_num_only or len(version_num_only) != 3:
-        print(f"[ERROR] Could not parse a 3-digit version number from '{full_version}' for the download URL.")
+        log_message("error", f"[ERROR] Could not parse a 3-digit version number from '{full_version}' for the download URL.")
         return False
 
     version_dir = DATA_DIR / full_version
@@ -1453,13 +3257,13 @@ def ensure_mess_xml_exists():
     APP_CONFIG["mess_xml_file"] = str(mess_xml_path)
 
     if mess_xml_path.exists():
-        print(f"[INFO] Found MESS XML for version {full_version} at: '{mess_xml_path}'")
+        log_message("info", f"[INFO] Found MESS XML for version {full_version} at: '{mess_xml_path}'")
         return True
 
-    print(f"[WARNING] MESS XML for version {full_version} not found.")
+    log_message("warning", f"[WARNING] MESS XML for version {full_version} not found.")
     prompt = "          Would you like to download it from progetto-snaps.net? [Y/n]: "
     if input(prompt).strip().lower() not in ['', 'y', 'yes']:
-        print("[INFO] Skipping download. Some features may not work correctly without the mess.xml file.")
+        log_message("info", "[INFO] Skipping download. Some features may not work correctly without the mess.xml file.")
         return False # This is a "soft" failure, the program can continue.
 
     # --- Download Logic ---
@@ -1469,7 +3273,7 @@ def ensure_mess_xml_exists():
     os.makedirs(DATA_DIR, exist_ok=True)
 
     try:
-        print(f"[INFO] Attempting to download from: {url}")
+        log_message("info", f"[INFO] Attempting to download from: {url}")
         
         # --- REVISED, MORE COMPATIBLE SSL HANDLING ---
         # Temporarily set the default context for this operation
@@ -1483,17 +3287,17 @@ def ensure_mess_xml_exists():
         
         sys.stdout.write("\n[INFO] Download complete.\n")
     except Exception as e:
-        print(f"\n[ERROR] Failed to download file: {e}")
+        log_message("error", f"\n[ERROR] Failed to download file: {e}")
         if os.path.exists(temp_zip_path):
             os.remove(temp_zip_path)
         # --- CRITICAL FIX: Exit if download fails ---
-        print("[FATAL] Cannot proceed without the MESS XML file. Please check your connection or download manually.")
+        log_message("error", "[FATAL] Cannot proceed without the MESS XML file. Please check your connection or download manually.")
         sys.exit(1) # This is a "hard" failure. Stop the program.
     # --- END REVISED SSL HANDLING ---
     
     # --- Extraction Logic ---
     try:
-        print(f"[INFO] Extracting '{temp_zip_path}' to '{version_dir}'...")
+        log_message("info", f"[INFO] Extracting '{temp_zip_path}' to '{version_dir}'...")
         os.makedirs(version_dir, exist_ok=True)
         with zipfile.ZipFile(temp_zip_path, 'r') as zip_ref:
             xml_filename = next((name for name in zip_ref.namelist() if name.lower().endswith('.xml')), None)
@@ -1505,17 +3309,251 @@ def ensure_mess_xml_exists():
             mess_xml_path.parent.mkdir(parents=True, exist_ok=True)
             shutil.move(str(full_extracted_path), str(mess_xml_path))
             
-            print(f"[SUCCESS] MESS XML for version {full_version} is now available at '{mess_xml_path}'.")
+            log_message("info", f"[SUCCESS] MESS XML for version {full_version} is now available at '{mess_xml_path}'.")
             return True
     except Exception as e:
-        print(f"[ERROR] Failed to extract or move file: {e}")
+        log_message("error", f"[ERROR] Failed to extract or move file: {e}")
         # --- CRITICAL FIX: Exit if extraction fails ---
-        print("[FATAL] Cannot proceed without the MESS XML file.")
+        log_message("error", "[FATAL] Cannot proceed without the MESS XML file.")
         sys.exit(1) # This is also a "hard" failure.
     finally:
         if os.path.exists(temp_zip_path):
             os.remove(temp_zip_path)   
 
+def parse_softlist_config_args(config_strs):
+    """Parses --add-softlist-config values (SOFTLIST:"PARAMETERS") into {softlist: {"command_line_parameters": ...}}."""
+    softlist_configs = {}
+    for config_str in config_strs or []:
+        softlist_name, params = config_str.split(':', 1)
+        softlist_configs[softlist_name] = {"command_line_parameters": params.strip('"')}
+        log_message("info", f"[INFO] Queued default command for softlist '{softlist_name}'.")
+    return softlist_configs
+
+def parse_software_config_args(config_strs):
+    """Parses --add-software-config values (SOFTLIST:SWID:"PARAMETERS") into {softlist: {swid: {"command_line_parameters": ...}}}."""
+    software_configs = {}
+    for config_str in config_strs or []:
+        softlist_name, swid, params = config_str.split(':', 2)
+        software_configs.setdefault(softlist_name, {})[swid] = {"command_line_parameters": params.strip('"')}
+        log_message("info", f"[INFO] Queued custom command for '{swid}' in softlist '{softlist_name}'.")
+    return software_configs
+
+def validate_search_args(args):
+    """Returns an error message if the parsed 'search' arguments cannot produce the requested output, otherwise None."""
+    if args.output_format == "csv" and not args.output_file:
+        return "--output-file is required when using --output-format csv"
+    if args.output_format == "yaml" and not all([args.platform_key, args.platform_name_full, args.media_type]):
+        return "For YAML output, --platform-key, --platform-name-full, and --media-type are required."
+    for config_str in args.add_softlist_config or []:
+        if len(config_str.split(':', 1)) != 2:
+            return f"Invalid format for --add-softlist-config: '{config_str}'. Expected SOFTLIST:\"PARAMETERS\"."
+    for config_str in args.add_software_config or []:
+        if len(config_str.split(':', 2)) != 3:
+            return f"Invalid format for --add-software-config: '{config_str}'. Expected SOFTLIST:SWID:\"PARAMETERS\"."
+    return None
+
+def run_search_command(args, parser, machine_catalog=None, yaml_data=None):
+    """
+    Runs one 'search': selects the machines and writes the table/CSV/YAML output.
+    `machine_catalog` is loaded from --input-xml when not given. With `yaml_data` the YAML entry is only stored
+    in that dict (see output_to_yaml_file) and a platform without systems is skipped instead of ending the program.
+    """
+    validation_error = validate_search_args(args)
+    if validation_error:
+        parser.error(validation_error)
+
+    # default cmd line param that applies to all titles for a softlist
+    softlist_configs_to_add = parse_softlist_config_args(args.add_softlist_config)
+    # a per title cmd line param that will override add_softlist_config
+    software_configs_to_add = parse_software_config_args(args.add_software_config)
+
+    if machine_catalog is None:
+        # Determine the source XML file to use
+        xml_source_path = args.input_xml or APP_CONFIG.get('mess_xml_file') or MAME_ALL_MACHINES_XML_CACHE
+        machine_catalog = load_machine_catalog(xml_source_path)
+        if machine_catalog is None:
+            sys.exit(1)
+
+    # 1. Select the systems to consider, applying every machine filter in one pass
+    include_systems_list = [item.strip() for item in args.include_systems.replace(',', ' ').split() if item.strip()] if args.include_systems else []
+    exclude_systems_list = [item.strip() for item in args.exclude_systems.replace(',', ' ').split() if item.strip()] if args.exclude_systems else []
+    systems_to_process = select_machines(
+        machine_catalog,
+        systems=args.systems,
+        name_patterns=args.filter_machine_name_fuzzy,
+        description_terms=args.filter_machine_description,
+        sourcefile=args.filter_machine_sourcefile,
+        softlists=args.filter_softlist,
+        driver_status=args.driver_status,
+        emulation_status=args.emulation_status,
+        include_systems=include_systems_list,
+        exclude_systems=exclude_systems_list
+    )
+
+    # 2. Prepare arguments for the core function
+    if args.limit is not None:
+        systems_to_process = systems_to_process[:args.limit]
+        log_message("info", f"[INFO] Limiting to first {len(systems_to_process)} systems.")
+
+    if args.output_format == "yaml" and not systems_to_process:
+        log_message("warning", "[WARNING] No systems to process after all filters were applied.")
+        if yaml_data is not None:
+            return
+        sys.exit(0)
+
+    # 3. Call the core function with the final, curated list of systems
+    perform_mame_search_and_output(
+        systems_to_process,
+        args.filter_software_description or "",
+        args.output_format,
+        args.platform_key, args.platform_name_full, args.platform_category, args.media_type,
+        args.enable_custom_cmd_per_title, args.emu_name, args.default_emu, args.default_emu_cmd_params,
+        args.output_file, args.driver_status, args.emulation_status,
+        args.show_systems_only, args.show_extra_info, machine_catalog=machine_catalog, sort_by=args.sort_by,
+        exclude_softlist=[item.strip() for item in args.exclude_softlist.split()],
+        include_softlist=[item.strip() for item in args.include_softlist.split()],
+        software_configs_to_add=software_configs_to_add,
+        softlist_configs_to_add=softlist_configs_to_add,
+        softlist_source=args.softlist_source,
+        jobs=max(1, args.jobs),
+        refresh_cache=args.refresh_cache,
+        yaml_data=yaml_data
+    )
+
+def manifest_entry_to_search_argv(entry, search_parser):
+    """
+    Converts one platform entry of a build manifest into 'search' command-line arguments.
+    Keys are the long option names of 'search' without the leading dashes ('platform-key' or 'platform_key');
+    'systems' holds the positional system names. Raises ValueError for unknown keys.
+    """
+    options = {}
+    for action in search_parser._actions:
+        for option_string in action.option_strings:
+            if option_string.startswith("--"):
+                options[option_string[2:]] = (option_string, action)
+
+    argv = []
+    systems = []
+    for key, value in entry.items():
+        name = str(key).replace('_', '-')
+        if name == "systems":
+            systems = value.split() if isinstance(value, str) else [str(item) for item in value or []]
+            continue
+        if name not in options:
+            raise ValueError(f"unknown option '{key}'")
+        if value is None:
+            continue
+        option_string, action = options[name]
+        values = value if isinstance(value, list) else [value]
+        if action.nargs == 0:
+            if value:
+                argv.append(option_string)
+        elif isinstance(action, argparse._AppendAction):
+            for item in values:
+                argv.extend([option_string, str(item)])
+        elif action.nargs in ('+', '*'):
+            argv.append(option_string)
+            argv.extend(str(item) for item in values)
+        else:
+            argv.extend([option_string, " ".join(str(item) for item in values)])
+    # Positional systems go last so they are not taken as values of a preceding list option.
+    if systems:
+        argv.append("--")
+        argv.extend(systems)
+    return argv
+
+def run_build_command(args, search_parser):
+    """
+    Generates every platform listed in a build manifest in one run. Each entry takes the same options as 'search';
+    the manifest's optional 'defaults' apply to all entries. All entries are validated before any work starts,
+    the machine catalog and parsed software lists are shared across platforms, and each YAML file is written once.
+    """
+    manifest = _load_yaml_file(args.manifest) if os.path.exists(args.manifest) else None
+    if manifest is None:
+        log_message("error", f"[ERROR] Manifest file not found: '{args.manifest}'.")
+        sys.exit(1)
+    platforms = manifest.get("platforms")
+    defaults = manifest.get("defaults") or {}
+    if not isinstance(platforms, list) or not platforms or not isinstance(defaults, dict):
+        log_message("error", f"[ERROR] Manifest '{args.manifest}' must contain a 'platforms' list (and optionally a 'defaults' mapping).")
+        sys.exit(1)
+
+    # 1. Turn every entry into parsed 'search' arguments and validate them all up front
+    build_jobs = []
+    seen_keys = set()
+    for index, platform in enumerate(platforms, start=1):
+        if not isinstance(platform, dict):
+            log_message("error", f"[ERROR] Manifest entry #{index} is not a mapping of search options.")
+            sys.exit(1)
+        entry = dict(defaults)
+        entry.update(platform)
+        label = entry.get("platform-key") or entry.get("platform_key") or f"#{index}"
+        try:
+            argv = ["--output-format", "yaml"] + manifest_entry_to_search_argv(entry, search_parser)
+        except ValueError as e:
+            log_message("error", f"[ERROR] Manifest entry '{label}': {e}.")
+            sys.exit(1)
+        debug_print("Manifest entry '%s': search %s", label, ' '.join(argv))
+        try:
+            search_args = search_parser.parse_args(argv)
+        except SystemExit:
+            log_message("error", f"[ERROR] Invalid options for manifest entry '{label}'.")
+            sys.exit(1)
+        if args.output_file:
+            search_args.output_file = args.output_file
+        if args.jobs is not None:
+            search_args.jobs = args.jobs
+        if args.refresh_cache:
+            search_args.refresh_cache = True
+
+        if search_args.output_format != "yaml":
+            log_message("error", f"[ERROR] Manifest entry '{label}': 'build' only generates YAML output.")
+            sys.exit(1)
+        validation_error = validate_search_args(search_args)
+        if validation_error:
+            log_message("error", f"[ERROR] Manifest entry '{label}': {validation_error}")
+            sys.exit(1)
+        if search_args.platform_key in seen_keys:
+            log_message("error", f"[ERROR] Platform key '{search_args.platform_key}' appears more than once in the manifest.")
+            sys.exit(1)
+        seen_keys.add(search_args.platform_key)
+        build_jobs.append(search_args)
+
+    if args.platform_key:
+        selected_keys = set(args.platform_key)
+        unknown_keys = selected_keys - seen_keys
+        if unknown_keys:
+            log_message("warning", f"[WARNING] Platform key(s) not in the manifest: {', '.join(sorted(unknown_keys))}")
+        build_jobs = [search_args for search_args in build_jobs if search_args.platform_key in selected_keys]
+
+    log_message("info", f"[INFO] Building {len(build_jobs)} platform(s) from manifest '{args.manifest}'.")
+
+    # 2. Generate every platform, loading each machine catalog only once
+    machine_catalogs = {}
+    yaml_documents = {}
+    for position, search_args in enumerate(build_jobs, start=1):
+        log_message("info", f"\n[INFO] ({position}/{len(build_jobs)}) Building platform '{search_args.platform_key}'...")
+        xml_source_path = search_args.input_xml or APP_CONFIG.get('mess_xml_file') or MAME_ALL_MACHINES_XML_CACHE
+        if xml_source_path not in machine_catalogs:
+            machine_catalogs[xml_source_path] = load_machine_catalog(xml_source_path)
+        if machine_catalogs[xml_source_path] is None:
+            sys.exit(1)
+        target_file = search_args.output_file or APP_CONFIG['system_softlist_yaml_file']
+        yaml_documents.setdefault(target_file, {})
+        run_search_command(search_args, search_parser, machine_catalog=machine_catalogs[xml_source_path],
+                           yaml_data=yaml_documents[target_file])
+
+    # 3. Write the generated platforms into each YAML file once
+    for target_file, yaml_data in yaml_documents.items():
+        if not yaml_data:
+            continue
+        try:
+            save_yaml_platforms(target_file, yaml_data)
+            print(f"\nSuccessfully generated/updated '{target_file}' with {len(yaml_data)} platform(s).")
+        except Exception as e:
+            log_message("error", f"[ERROR] Failed to write YAML to '{target_file}': {e}")
+            sys.exit(1)
+
 def main():
     global DEBUG_MODE_ENABLED 
 
@@ -1529,6 +3567,20 @@ def main():
         action="store_true",
         help="Enable debug messages for detailed output."
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only show warnings, errors and summaries; hide [INFO] and per-title lines."
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Replace the per-title lines of search, copy-roms and verify with a single updating counter."
+    )
+    parser.add_argument(
+        "--log-file",
+        help="Append every message, including hidden ones, to this file as JSON lines."
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands", required=False)
 
@@ -1540,6 +3592,7 @@ def main():
     config_parser.add_argument("--set-mess-ini-path", help="Set the path to mess.ini.")
     config_parser.add_argument("--set-system-softlist-yaml-file", help="Set the output YAML filename (e.g., my_platforms.yml).")  
     config_parser.add_argument("--set-mess-version", help="Set the MAME version number (e.g., 278).")
+    config_parser.add_argument("--set-mame-hash-dir", help="Set the path to MAME's 'hash' directory (softlist XMLs). Defaults to the 'hash' folder next to mame.exe.")
         
     sort_by_choices = ['system_name', 'system_desc', 'manufacturer', 'year', 'software_id', 'title', 'publisher', 'driver_status', 'emulation_status', 'sourcefile']
 
@@ -1572,7 +3625,7 @@ def main():
     search_parser.add_argument("systems", nargs='*', default=[], help="[Optional] One or more MAME system short names (e.g., 'nes', 'snes'). If omitted, all systems from the input XML will be considered for filtering.")
     
     # --- New Filter Arguments ---
-    search_parser.add_argument("--filter-machine-name-fuzzy", help="Filter machines by a name prefix (e.g., 'jak_').")
+    search_parser.add_argument("--filter-machine-name-fuzzy", action="append", help="Filter machines by name prefixes or globs, separated by spaces or commas (e.g., 'jak_' or 'jak_* ekara*'). Can be used multiple times.")
     search_parser.add_argument("--filter-machine-description", nargs='+', help="Filter machines where the description contains one or more of these terms.")
     search_parser.add_argument("--filter-machine-sourcefile", help="Filter machines by the driver source file (e.g., 'xavix.cpp').")
     search_parser.add_argument("--filter-software-description", help="Filter software by a term in its ID or description.")
@@ -1585,13 +3638,47 @@ def main():
     search_parser.add_argument("--output-file", help="Path to the output file (required for 'csv' format, optional for 'yaml').")
     search_parser.add_argument("--driver-status", choices=["good", "imperfect", "preliminary", "unsupported"], help="Filter machines by driver 'status'.")
     search_parser.add_argument("--emulation-status", choices=["good", "imperfect", "preliminary", "unsupported"], help="Filter machines by driver 'emulation' status.")   
+    search_parser.add_argument("--softlist-source", choices=["auto", "hash", "mame"], default="auto", help="Where software lists are read from: 'hash' reads MAME's hash/*.xml files directly, 'mame' runs 'mame -listsoftware' per system, 'auto' (default) uses 'hash' when the directory exists.")
+    search_parser.add_argument("--jobs", type=int, default=1, metavar="N", help="Number of 'mame -listsoftware' commands to run in parallel when software lists come from MAME (default: 1).")
+    search_parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached 'mame -listsoftware' results and run MAME again, updating the cache.")
+
+    build_parser = subparsers.add_parser("build", help="Generate every platform defined in a manifest file in one run.")
+    build_parser.add_argument("--manifest", required=True, help="Path to the YAML manifest listing the platforms; each entry takes the same options as 'search'.")
+    build_parser.add_argument("--platform-key", nargs='+', help="Optional: Build only these platforms from the manifest.")
+    build_parser.add_argument("--output-file", help="Path to the output YAML file for all platforms. Overrides the manifest; defaults to config.")
+    build_parser.add_argument("--jobs", type=int, metavar="N", help="Number of 'mame -listsoftware' commands to run in parallel. Overrides the manifest.")
+    build_parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached 'mame -listsoftware' results and run MAME again, updating the cache.")
 
     copy_parser = subparsers.add_parser("copy-roms", help="Copy/create ROM zips based on system_softlist.yml.")
     copy_parser.add_argument("--input-file", help="Path to the input YAML file. Defaults to config.")
     copy_parser.add_argument("--platform-key", help="Optional: Copy ROMs only for a specific platform by its key.")
     copy_parser.add_argument("--create-placeholder-zip", action="store_true", help="Always create empty placeholder (dummy) zips instead of copying from the source directory.")
     copy_parser.add_argument("--dry-run", action="store_true", help="Show what would be copied or created without modifying any files.")
+    copy_parser.add_argument("--jobs", type=int, default=1, metavar="N", help="Number of ROMs to copy in parallel (default: 1). Helps most when copying to or from network shares.")
+    copy_parser.add_argument("--link-mode", choices=ROM_LINK_MODES, default="copy", help="How output ROMs are created: 'copy' (default), 'hardlink', 'symlink' or 'reflink' (copy-on-write clone); 'auto' tries reflink, then hardlink, then copy for each file. Failed links fall back to copying.")
+    copy_parser.add_argument("--placeholder-hardlink", action="store_true", help="Hardlink every placeholder zip to one template file in the output directory instead of writing a separate file for each.")
+    copy_parser.add_argument("--refresh-inventory", action="store_true", help="[With --dry-run] List the source ROM folders again instead of reusing the inventory from the last run.")
+    copy_parser.add_argument("--sync", action="store_true", help="Only copy ROMs that are new or changed since the last sync (tracked in a manifest in the output directory).")
+    copy_parser.add_argument("--checksum", action="store_true", help="[With --sync] Detect changed source ROMs by SHA1 instead of size and modification time.")
+    copy_parser.add_argument("--prune", action="store_true", help="[Implies --sync] Delete output files from earlier syncs that are no longer in the YAML.")
     
+    missing_parser = subparsers.add_parser("missing-roms", help="List software in system_softlist.yml whose ROM zip is missing from the source directory.")
+    missing_parser.add_argument("--input-file", help="Path to the input YAML file. Defaults to config.")
+    missing_parser.add_argument("--platform-key", help="Optional: Check only a specific platform by its key.")
+    missing_parser.add_argument("--refresh-inventory", action="store_true", help="List every source ROM folder again instead of reusing unchanged folders from the last scan.")
+    missing_parser.add_argument("--jobs", type=int, default=1, metavar="N", help="Number of source folders to list in parallel (default: 1).")
+    missing_parser.add_argument("--output-format", choices=["table", "csv"], default="table", help="Output format: 'table' (default) or 'csv'.")
+    missing_parser.add_argument("--output-file", help="Path to the output file (required for 'csv' format).")
+
+    verify_parser = subparsers.add_parser("verify", help="Check source ROM zips against the CRC/SHA1 hashes in MAME's software lists.")
+    verify_parser.add_argument("--input-file", help="Path to the input YAML file. Defaults to config.")
+    verify_parser.add_argument("--platform-key", help="Optional: Verify only a specific platform by its key.")
+    verify_parser.add_argument("--sha1", action="store_true", help="Also check each ROM's SHA1 (reads every zip in full; slower than the default CRC check).")
+    verify_parser.add_argument("--jobs", type=int, metavar="N", help="Number of worker processes (default: number of CPUs).")
+    verify_parser.add_argument("--show-missing", action="store_true", help="Also list software whose zip is not in the source directory.")
+    verify_parser.add_argument("--output-format", choices=["table", "csv"], default="table", help="Output format: 'table' (default) or 'csv'.")
+    verify_parser.add_argument("--output-file", help="Path to the output file (required for 'csv' format).")
+
     split_parser = subparsers.add_parser("split", help="Generate filtered MAME XMLs based on MESS.ini.")
     split_parser.add_argument("--mess-ini", help="Path to MESS.ini. Defaults to config.")
 
@@ -1612,11 +3699,26 @@ def main():
     platform_info_parser.add_argument("--input-file", help="Path to the input YAML file. Defaults to config.")
     platform_info_parser.add_argument("--sort-by-col-num", type=int, help="[For Table] Sort the output table by a 1-based column number.")
 
+    softlist_info_parser = subparsers.add_parser("softlist-info", help="Show which systems can load the given software lists.")
+    softlist_info_parser.add_argument("softlists", nargs="*", help="Software list names (e.g., nes famicom_cass). Omit to list all software lists with their system counts.")
+    softlist_info_parser.add_argument("--input-xml", help="Path to the source XML file. Defaults to the MESS XML for the configured MAME version.")
+    softlist_info_parser.add_argument("--output-format", choices=["table", "csv"], default="table", help="Output format: 'table' (default) or 'csv'.")
+    softlist_info_parser.add_argument("--output-file", help="Path to the output file (required for 'csv' format).")
+
+    softlist_index_parser = subparsers.add_parser("build-softlist-index", help="Pre-build the software title index for every softlist in MAME's hash directory.")
+    softlist_index_parser.add_argument("--hash-dir", help="Path to MAME's hash directory. Defaults to config ('mame_hash_dir' or the 'hash' folder next to mame.exe).")
+
+    bench_xml_parser = subparsers.add_parser("bench-xml", help="Compare XML parsing speed of the stdlib and lxml backends.")
+    bench_xml_parser.add_argument("files", nargs="*", help="MAME/MESS or softlist XML files to parse. Defaults to the MESS XML for the configured MAME version.")
+    bench_xml_parser.add_argument("--repeat", type=int, default=3, help="Number of runs per backend; the best time is reported (default: 3).")
+
     args = parser.parse_args()
+    configure_logging(quiet=args.quiet, progress=args.progress, log_file=args.log_file)
 
     if args.debug:
         DEBUG_MODE_ENABLED = True
         debug_print("Debug mode enabled.")
+        debug_print("YAML backend: %s.", 'libyaml (C)' if YamlLoader.__name__.startswith('C') else 'pure Python')
 
     if args.command == "config":
         load_configuration()
@@ -1627,202 +3729,49 @@ def main():
 
     if not args.command:
         parser.print_help()
-        print("\n[INFO] No command specified. Use 'config' to set up, or a command like 'search' to begin.")
+        log_message("info", "\n[INFO] No command specified. Use 'config' to set up, or a command like 'search' to begin.")
         sys.exit(0)
 
-    # default cmd line param that applies to all titles for a softlist
-    softlist_configs_to_add = {}
-    if hasattr(args, 'add_softlist_config') and args.add_softlist_config:
-        for config_str in args.add_softlist_config:
-            try:
-                parts = config_str.split(':', 1)
-                if len(parts) != 2:
-                    raise ValueError("Invalid format")
-                
-                softlist_name, params = parts
-                params = params.strip('"')
-
-                softlist_configs_to_add[softlist_name] = {"command_line_parameters": params}
-                print(f"[INFO] Queued default command for softlist '{softlist_name}'.")
-
-            except ValueError:
-                print(f"[ERROR] Invalid format for --add-softlist-config: '{config_str}'. Expected SOFTLIST:\"PARAMETERS\". Aborting.")
-                sys.exit(1)        
-
-    # a per title cmd line param that will override add_softlist_config
-    software_configs_to_add = {}
-    if hasattr(args, 'add_software_config') and args.add_software_config:
-        for config_str in args.add_software_config:
-            try:
-                parts = config_str.split(':', 2)
-                if len(parts) != 3:
-                    raise ValueError("Invalid format")
-                
-                softlist_name, swid, params = parts
-                params = params.strip('"')
-
-                if softlist_name not in software_configs_to_add:
-                    software_configs_to_add[softlist_name] = {}
-                
-                software_configs_to_add[softlist_name][swid] = {"command_line_parameters": params}
-                print(f"[INFO] Queued custom command for '{swid}' in softlist '{softlist_name}'.")
-
-            except ValueError:
-                print(f"[ERROR] Invalid format for --add-software-config: '{config_str}'. Expected SOFTLIST:SWID:\"PARAMETERS\". Aborting.")
-                sys.exit(1)    
-
     if args.command == "search":
-        # Determine the source XML file to use
-        xml_source_path = args.input_xml or APP_CONFIG.get('mess_xml_file') or MAME_ALL_MACHINES_XML_CACHE
-        source_xml_root = get_parsed_mame_xml_root(xml_source_path)
-        if source_xml_root is None: 
-            sys.exit(1)
-
-        # 1. Build the initial pool of systems to consider
-        systems_pool = set()
-        
-        # Check if the user is providing an explicit set of systems to start with
-        user_provided_systems = bool(args.systems or args.filter_machine_name_fuzzy or (hasattr(args, 'include_systems') and args.include_systems))
-        
-        if user_provided_systems:
-            print("[INFO] User has provided an explicit list of systems to process.")
-            # Start with an empty set and only add what the user specifies.
-            if args.systems:
-                systems_pool.update(args.systems)
-                print(f"[INFO] Added {len(args.systems)} system(s) from positional arguments.")
-            
-            if args.filter_machine_name_fuzzy:
-                fuzzy_matches = get_all_mame_systems_by_prefix_from_root(args.filter_machine_name_fuzzy, source_xml_root)
-                if fuzzy_matches:
-                    print(f"[INFO] Adding {len(fuzzy_matches)} systems from fuzzy search for '{args.filter_machine_name_fuzzy}'.")
-                    systems_pool.update(fuzzy_matches)
-                else:
-                    print(f"[INFO] No systems found matching '--filter-machine-name-fuzzy {args.filter_machine_name_fuzzy}'.")
-            
-            if hasattr(args, 'include_systems') and args.include_systems:
-                include_systems_list = [item.strip() for item in args.include_systems.replace(',', ' ').split() if item.strip()]
-                systems_pool.update(include_systems_list)
-                print(f"[INFO] Added {len(include_systems_list)} system(s) from --include-systems.")
-        else:
-            # If no systems are specified, the pool is ALL systems from the XML, which will then be filtered.
-            print(f"[INFO] No specific systems provided. Starting with all systems from '{os.path.basename(xml_source_path)}' for filtering.")
-            systems_pool.update(get_all_mame_systems_from_xml_file(xml_source_path))
-
-        # 2. Sequentially apply filters to the pool
-        print(f"[INFO] Initial system pool size: {len(systems_pool)}")
-
-        if args.filter_machine_description:
-            initial_count = len(systems_pool)
-            filtered_set = set()
-            for machine_element in source_xml_root.findall("machine"):
-                machine_name = machine_element.get("name")
-                if machine_name in systems_pool: # Only check machines already in our pool
-                    description = machine_element.findtext("description", "")
-                    if all(term.lower() in description.lower() for term in args.filter_machine_description):
-                        filtered_set.add(machine_name)
-            systems_pool = filtered_set
-            print(f"[INFO] After --filter-machine-description: {initial_count} -> {len(systems_pool)} systems.")
-
-        if args.filter_machine_sourcefile:
-            initial_count = len(systems_pool)
-            filtered_set = set()
-            for machine_element in source_xml_root.findall("machine"):
-                machine_name = machine_element.get("name")
-                if machine_name in systems_pool:
-                    sourcefile = machine_element.get("sourcefile", "")
-                    if args.filter_machine_sourcefile.lower() in sourcefile.lower():
-                        filtered_set.add(machine_name)
-            systems_pool = filtered_set
-            print(f"[INFO] After --filter-machine-sourcefile: {initial_count} -> {len(systems_pool)} systems.")
-
-        if args.filter_softlist:
-            initial_count = len(systems_pool)
-            filtered_set = set()
-            softlists_to_find = set(args.filter_softlist) # Use a set for efficient lookups
-
-            print(f"[INFO] Filtering systems to find support for softlist(s): {', '.join(softlists_to_find)}")
-
-            for machine_element in source_xml_root.findall("machine"):
-                machine_name = machine_element.get("name")
-                if machine_name in systems_pool:  # Only check machines already in our pool
-                    # Get all softlist names supported by this machine
-                    supported_softlists = {
-                        sl.get("name") for sl in machine_element.findall("softwarelist")
-                    }
-                    
-                    # Check if there is any intersection between the softlists we're looking for
-                    # and the softlists this machine supports.
-                    if not softlists_to_find.isdisjoint(supported_softlists):
-                        filtered_set.add(machine_name)
-            
-            systems_pool = filtered_set
-            print(f"[INFO] After --filter-softlist: {initial_count} -> {len(systems_pool)} systems.")
-
-        # 3. Apply manual includes and excludes
-        if hasattr(args, 'include_systems') and args.include_systems:
-            include_systems_list = [item.strip() for item in args.include_systems.replace(',', ' ').split() if item.strip()]
-            initial_count = len(systems_pool)
-            systems_pool.update(include_systems_list)
-            print(f"[INFO] After --include-systems: {initial_count} -> {len(systems_pool)} systems.")
-
-        if hasattr(args, 'exclude_systems') and args.exclude_systems:
-            exclude_systems_list = [item.strip() for item in args.exclude_systems.replace(',', ' ').split() if item.strip()]
-            initial_count = len(systems_pool)
-            systems_pool -= set(exclude_systems_list)
-            print(f"[INFO] After --exclude-systems: {initial_count} -> {len(systems_pool)} systems.")
-
-        # 4. Prepare arguments for the core function
-        systems_to_process = sorted(list(systems_pool))
-        if hasattr(args, 'limit') and args.limit is not None: 
-            systems_to_process = systems_to_process[:args.limit]
-            print(f"[INFO] Limiting to first {len(systems_to_process)} systems.")
-
-        # Consolidate YAML/CSV/Table arguments
-        platform_key = getattr(args, 'platform_key', None)
-        platform_name_full = getattr(args, 'platform_name_full', None)
-        # (and all other platform/emu args...)
-
-        # 5. Validation and Final Call
-        if args.output_format == "csv" and not args.output_file:
-            parser.error("--output-file is required when using --output-format csv")
-        
-        if args.output_format == "yaml":
-            # ... (your existing YAML validation logic remains the same) ...
-            if not all([platform_key, platform_name_full, args.media_type]):
-                parser.error("For YAML output, --platform-key, --platform-name-full, and --media-type are required.")
-            if not systems_to_process:
-                print("[WARNING] No systems to process after all filters were applied.")
-                sys.exit(0)
-
-        # Call the core function with the final, curated list of systems
-        perform_mame_search_and_output(
-            systems_to_process,
-            args.filter_software_description or "",
-            args.output_format,
-            # Pass all the other args as before
-            platform_key, platform_name_full, args.platform_category, args.media_type,
-            args.enable_custom_cmd_per_title, args.emu_name, args.default_emu, args.default_emu_cmd_params,
-            args.output_file, args.driver_status, args.emulation_status,
-            args.show_systems_only, args.show_extra_info, source_xml_root, sort_by=args.sort_by,
-            exclude_softlist=[item.strip() for item in args.exclude_softlist.split()],
-            include_softlist=[item.strip() for item in args.include_softlist.split()],
-            software_configs_to_add=software_configs_to_add, # You'll need to re-add the logic for these dicts
-            softlist_configs_to_add=softlist_configs_to_add
-        )
-
+        run_search_command(args, search_parser)
+    elif args.command == "build":
+        run_build_command(args, search_parser)
     elif args.command == "copy-roms":
         perform_rom_copy_operation(args)
+    elif args.command == "missing-roms":
+        if args.output_format == "csv" and not args.output_file:
+            parser.error("--output-file is required when using --output-format csv")
+        report_missing_roms(args)
+    elif args.command == "verify":
+        if args.output_format == "csv" and not args.output_file:
+            parser.error("--output-file is required when using --output-format csv")
+        verify_roms(args)
     elif args.command == "split":
         run_split_command(args)
     elif args.command == "table":
         if args.output_format == "csv" and not args.output_file:
             parser.error("--output-file is required when using --output-format csv")
         mame_xml_source = args.mame_xml_source or APP_CONFIG.get('mess_xml_file') or MAME_ALL_MACHINES_XML_CACHE
-        table_source_xml_root = get_parsed_mame_xml_root(mame_xml_source)
-        if table_source_xml_root:
-            display_yaml_table(args, table_source_xml_root)
+        table_machine_catalog = load_machine_catalog(mame_xml_source)
+        if table_machine_catalog is not None:
+            display_yaml_table(args, table_machine_catalog)
     elif args.command == "platform-info":
         display_platform_info(args)
+    elif args.command == "build-softlist-index":
+        hash_dir = args.hash_dir or get_mame_hash_dir()
+        if not hash_dir or not os.path.isdir(hash_dir):
+            log_message("error", "[ERROR] MAME hash directory not found. Pass --hash-dir or set it with 'config --set-mame-hash-dir <path>'.")
+            sys.exit(1)
+        build_softlist_index(hash_dir)
+    elif args.command == "bench-xml":
+        run_xml_benchmark(args)
+    elif args.command == "softlist-info":
+        if args.output_format == "csv" and not args.output_file:
+            parser.error("--output-file is required when using --output-format csv")
+        xml_source_path = args.input_xml or APP_CONFIG.get('mess_xml_file') or MAME_ALL_MACHINES_XML_CACHE
+        softlist_machine_catalog = load_machine_catalog(xml_source_path)
+        if softlist_machine_catalog is not None:
+            display_softlist_info(args, softlist_machine_catalog)
 
     for tmp_file in [TMP_SOFTWARE_XML_FILE]: 
         if os.path.exists(tmp_file):
@@ -1,6 +1,5 @@
 import sys
 import os
-import yaml
 import csv
 import functools
 import io
@@ -33,7 +32,7 @@ except ImportError:
                 print(f"Mocked core_logic.{name} called with: {args}, {kwargs}")
                 if name == "load_configuration":
                     return False
-                if name == "get_parsed_mame_xml_root":
+                if name == "load_machine_catalog":
                     return None
                 return [] 
             return dummy_func
@@ -71,7 +70,11 @@ class Worker(QObject):
     def run(self):
         try:
             with Capturing() as output:
-                res = self.func(**self.kwargs)
+                try:
+                    res = self.func(**self.kwargs)
+                finally:
+                    # Per-item lines are buffered by the core; write them out while stdout is still captured.
+                    core_logic.log_flush()
             
             for line in output:
                 if "[ERROR]" in line or "[WARNING]" in line.upper() or "traceback" in line.lower():
@@ -270,7 +273,7 @@ class PlatformConfigDialog(QDialog):
         self.exclude_softlist_le = QLineEdit()
         
         self.systems_te.setPlaceholderText("One per line, or space/comma separated")
-        self.filter_machine_name_fuzzy_le.setPlaceholderText("e.g. jak_")
+        self.filter_machine_name_fuzzy_le.setPlaceholderText("e.g. jak_ or jak_* ekara*")
         self.include_systems_le.setPlaceholderText("Space separated (e.g. \"nes snes\")")
         self.exclude_systems_le.setPlaceholderText("Space separated (e.g. \"nes snes\")")
         self.exclude_softlist_le.setPlaceholderText("Space separated (e.g. \"nes_ade\")")
@@ -385,7 +388,7 @@ class PlatformsTab(QWidget):
             self.platforms_table.setRowCount(0)
             return
 
-        platforms = core_logic._load_yaml_file(yaml_path)
+        platforms = core_logic.load_platforms_yaml(yaml_path)
         self.platforms_table.setSortingEnabled(False)
         self.platforms_table.setRowCount(0)
         
@@ -465,7 +468,7 @@ class PlatformsTab(QWidget):
         if not yaml_path or not os.path.exists(yaml_path):
             return {'categories': categories, 'emu_names': emu_names}
 
-        platforms = core_logic._load_yaml_file(yaml_path)
+        platforms = core_logic.load_platforms_yaml(yaml_path)
         for data in platforms.values():
             cats = data.get('platform_category', [])
             if isinstance(cats, list):
@@ -498,11 +501,10 @@ class PlatformsTab(QWidget):
         yaml_path = self.main_app_ref.settings_tab.system_softlist_yaml_file_le.text()
         
         # --- CORRECTED LOGIC FOR MANUAL UPDATE ---
-        # 1. Load the entire existing YAML data
-        existing_data = core_logic._load_yaml_file(yaml_path)
-        
-        # 2. Get the specific platform entry we are editing, or a new empty one
-        platform_entry = existing_data.get(data['platform_key'], {})
+        # 1. Load only the platform entry we are editing, or start a new empty one
+        platform_entry = core_logic.read_yaml_platform(yaml_path, data['platform_key'])
+        if not isinstance(platform_entry, dict):
+            platform_entry = {}
         
         # 3. Update only the metadata fields from the dialog
         platform_entry['platform'] = {"name": data['platform_name_full']}
@@ -546,13 +548,9 @@ class PlatformsTab(QWidget):
         
         platform_entry['system'] = preserved_system_block
         
-        # 5. Put the modified platform entry back into the main data structure
-        existing_data[data['platform_key']] = platform_entry
-
-        # 6. Save the entire file
+        # 5. Write the modified platform entry back, leaving the other platforms in the file untouched
         try:
-            with open(yaml_path, "w", encoding="utf-8") as f:
-                yaml.dump(existing_data, f, default_flow_style=False, sort_keys=False)
+            core_logic.save_yaml_platforms(yaml_path, {data['platform_key']: platform_entry})
             self.log(f"[SUCCESS] Manually updated '{data['platform_key']}' in '{yaml_path}'.")
             self.load_platforms()
         except Exception as e:
@@ -569,51 +567,28 @@ class PlatformsTab(QWidget):
                  return
              xml_source_path = core_logic.APP_CONFIG.get('mess_xml_file')
         
-        source_xml_root = core_logic.get_parsed_mame_xml_root(xml_source_path)
-        if source_xml_root is None:
+        machine_catalog = core_logic.load_machine_catalog(xml_source_path)
+        if machine_catalog is None:
             self.log(f"<font color='red'>Could not parse source XML: {xml_source_path}</font>")
             return
-            
-        systems_pool = set()
-        # Logic to build the initial pool based on user input
-        if data['systems'] or data['filter_machine_name_fuzzy'] or data['include_systems']:
-            systems_pool.update(data['systems'])
-            if data['filter_machine_name_fuzzy']:
-                systems_pool.update(core_logic.get_all_mame_systems_by_prefix_from_root(data['filter_machine_name_fuzzy'], source_xml_root))
-            if data['include_systems']:
-                systems_pool.update(data['include_systems'])
-        else:
-            systems_pool.update(core_logic.get_all_mame_systems_from_xml_file(xml_source_path))
-
-        # Apply machine filters from the dialog
-        if data['filter_machine_description']:
-            initial_count = len(systems_pool)
-            filtered_set = {
-                name for name in systems_pool 
-                if all(term.lower() in source_xml_root.find(f"machine[@name='{name}']/description").text.lower()
-                       for term in data['filter_machine_description'])
-            }
-            systems_pool = filtered_set
-            self.log(f"[INFO] After machine description filter: {initial_count} -> {len(systems_pool)} systems.")
-
-        if data['filter_machine_sourcefile']:
-            initial_count = len(systems_pool)
-            filtered_set = {
-                name for name in systems_pool
-                if data['filter_machine_sourcefile'].lower() in source_xml_root.find(f"machine[@name='{name}']").get("sourcefile", "").lower()
-            }
-            systems_pool = filtered_set
-            self.log(f"[INFO] After machine sourcefile filter: {initial_count} -> {len(systems_pool)} systems.")
 
-        systems_pool.difference_update(data['exclude_systems'])
-        systems_to_process = sorted(list(systems_pool))
+        systems_to_process = core_logic.select_machines(
+            machine_catalog,
+            systems=data['systems'],
+            name_patterns=data['filter_machine_name_fuzzy'],
+            description_terms=data['filter_machine_description'],
+            sourcefile=data['filter_machine_sourcefile'],
+            include_systems=data['include_systems'],
+            exclude_systems=data['exclude_systems'],
+            log=self.log
+        )
         
         kwargs = {
             'systems_to_process': systems_to_process,
             'search_term': data['filter_software_description'],
             'output_format': 'yaml',
             'output_file_path': self.main_app_ref.settings_tab.system_softlist_yaml_file_le.text(),
-            'source_xml_root': source_xml_root,
+            'machine_catalog': machine_catalog,
             'platform_key': data['platform_key'],
             'platform_name_full': data['platform_name_full'],
             'platform_categories': data['platform_categories'],
@@ -625,32 +600,36 @@ class PlatformsTab(QWidget):
             'show_systems_only': False, 'show_extra_info': False, 'sort_by': None,
             'exclude_softlist': [], 'include_softlist': [],
             'software_configs_to_add': {}, 'softlist_configs_to_add': {},
+            'jobs': self.main_app_ref.search_tab.get_jobs(),
         }
         self._launch_worker(core_logic.perform_mame_search_and_output, **kwargs)
 
     def run_full_search_for_platform(self, data):
         source_xml_path = core_logic.APP_CONFIG.get('mess_xml_file', 'mess.xml')
-        source_xml_root = core_logic.get_parsed_mame_xml_root(source_xml_path)
-        if source_xml_root is None:
+        machine_catalog = core_logic.load_machine_catalog(source_xml_path)
+        if machine_catalog is None:
             self.log(f"<font color='red'>Could not parse source XML: {source_xml_path}</font>")
             return
         
-        processed_systems_set = set(data.get('systems', []))
-        if data.get('fuzzy'):
-            processed_systems_set.update(core_logic.get_all_mame_systems_by_prefix_from_root(data['fuzzy'], source_xml_root))
-        if data.get('include_systems'):
-            processed_systems_set.update(data['include_systems'])
-        if data.get('exclude_systems'):
-            processed_systems_set.difference_update(data['exclude_systems'])
-            
-        systems_to_process = sorted(list(processed_systems_set))
+        if not (data.get('systems') or data.get('fuzzy') or data.get('include_systems')):
+            self.log(f"<font color='red'>Platform '{data['platform_key']}' does not name any systems to search.</font>")
+            return
+
+        systems_to_process = core_logic.select_machines(
+            machine_catalog,
+            systems=data.get('systems', []),
+            name_patterns=data.get('fuzzy'),
+            include_systems=data.get('include_systems'),
+            exclude_systems=data.get('exclude_systems'),
+            log=self.log
+        )
         
         kwargs = {
             'systems_to_process': systems_to_process,
             'search_term': data['search_term'],
             'output_format': 'yaml',
             'output_file_path': self.main_app_ref.settings_tab.system_softlist_yaml_file_le.text(),
-            'source_xml_root': source_xml_root,
+            'machine_catalog': machine_catalog,
             'platform_key': data['platform_key'],
             'platform_name_full': data['platform_name_full'],
             'platform_categories': data['platform_categories'],
@@ -659,6 +638,7 @@ class PlatformsTab(QWidget):
             'emu_name': data['emu_name'],
             'default_emu': data['default_emu'],
             'default_emu_cmd_params': data['default_emu_cmd_params'],
+            'jobs': self.main_app_ref.search_tab.get_jobs(),
         }
         self.log(f"[INFO] Performing full search and update for platform '{data['platform_key']}'...")
         self._launch_worker(core_logic.perform_mame_search_and_output, **kwargs)
@@ -707,18 +687,13 @@ class PlatformsTab(QWidget):
         
         if reply == QMessageBox.Yes:
             yaml_path = self.main_app_ref.settings_tab.system_softlist_yaml_file_le.text()
-            platforms_data = core_logic._load_yaml_file(yaml_path)
-
-            keys_to_delete = {self.platforms_table.item(r.row(), 0).text() for r in selected_rows}
+            keys_to_delete = sorted({self.platforms_table.item(r.row(), 0).text() for r in selected_rows})
             
             for key in keys_to_delete:
-                if key in platforms_data:
-                    del platforms_data[key]
-                    self.log(f"[INFO] Deleting platform '{key}' from YAML.")
+                self.log(f"[INFO] Deleting platform '{key}' from YAML.")
             
             try:
-                with open(yaml_path, "w", encoding="utf-8") as f:
-                    yaml.dump(platforms_data, f, default_flow_style=False, sort_keys=False)
+                core_logic.save_yaml_platforms(yaml_path, delete_keys=keys_to_delete)
                 self.log(f"[SUCCESS] '{yaml_path}' updated.")
             except Exception as e:
                 self.log(f"<font color='red'>[ERROR] Failed to save YAML after deletion: {e}</font>")
@@ -758,7 +733,7 @@ class SearchTab(QWidget):
         self.systems_te = QTextEdit()
         self.systems_te.setPlaceholderText("Optional: System shortnames. one per line (e.g., nes)")
         self.filter_machine_name_fuzzy_le = QLineEdit()
-        self.filter_machine_name_fuzzy_le.setPlaceholderText("System shortnames to search for (e.g., gnw_, jak_)")
+        self.filter_machine_name_fuzzy_le.setPlaceholderText("System name prefixes or globs (e.g., gnw_ jak_* ekara*)")
         self.filter_machine_description_le = QLineEdit()
         self.filter_machine_description_le.setPlaceholderText("Full machine description (e.g., Nintendo, JAKK)")
         self.filter_machine_sourcefile_le = QLineEdit()
@@ -768,6 +743,10 @@ class SearchTab(QWidget):
         self.limit_le = QLineEdit()
         self.limit_le.setValidator(QIntValidator(0, 99999))
         self.limit_le.setFixedWidth(50)
+        self.jobs_le = QLineEdit("1")
+        self.jobs_le.setValidator(QIntValidator(1, 64))
+        self.jobs_le.setFixedWidth(50)
+        self.jobs_le.setToolTip("Number of 'mame -listsoftware' commands to run in parallel.")
 
         criteria_layout.addRow("Systems (Positional):", self.systems_te)
         criteria_layout.addRow("Filter Machine Name (Fuzzy):", self.filter_machine_name_fuzzy_le)
@@ -775,6 +754,7 @@ class SearchTab(QWidget):
         criteria_layout.addRow("Filter Machine Source File:", self.filter_machine_sourcefile_le)
         criteria_layout.addRow("Filter Software Description:", self.filter_software_description_le)
         criteria_layout.addRow("Limit Systems Processed:", self.limit_le)
+        criteria_layout.addRow("Parallel Jobs:", self.jobs_le)
 
         # --- Populate Options ---
         self.table_options = TableOptionsWidget()
@@ -826,6 +806,11 @@ class SearchTab(QWidget):
         self.emu_options.setVisible(is_yaml)
         self.table_options.setVisible(not is_yaml)
 
+    def get_jobs(self):
+        """Returns the number of parallel 'mame -listsoftware' jobs entered in the UI (at least 1)."""
+        text = self.jobs_le.text().strip()
+        return max(1, int(text)) if text.isdigit() else 1
+
     def run_search(self):
         try:
             # --- 1. GATHER ARGS FROM UI ---
@@ -855,52 +840,22 @@ class SearchTab(QWidget):
                      return
                  xml_source_path = core_logic.APP_CONFIG.get('mess_xml_file')
 
-            source_xml_root = core_logic.get_parsed_mame_xml_root(xml_source_path)
-            if source_xml_root is None:
+            machine_catalog = core_logic.load_machine_catalog(xml_source_path)
+            if machine_catalog is None:
                 self.log(f"<font color='red'>Could not parse source XML: {xml_source_path}</font>")
                 return
             
-            # --- 3. BUILD AND FILTER THE SYSTEM POOL (copied from main()) ---
-            systems_pool = set()
-            user_provided_systems = bool(args.systems or args.filter_machine_name_fuzzy or args.include_systems)
-            if user_provided_systems:
-                if args.systems: systems_pool.update(args.systems)
-                if args.filter_machine_name_fuzzy: systems_pool.update(core_logic.get_all_mame_systems_by_prefix_from_root(args.filter_machine_name_fuzzy, source_xml_root))
-                if args.include_systems: systems_pool.update(args.include_systems)
-            else:
-                systems_pool.update(core_logic.get_all_mame_systems_from_xml_file(xml_source_path))
-
-            self.log(f"[INFO] Initial system pool size: {len(systems_pool)}")
-
-            # --- THIS IS THE CORRECTED FILTER LOGIC ---
-            if args.filter_machine_description:
-                initial_count = len(systems_pool)
-                filtered_set = set()
-                for machine_element in source_xml_root.findall("machine"):
-                    machine_name = machine_element.get("name")
-                    if machine_name in systems_pool:
-                        description = machine_element.findtext("description", "")
-                        if all(term.lower() in description.lower() for term in args.filter_machine_description):
-                            filtered_set.add(machine_name)
-                systems_pool = filtered_set
-                self.log(f"[INFO] After machine description filter: {initial_count} -> {len(systems_pool)} systems.")
-
-            if args.filter_machine_sourcefile:
-                initial_count = len(systems_pool)
-                filtered_set = set()
-                for machine_element in source_xml_root.findall("machine"):
-                    machine_name = machine_element.get("name")
-                    if machine_name in systems_pool:
-                        sourcefile = machine_element.get("sourcefile", "")
-                        if args.filter_machine_sourcefile.lower() in sourcefile.lower():
-                            filtered_set.add(machine_name)
-                systems_pool = filtered_set
-                self.log(f"[INFO] After machine sourcefile filter: {initial_count} -> {len(systems_pool)} systems.")
-            
-            if args.exclude_systems:
-                systems_pool.difference_update(args.exclude_systems)
-            
-            systems_to_process = sorted(list(systems_pool))
+            # --- 3. SELECT AND FILTER THE SYSTEMS (same engine as main()) ---
+            systems_to_process = core_logic.select_machines(
+                machine_catalog,
+                systems=args.systems,
+                name_patterns=args.filter_machine_name_fuzzy,
+                description_terms=args.filter_machine_description,
+                sourcefile=args.filter_machine_sourcefile,
+                include_systems=args.include_systems,
+                exclude_systems=args.exclude_systems,
+                log=self.log
+            )
             if args.limit is not None:
                 systems_to_process = systems_to_process[:args.limit]
             
@@ -926,7 +881,8 @@ class SearchTab(QWidget):
                 'show_systems_only': table_opts.show_systems_only_cb.isChecked(), 
                 'show_extra_info': table_opts.show_extra_info_cb.isChecked(),
                 'sort_by': table_opts.sort_by_combo.currentText() if table_opts.sort_by_combo.currentIndex() > 0 else None, 
-                'source_xml_root': source_xml_root
+                'machine_catalog': machine_catalog,
+                'jobs': self.get_jobs()
                 # Note: include/exclude softlist and other complex args can be added here if you add UI for them
             }
 
@@ -989,6 +945,12 @@ class RomCopyTab(QWidget):
         self.out_romset_dir_le_display.setReadOnly(True)
         form_layout.addRow("Destination ROMs Dir:", self.out_romset_dir_le_display)
 
+        self.jobs_le = QLineEdit("1")
+        self.jobs_le.setValidator(QIntValidator(1, 64))
+        self.jobs_le.setFixedWidth(50)
+        self.jobs_le.setToolTip("Number of ROMs to copy in parallel.")
+        form_layout.addRow("Parallel Jobs:", self.jobs_le)
+
         main_layout.addLayout(form_layout)
 
         self.copy_btn = QPushButton("Start ROM Copy Operation")
@@ -1009,9 +971,16 @@ class RomCopyTab(QWidget):
         self.softlist_rom_sources_dir_le_display.setText(self.main_app_ref.settings_tab.softlist_rom_sources_dir_le.text())
         self.out_romset_dir_le_display.setText(self.main_app_ref.settings_tab.out_romset_dir_le.text())
 
+    def get_jobs(self):
+        """Returns the number of parallel ROM copy jobs entered in the UI (at least 1)."""
+        text = self.jobs_le.text().strip()
+        return max(1, int(text)) if text.isdigit() else 1
+
     def start_rom_copy(self):
         from argparse import Namespace
-        args = Namespace(input_file=self.main_app_ref.settings_tab.system_softlist_yaml_file_le.text())
+        args = Namespace(input_file=self.main_app_ref.settings_tab.system_softlist_yaml_file_le.text(),
+                         platform_key=None, create_placeholder_zip=False, dry_run=False,
+                         jobs=self.get_jobs())
 
         self.log("[INFO] Starting ROM copy operation...")
         self.main_app_ref.start_long_operation()
@@ -1079,6 +1048,11 @@ class SettingsTab(QWidget):
         self.mess_ini_path_le = QLineEdit()
         self.browse_mess_ini_btn = QPushButton("...")
         create_path_widget(self.mess_ini_path_le, self.browse_mess_ini_btn, "MESS.ini Path (for split):", True, "INI Files (*.ini)")
+
+        # Optional: read softlists from MAME's hash/*.xml instead of running -listsoftware
+        self.mame_hash_dir_le = QLineEdit()
+        self.browse_mame_hash_dir_btn = QPushButton("...")
+        create_path_widget(self.mame_hash_dir_le, self.browse_mame_hash_dir_btn, "MAME hash Dir (optional):", False)
         # --- END REVISED UI ---
 
         main_layout.addLayout(form_layout)
@@ -1109,6 +1083,7 @@ class SettingsTab(QWidget):
         self.out_romset_dir_le.setText(core_logic.APP_CONFIG.get("out_romset_dir", ""))
         self.system_softlist_yaml_file_le.setText(core_logic.APP_CONFIG.get("system_softlist_yaml_file", "system_softlist.yml"))
         self.mess_ini_path_le.setText(core_logic.APP_CONFIG.get("mess_ini_path", ""))
+        self.mame_hash_dir_le.setText(core_logic.APP_CONFIG.get("mame_hash_dir", ""))
         self.log("[INFO] Settings tab populated from config.")
 
     def save_settings(self):
@@ -1133,6 +1108,7 @@ class SettingsTab(QWidget):
         core_logic.APP_CONFIG["out_romset_dir"] = self.out_romset_dir_le.text()
         core_logic.APP_CONFIG["system_softlist_yaml_file"] = self.system_softlist_yaml_file_le.text()
         core_logic.APP_CONFIG["mess_ini_path"] = self.mess_ini_path_le.text()
+        core_logic.APP_CONFIG["mame_hash_dir"] = self.mame_hash_dir_le.text()
         # No need to save mess_xml_file, as it's dynamic
         
         if core_logic.save_configuration():
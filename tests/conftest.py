@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import mess_curator  # noqa: E402
+
+
+@pytest.fixture
+def core(tmp_path, monkeypatch):
+    """The core module with its configuration, data directory and console settings confined to tmp_path."""
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(mess_curator, "DATA_DIR", data_dir)
+    monkeypatch.setattr(mess_curator, "ROM_INVENTORY_CACHE_FILE", data_dir / "rom_source_inventory.pickle")
+    monkeypatch.setattr(mess_curator, "ROM_VERIFY_CACHE_FILE", data_dir / "rom_verify_cache.pickle")
+    monkeypatch.setattr(mess_curator, "APP_CONFIG", dict(
+        mess_curator.APP_CONFIG,
+        mame_executable=str(tmp_path / "mame"),
+        softlist_rom_sources_dir=str(tmp_path / "roms"),
+        out_romset_dir=str(tmp_path / "out"),
+        system_softlist_yaml_file=str(tmp_path / "system_softlist.yml"),
+        mess_version="0.278",
+        mame_hash_dir="",
+    ))
+    monkeypatch.setattr(mess_curator, "DEBUG_MODE_ENABLED", False)
+    for key, value in (("console_level", mess_curator.LOG_LEVELS["item"]), ("progress", False), ("log_file", None)):
+        monkeypatch.setitem(mess_curator.LOG_SETTINGS, key, value)
+    mess_curator.use_softlist_records_source(None)
+    mess_curator._MAME_BUILD_FINGERPRINTS.clear()
+    yield mess_curator
+    mess_curator.log_flush()
+    mess_curator.use_softlist_records_source(None)
@@ -0,0 +1,184 @@
+import argparse
+import os
+import threading
+import zipfile
+
+import pytest
+
+SYSTEM_SOFTLIST_YAML = """\
+nes:
+  platform:
+    name: Nintendo NES
+  media_type: cart
+  system:
+  - nes:
+      software_lists:
+      - softlist_name: nes
+        software_id:
+        - smb
+        - zelda
+        - contra
+        - missing1
+  - famicom:
+      software_lists:
+      - softlist_name: nes
+        software_id:
+        - smb
+  - nes_standalone
+"""
+
+SOURCE_ROMS = {"nes": ["smb", "zelda", "contra"]}
+
+
+@pytest.fixture
+def romsets(core, tmp_path):
+    """A source ROM folder with a few zips and a platform YAML that references them and one missing title."""
+    for softlist_name, software_ids in SOURCE_ROMS.items():
+        (tmp_path / "roms" / softlist_name).mkdir(parents=True)
+        for swid in software_ids:
+            with zipfile.ZipFile(tmp_path / "roms" / softlist_name / f"{swid}.zip", "w") as zf:
+                zf.writestr(f"{swid}.nes", swid.encode() * 64)
+    (tmp_path / "system_softlist.yml").write_text(SYSTEM_SOFTLIST_YAML, encoding="utf-8")
+    return tmp_path
+
+
+def _copy_roms(core, **options):
+    args = dict(input_file=None, platform_key=None, create_placeholder_zip=False, dry_run=False, jobs=4,
+                sync=False, prune=False, checksum=False, link_mode="copy", placeholder_hardlink=False, refresh_inventory=False)
+    args.update(options)
+    core.perform_rom_copy_operation(argparse.Namespace(**args))
+
+
+def _output_files(out_dir):
+    return sorted(os.path.relpath(os.path.join(root, name), out_dir).replace(os.sep, "/")
+                  for root, _, names in os.walk(out_dir) for name in names if not name.startswith("."))
+
+
+def test_parallel_copy_creates_roms_and_placeholders(core, romsets):
+    _copy_roms(core, jobs=4)
+
+    out = romsets / "out"
+    assert _output_files(out) == [
+        "nes/famicom/nes/smb.zip",
+        "nes/nes/nes/contra.zip",
+        "nes/nes/nes/missing1.zip",
+        "nes/nes/nes/smb.zip",
+        "nes/nes/nes/zelda.zip",
+        "nes/nes_standalone/nes_standalone.zip",
+    ]
+    assert (out / "nes/nes/nes/smb.zip").read_bytes() == (romsets / "roms/nes/smb.zip").read_bytes()
+    assert (out / "nes/nes/nes/missing1.zip").read_bytes() == core.EMPTY_ZIP_BYTES
+    assert not [name for _, _, names in os.walk(out) for name in names if name.endswith(".tmp")]
+
+
+def test_parallel_copy_matches_a_serial_copy(core, romsets, tmp_path):
+    _copy_roms(core, jobs=1)
+    serial = {path: (romsets / "out" / path).read_bytes() for path in _output_files(romsets / "out")}
+    core.APP_CONFIG["out_romset_dir"] = str(tmp_path / "out_parallel")
+
+    _copy_roms(core, jobs=8)
+
+    parallel = {path: (tmp_path / "out_parallel" / path).read_bytes() for path in _output_files(tmp_path / "out_parallel")}
+    assert parallel == serial
+
+
+def test_sync_leaves_unchanged_outputs_alone(core, romsets, capsys):
+    _copy_roms(core, sync=True)
+    smb_out = romsets / "out/nes/nes/nes/smb.zip"
+    os.utime(smb_out, ns=(1, 1))
+    capsys.readouterr()
+
+    _copy_roms(core, sync=True)
+
+    output = capsys.readouterr().out
+    assert "Total Software ROMs Copied: 0" in output
+    assert "Total Files Up To Date (Skipped): 6" in output
+    assert smb_out.stat().st_mtime_ns == 1
+
+
+def test_sync_recopies_a_changed_source(core, romsets, capsys):
+    _copy_roms(core, sync=True)
+    source = romsets / "roms/nes/zelda.zip"
+    source.write_bytes(source.read_bytes() + b"\0")
+    capsys.readouterr()
+
+    _copy_roms(core, sync=True)
+
+    assert "Total Software ROMs Copied: 1" in capsys.readouterr().out
+    assert (romsets / "out/nes/nes/nes/zelda.zip").read_bytes() == source.read_bytes()
+
+
+def test_prune_removes_outputs_no_longer_in_the_yaml(core, romsets, capsys):
+    _copy_roms(core, sync=True)
+    yaml_path = romsets / "system_softlist.yml"
+    yaml_path.write_text(yaml_path.read_text(encoding="utf-8").replace("  - famicom:\n      software_lists:\n"
+                                                                      "      - softlist_name: nes\n        software_id:\n        - smb\n", ""),
+                         encoding="utf-8")
+    unrelated = romsets / "out/nes/notes.txt"
+    unrelated.write_text("kept", encoding="utf-8")
+    capsys.readouterr()
+
+    _copy_roms(core, prune=True)
+
+    assert "Total Stale Files Removed: 1" in capsys.readouterr().out
+    assert not (romsets / "out/nes/famicom").exists()
+    assert (romsets / "out/nes/nes/nes/smb.zip").exists()
+    assert unrelated.exists()
+
+
+def test_prune_dry_run_deletes_nothing(core, romsets):
+    _copy_roms(core, sync=True)
+    (romsets / "system_softlist.yml").write_text("nes:\n  system:\n  - nes_standalone\n", encoding="utf-8")
+
+    _copy_roms(core, prune=True, dry_run=True)
+
+    assert (romsets / "out/nes/nes/nes/zelda.zip").exists()
+    assert (romsets / "out/nes/famicom/nes/smb.zip").exists()
+
+
+def test_copying_over_hardlinked_outputs_leaves_the_sources_intact(core, romsets):
+    source = romsets / "roms/nes/smb.zip"
+    original = source.read_bytes()
+    _copy_roms(core, link_mode="hardlink", placeholder_hardlink=True)
+    assert (romsets / "out/nes/nes/nes/smb.zip").stat().st_ino == source.stat().st_ino
+
+    (romsets / "roms/nes/zelda.zip").unlink()
+    _copy_roms(core, link_mode="copy")
+
+    assert source.read_bytes() == original
+    assert (romsets / "out/nes/nes/nes/smb.zip").stat().st_ino != source.stat().st_ino
+    assert (romsets / "out/nes/nes/nes/zelda.zip").read_bytes() == core.EMPTY_ZIP_BYTES
+    assert (romsets / "out" / core.PLACEHOLDER_TEMPLATE_FILE).read_bytes() == core.EMPTY_ZIP_BYTES
+
+
+def test_parallel_tasks_writing_the_same_output_do_not_collide(core, romsets, capsys):
+    duplicates = "".join("        - smb\n        - missing1\n" for _ in range(16))
+    (romsets / "system_softlist.yml").write_text(
+        "nes:\n  system:\n  - nes:\n      software_lists:\n      - softlist_name: nes\n        software_id:\n" + duplicates,
+        encoding="utf-8")
+
+    _copy_roms(core, jobs=8)
+
+    captured = capsys.readouterr()
+    assert "[ERROR]" not in captured.out + captured.err
+    assert (romsets / "out/nes/nes/nes/smb.zip").read_bytes() == (romsets / "roms/nes/smb.zip").read_bytes()
+    assert (romsets / "out/nes/nes/nes/missing1.zip").read_bytes() == core.EMPTY_ZIP_BYTES
+    assert _output_files(romsets / "out") == ["nes/nes/nes/missing1.zip", "nes/nes/nes/smb.zip"]
+    assert not [name for _, _, names in os.walk(romsets / "out") for name in names if name.endswith(".tmp")]
+
+
+def test_output_temp_names_differ_between_concurrent_threads(core):
+    names = []
+    barrier = threading.Barrier(4)
+
+    def name_temp_file():
+        names.append(core._output_temp_path("out/smb.zip"))
+        barrier.wait()
+
+    threads = [threading.Thread(target=name_temp_file) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(names)) == 4 and all(name.startswith("out/smb.zip.") for name in names)
@@ -0,0 +1,165 @@
+import os
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="the fake mame executable is a script with a shebang line")
+
+MACHINES_XML = """\
+<?xml version="1.0"?>
+<mame build="0.278">
+  <machine name="nes" sourcefile="nes.cpp">
+    <description>Nintendo Entertainment System</description><year>1985</year><manufacturer>Nintendo</manufacturer>
+    <driver status="good" emulation="good"/>
+    <softwarelist name="nes" status="original"/>
+  </machine>
+  <machine name="famicom" sourcefile="nes.cpp">
+    <description>Famicom</description><year>1983</year><manufacturer>Nintendo</manufacturer>
+    <driver status="good" emulation="good"/>
+    <softwarelist name="nes" status="compatible"/>
+    <softwarelist name="famicom_cass" status="original"/>
+  </machine>
+  <machine name="coco" sourcefile="coco12.cpp">
+    <description>Color Computer</description><year>1980</year><manufacturer>Tandy</manufacturer>
+    <driver status="good" emulation="good"/>
+    <softwarelist name="coco_cart" status="original"/>
+  </machine>
+  <machine name="gnw_ball" sourcefile="hh_sm510.cpp">
+    <description>Ball</description><year>1980</year><manufacturer>Nintendo</manufacturer>
+    <driver status="good" emulation="good"/>
+  </machine>
+</mame>
+"""
+
+SOFTLISTS = {
+    "nes": [("smb", "Super Mario Bros."), ("zelda", "The Legend of Zelda"), ("contra", "Contra")],
+    "famicom_cass": [("fbasic", "Family BASIC")],
+    "coco_cart": [("mega", "Mega-Bug"), ("zaxxon", "Zaxxon")],
+}
+
+FAKE_MAME = """\
+#!{python}
+# {build}
+import os, sys
+import xml.etree.ElementTree as ET
+here = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(here, "mame_calls.log"), "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+args = sys.argv[1:]
+if args == ["-version"]:
+    print("{build}")
+elif args[:1] == ["-listsoftware"]:
+    machine = ET.parse(os.path.join(here, "machines.xml")).getroot().find("machine[@name='%s']" % args[1])
+    names = [element.get("name") for element in machine.findall("softwarelist")]
+    if not names:
+        print("No software lists found for this system")
+        sys.exit(0)
+    print('<?xml version="1.0"?>\\n<softwarelists>')
+    for name in names:
+        with open(os.path.join(here, "hash", name + ".xml")) as f:
+            print(f.read().split("\\n", 1)[1])
+    print("</softwarelists>")
+else:
+    sys.exit(1)
+"""
+
+
+def _softlist_xml(name, titles):
+    software = "".join(f'  <software name="{swid}"><description>{desc}</description><publisher>Pub</publisher></software>\n'
+                       for swid, desc in titles)
+    return f'<?xml version="1.0"?>\n<softwarelist name="{name}">\n{software}</softwarelist>\n'
+
+
+def _write_fake_mame(path, build):
+    path.write_text(FAKE_MAME.format(python=sys.executable, build=build), encoding="utf-8")
+    path.chmod(0o755)
+
+
+@pytest.fixture
+def fake_mame(core, tmp_path):
+    (tmp_path / "hash").mkdir()
+    for name, titles in SOFTLISTS.items():
+        (tmp_path / "hash" / f"{name}.xml").write_text(_softlist_xml(name, titles), encoding="utf-8")
+    (tmp_path / "machines.xml").write_text(MACHINES_XML, encoding="utf-8")
+    _write_fake_mame(tmp_path / "mame", "0.278 (mame0278)")
+    return tmp_path
+
+
+def _mame_calls(tmp_path, command):
+    log_path = tmp_path / "mame_calls.log"
+    if not log_path.exists():
+        return 0
+    return sum(1 for line in log_path.read_text().splitlines() if line.startswith(command))
+
+
+def test_listsoftware_output_is_served_from_the_disk_cache(core, fake_mame):
+    fingerprint = core.get_mame_build_fingerprint()
+
+    first = core.get_listsoftware_output("nes", fingerprint)
+    second = core.get_listsoftware_output("nes", fingerprint)
+
+    assert first == second and "smb" in first
+    assert _mame_calls(fake_mame, "-listsoftware") == 1
+
+
+def test_refresh_cache_runs_mame_again(core, fake_mame):
+    fingerprint = core.get_mame_build_fingerprint()
+    core.get_listsoftware_output("nes", fingerprint)
+
+    core.get_listsoftware_output("nes", fingerprint, refresh_cache=True)
+
+    assert _mame_calls(fake_mame, "-listsoftware") == 2
+
+
+def test_a_new_mame_build_does_not_reuse_the_cache(core, fake_mame):
+    old_fingerprint = core.get_mame_build_fingerprint()
+    core.get_listsoftware_output("nes", old_fingerprint)
+
+    _write_fake_mame(fake_mame / "mame", "0.279 (mame0279-upgraded)")
+    os.utime(fake_mame / "mame", ns=(1, 1))
+    new_fingerprint = core.get_mame_build_fingerprint()
+    core.get_listsoftware_output("nes", new_fingerprint)
+
+    assert new_fingerprint != old_fingerprint
+    assert _mame_calls(fake_mame, "-listsoftware") == 2
+
+
+def test_failed_runs_are_not_cached(core, fake_mame):
+    fingerprint = core.get_mame_build_fingerprint()
+
+    assert core.get_listsoftware_output("gnw_ball", fingerprint) is None
+    assert core.get_listsoftware_output("gnw_ball", fingerprint) is None
+    assert _mame_calls(fake_mame, "-listsoftware") == 2
+
+
+def _search(core, fake_mame, jobs, softlist_source="mame"):
+    catalog = core.load_machine_catalog(str(fake_mame / "machines.xml"))
+    yaml_data = {}
+    core.perform_mame_search_and_output(
+        ["coco", "famicom", "gnw_ball", "nes"], "", "yaml", "test", "Test", None, "cart",
+        False, None, None, None, None, machine_catalog=catalog, softlist_source=softlist_source, jobs=jobs, yaml_data=yaml_data)
+    return yaml_data
+
+
+def test_parallel_search_matches_a_serial_search(core, fake_mame):
+    serial = _search(core, fake_mame, jobs=1)
+    core.use_softlist_records_source(None)
+    parallel = _search(core, fake_mame, jobs=3)
+
+    assert parallel == serial
+    systems = {next(iter(entry)) if isinstance(entry, dict) else entry: entry for entry in serial["test"]["system"]}
+    assert systems["gnw_ball"] == "gnw_ball"
+    famicom_lists = {item["softlist_name"]: item["software_id"] for item in systems["famicom"]["famicom"]["software_lists"]}
+    assert famicom_lists == {"famicom_cass": ["fbasic"], "nes": ["contra", "smb", "zelda"]}
+
+
+def test_hash_directory_search_matches_listsoftware(core, fake_mame):
+    from_mame = _search(core, fake_mame, jobs=1)
+    mame_runs = _mame_calls(fake_mame, "-listsoftware")
+    core.use_softlist_records_source(None)
+    core.APP_CONFIG["mame_hash_dir"] = str(fake_mame / "hash")
+
+    from_hash = _search(core, fake_mame, jobs=1, softlist_source="hash")
+
+    assert from_hash == from_mame
+    assert _mame_calls(fake_mame, "-listsoftware") == mame_runs
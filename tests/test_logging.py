@@ -0,0 +1,106 @@
+import argparse
+import json
+import zipfile
+
+import pytest
+
+
+@pytest.fixture
+def log_path(core, tmp_path):
+    path = tmp_path / "curator.log"
+    yield path
+    core.close_log_file()
+
+
+def _log_records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_quiet_shows_only_warnings_errors_and_summaries(core, capsys):
+    core.configure_logging(quiet=True)
+
+    core.log_message("item", "[✓] Copied ROM: smb.zip")
+    core.log_message("info", "[INFO] Processing platform")
+    core.log_message("warning", "[WARNING] Skipping entry")
+    core.log_message("summary", "===== Missing ROMs Summary =====")
+    core.log_message("error", "[ERROR] Cannot copy")
+    core.log_flush()
+
+    assert capsys.readouterr().out.splitlines() == ["[WARNING] Skipping entry", "===== Missing ROMs Summary =====", "[ERROR] Cannot copy"]
+
+
+def test_item_lines_are_buffered_and_flushed_in_order(core, capsys):
+    core.configure_logging()
+
+    core.log_message("item", "first %s", "item")
+    core.log_message("item", "second item")
+    assert capsys.readouterr().out == ""
+
+    core.log_message("info", "[INFO] after the items")
+    assert capsys.readouterr().out.splitlines() == ["first item", "second item", "[INFO] after the items"]
+
+
+def test_progress_hides_per_item_lines(core, capsys):
+    core.configure_logging(progress=True)
+
+    core.progress_start("Copying ROMs", 2)
+    core.log_message("item", "[✓] Copied ROM: smb.zip")
+    core.progress_advance(2)
+    core.progress_finish()
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err.strip().endswith("[PROGRESS] Copying ROMs: 2/2")
+
+
+def test_log_file_records_messages_hidden_from_the_console(core, capsys, log_path):
+    core.configure_logging(quiet=True, log_file=str(log_path))
+
+    core.log_message("item", "[✓] Copied ROM: %s", "smb.zip")
+    core.log_message("info", "\n[INFO] Processing platform")
+    core.log_message("debug", "not enabled")
+    core.close_log_file()
+
+    assert capsys.readouterr().out == ""
+    records = _log_records(log_path)
+    assert [(record["level"], record["message"]) for record in records] == [
+        ("item", "[✓] Copied ROM: smb.zip"), ("info", "[INFO] Processing platform")]
+    assert all(isinstance(record["time"], float) for record in records)
+
+
+def test_unopenable_log_file_is_reported_and_ignored(core, capsys, tmp_path):
+    core.configure_logging(log_file=str(tmp_path / "missing_dir" / "curator.log"))
+
+    assert core.LOG_SETTINGS["log_file"] is None
+    assert "[WARNING] Cannot open log file" in capsys.readouterr().out
+
+
+def test_disabled_messages_are_not_formatted(core):
+    core.configure_logging(quiet=True)
+
+    class Unformattable:
+        def __str__(self):
+            raise AssertionError("formatted a message that is not shown")
+
+    core.log_message("item", "%s", Unformattable())
+    assert not core.log_enabled("item")
+    assert core.log_enabled("warning")
+
+
+def test_copy_roms_under_quiet_still_prints_the_missing_roms_summary(core, tmp_path, capsys, log_path):
+    (tmp_path / "roms" / "nes").mkdir(parents=True)
+    with zipfile.ZipFile(tmp_path / "roms" / "nes" / "smb.zip", "w") as zf:
+        zf.writestr("smb.nes", b"smb")
+    yaml_path = tmp_path / "system_softlist.yml"
+    yaml_path.write_text("nes:\n  system:\n  - nes:\n      software_lists:\n      - softlist_name: nes\n"
+                         "        software_id:\n        - smb\n        - missing1\n", encoding="utf-8")
+    core.configure_logging(quiet=True, log_file=str(log_path))
+
+    core.perform_rom_copy_operation(argparse.Namespace(input_file=str(yaml_path), jobs=2))
+    core.close_log_file()
+
+    output = capsys.readouterr().out
+    assert "Missing ROMs Summary" in output and "missing1" in output
+    assert "Copied ROM" not in output
+    messages = [record["message"] for record in _log_records(log_path)]
+    assert any(message.startswith("[✓] Copied ROM: smb.zip") for message in messages)
@@ -0,0 +1,101 @@
+import yaml
+
+
+BASE_TEXT = """\
+# Curated platforms
+nes:
+  platform:
+    name: Nintendo NES
+  media_type: cart
+  system:
+  - nes
+
+gnw:
+  platform:
+    name: Game & Watch
+  media_type: handheld
+  system:
+  - gnw_ball
+"""
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def test_replacing_a_platform_keeps_the_rest_of_the_file(core, tmp_path):
+    path = tmp_path / "system_softlist.yml"
+    path.write_text(BASE_TEXT, encoding="utf-8")
+
+    entry = {"platform": {"name": "Nintendo NES"}, "media_type": "cart", "system": ["nes", "famicom"]}
+    texts = core.save_yaml_platforms(str(path), {"nes": entry})
+
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith("# Curated platforms\n")
+    assert text.endswith(BASE_TEXT[BASE_TEXT.index("gnw:"):])
+    assert texts["nes"] == core._yaml_dump({"nes": entry})
+    assert _load(path)["nes"] == entry
+    assert list(_load(path)) == ["nes", "gnw"]
+
+
+def test_new_platforms_are_appended_and_deleted_ones_removed(core, tmp_path):
+    path = tmp_path / "system_softlist.yml"
+    path.write_text(BASE_TEXT, encoding="utf-8")
+
+    core.save_yaml_platforms(str(path), {"coco": {"media_type": "cart", "system": ["coco"]}}, delete_keys=["gnw"])
+
+    data = _load(path)
+    assert list(data) == ["nes", "coco"]
+    assert data["coco"]["system"] == ["coco"]
+
+
+def test_spliced_output_matches_a_full_dump(core, tmp_path):
+    path = tmp_path / "system_softlist.yml"
+    platforms = {
+        "a": {"platform": {"name": "A"}, "system": ["x"]},
+        "b": {"platform": {"name": "B"}, "system": [{"y": {"software_lists": [{"softlist_name": "nes", "software_id": ["smb"]}]}}]},
+    }
+    path.write_text(core._yaml_dump(platforms), encoding="utf-8")
+
+    platforms["a"] = {"platform": {"name": "A2"}, "system": ["x", "z"]}
+    core.save_yaml_platforms(str(path), {"a": platforms["a"]})
+
+    assert path.read_text(encoding="utf-8") == core._yaml_dump(platforms)
+
+
+def test_shared_objects_do_not_produce_duplicate_anchors(core, tmp_path):
+    path = tmp_path / "system_softlist.yml"
+    path.write_text(BASE_TEXT, encoding="utf-8")
+    shared_config = {"nes": {"_default_config": "-cart"}}
+
+    core.save_yaml_platforms(str(path), {
+        "p1": {"system": [{"nes": {"software_configs": shared_config}}]},
+        "p2": {"system": [{"famicom": {"software_configs": shared_config}}]},
+    })
+
+    text = path.read_text(encoding="utf-8")
+    assert "&id" not in text
+    data = _load(path)
+    assert data["p1"]["system"][0]["nes"]["software_configs"] == shared_config
+    assert data["p2"]["system"][0]["famicom"]["software_configs"] == shared_config
+
+
+def test_files_that_cannot_be_spliced_are_rewritten_in_full(core, tmp_path):
+    path = tmp_path / "system_softlist.yml"
+    path.write_text("nes: &shared {media_type: cart, system: [nes]}\nfamicom: *shared\n", encoding="utf-8")
+    assert core._split_yaml_top_level_blocks(path.read_text(encoding="utf-8")) is None
+
+    core.save_yaml_platforms(str(path), {"coco": {"system": ["coco"]}})
+
+    data = _load(path)
+    assert data["famicom"] == {"media_type": "cart", "system": ["nes"]}
+    assert data["coco"] == {"system": ["coco"]}
+
+
+def test_read_yaml_platform_returns_one_entry(core, tmp_path):
+    path = tmp_path / "system_softlist.yml"
+    path.write_text(BASE_TEXT, encoding="utf-8")
+
+    assert core.read_yaml_platform(str(path), "gnw")["system"] == ["gnw_ball"]
+    assert core.read_yaml_platform(str(path), "missing") is None